@@ -0,0 +1,34 @@
+"""add grades lesson unique index
+
+Revision ID: a3e1c9d27b40
+Revises: c13986acf7e3
+Create Date: 2025-06-03 19:12:31.904127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3e1c9d27b40'
+down_revision: Union[str, None] = 'c13986acf7e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('grades', sa.Column('updated_at', sa.DateTime(), nullable=True))
+    op.create_index(
+        'uq_grades_schedule_student_lesson',
+        'grades',
+        ['schedule_id', 'student_id'],
+        unique=True,
+        postgresql_where=sa.text('homework_id IS NULL')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_grades_schedule_student_lesson', table_name='grades')
+    op.drop_column('grades', 'updated_at')
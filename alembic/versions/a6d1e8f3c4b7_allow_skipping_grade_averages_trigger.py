@@ -0,0 +1,53 @@
+"""allow skipping grade averages trigger for bulk writes
+
+Revision ID: a6d1e8f3c4b7
+Revises: f5c9d3b7a2e1
+Create Date: 2025-06-18 11:05:27.604913
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6d1e8f3c4b7'
+down_revision: Union[str, None] = 'f5c9d3b7a2e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GRADES_MAINTAIN_AVERAGES = """
+CREATE OR REPLACE FUNCTION grades_maintain_averages() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    {skip}IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM grade_averages_apply(
+            OLD.id, OLD.student_id, OLD.subject_id, OLD.schedule_id,
+            OLD.score, OLD.weight, OLD.created_at, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM grade_averages_apply(
+            NEW.id, NEW.student_id, NEW.subject_id, NEW.schedule_id,
+            NEW.score, NEW.weight, NEW.created_at, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+# Массовая запись (импорт) отключает ведение агрегатов до конца транзакции
+# и пересобирает grade_averages затронутых периодов сама
+SKIP_CHECK = """IF current_setting('app.skip_grade_averages', true) = 'on' THEN
+        RETURN NULL;
+    END IF;
+    """
+
+
+def upgrade() -> None:
+    op.execute(GRADES_MAINTAIN_AVERAGES.format(skip=SKIP_CHECK))
+
+
+def downgrade() -> None:
+    op.execute(GRADES_MAINTAIN_AVERAGES.format(skip=""))
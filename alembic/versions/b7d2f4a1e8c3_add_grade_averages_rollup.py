@@ -0,0 +1,184 @@
+"""add grade averages rollup
+
+Revision ID: b7d2f4a1e8c3
+Revises: a3e1c9d27b40
+Create Date: 2025-06-05 20:41:17.550218
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d2f4a1e8c3'
+down_revision: Union[str, None] = 'a3e1c9d27b40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+GRADE_AVERAGES_APPLY = """
+CREATE OR REPLACE FUNCTION grade_averages_apply(
+    p_grade_id integer,
+    p_student_id integer,
+    p_subject_id integer,
+    p_schedule_id integer,
+    p_score integer,
+    p_weight integer,
+    p_graded_at timestamp,
+    p_sign integer
+) RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    v_period_id integer;
+    v_last_grade_id integer;
+BEGIN
+    SELECT w.period_id INTO v_period_id
+    FROM schedule s
+    JOIN academic_weeks w ON w.id = s.week_id
+    WHERE s.id = p_schedule_id;
+
+    IF v_period_id IS NULL THEN
+        RETURN;
+    END IF;
+
+    INSERT INTO grade_averages AS ga (
+        student_id, subject_id, period_id,
+        grades_count, score_sum, weighted_sum, weight_sum, updated_at
+    )
+    VALUES (
+        p_student_id, p_subject_id, v_period_id,
+        p_sign, p_sign * p_score, p_sign * p_score * p_weight, p_sign * p_weight, now()
+    )
+    ON CONFLICT (student_id, subject_id, period_id) DO UPDATE SET
+        grades_count = ga.grades_count + EXCLUDED.grades_count,
+        score_sum = ga.score_sum + EXCLUDED.score_sum,
+        weighted_sum = ga.weighted_sum + EXCLUDED.weighted_sum,
+        weight_sum = ga.weight_sum + EXCLUDED.weight_sum,
+        updated_at = now()
+    RETURNING last_grade_id INTO v_last_grade_id;
+
+    IF p_sign > 0 THEN
+        UPDATE grade_averages
+        SET last_grade_id = p_grade_id, last_score = p_score, last_graded_at = p_graded_at
+        WHERE student_id = p_student_id AND subject_id = p_subject_id AND period_id = v_period_id
+          AND (last_graded_at IS NULL OR (p_graded_at, p_grade_id) >= (last_graded_at, last_grade_id));
+    ELSE
+        DELETE FROM grade_averages
+        WHERE student_id = p_student_id AND subject_id = p_subject_id AND period_id = v_period_id
+          AND grades_count <= 0;
+
+        IF v_last_grade_id = p_grade_id THEN
+            UPDATE grade_averages ga
+            SET (last_grade_id, last_score, last_graded_at) = (
+                SELECT g.id, g.score, g.created_at
+                FROM grades g
+                JOIN schedule s ON s.id = g.schedule_id
+                JOIN academic_weeks w ON w.id = s.week_id
+                WHERE g.student_id = p_student_id AND g.subject_id = p_subject_id
+                  AND w.period_id = v_period_id
+                ORDER BY g.created_at DESC, g.id DESC
+                LIMIT 1
+            )
+            WHERE ga.student_id = p_student_id AND ga.subject_id = p_subject_id AND ga.period_id = v_period_id;
+        END IF;
+    END IF;
+END;
+$$;
+"""
+
+GRADES_MAINTAIN_AVERAGES = """
+CREATE OR REPLACE FUNCTION grades_maintain_averages() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        PERFORM grade_averages_apply(
+            OLD.id, OLD.student_id, OLD.subject_id, OLD.schedule_id,
+            OLD.score, OLD.weight, OLD.created_at, -1
+        );
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        PERFORM grade_averages_apply(
+            NEW.id, NEW.student_id, NEW.subject_id, NEW.schedule_id,
+            NEW.score, NEW.weight, NEW.created_at, 1
+        );
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+GRADE_AVERAGES_FILL = """
+INSERT INTO grade_averages (
+    student_id, subject_id, period_id,
+    grades_count, score_sum, weighted_sum, weight_sum,
+    last_grade_id, last_score, last_graded_at, updated_at
+)
+SELECT
+    g.student_id, g.subject_id, w.period_id,
+    count(*), sum(g.score), sum(g.score * g.weight), sum(g.weight),
+    (array_agg(g.id ORDER BY g.created_at DESC, g.id DESC))[1],
+    (array_agg(g.score ORDER BY g.created_at DESC, g.id DESC))[1],
+    max(g.created_at),
+    now()
+FROM grades g
+JOIN schedule s ON s.id = g.schedule_id
+JOIN academic_weeks w ON w.id = s.week_id
+GROUP BY g.student_id, g.subject_id, w.period_id
+"""
+
+
+def upgrade() -> None:
+    op.add_column('grades', sa.Column('weight', sa.Integer(), server_default='1', nullable=False))
+    op.create_index('ix_grades_student_subject_created', 'grades', ['student_id', 'subject_id', 'created_at'], unique=False)
+    op.create_table('grade_averages',
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('subject_id', sa.Integer(), nullable=False),
+    sa.Column('period_id', sa.Integer(), nullable=False),
+    sa.Column('grades_count', sa.Integer(), nullable=False),
+    sa.Column('score_sum', sa.Integer(), nullable=False),
+    sa.Column('weighted_sum', sa.Integer(), nullable=False),
+    sa.Column('weight_sum', sa.Integer(), nullable=False),
+    sa.Column('average', sa.Numeric(precision=4, scale=2), sa.Computed('round(weighted_sum::numeric / NULLIF(weight_sum, 0), 2)', ), nullable=True),
+    sa.Column('last_grade_id', sa.Integer(), nullable=True),
+    sa.Column('last_score', sa.Integer(), nullable=True),
+    sa.Column('last_graded_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['period_id'], ['academic_periods.id'], ),
+    sa.ForeignKeyConstraint(['student_id'], ['students.user_id'], ),
+    sa.ForeignKeyConstraint(['subject_id'], ['subjects.id'], ),
+    sa.PrimaryKeyConstraint('student_id', 'subject_id', 'period_id')
+    )
+    op.create_index('ix_grade_averages_period_subject', 'grade_averages', ['period_id', 'subject_id'], unique=False)
+
+    op.execute(GRADE_AVERAGES_APPLY)
+    op.execute(GRADES_MAINTAIN_AVERAGES)
+    op.execute("""
+        CREATE TRIGGER grades_maintain_averages_ins_del
+        AFTER INSERT OR DELETE ON grades
+        FOR EACH ROW EXECUTE FUNCTION grades_maintain_averages()
+    """)
+    op.execute("""
+        CREATE TRIGGER grades_maintain_averages_upd
+        AFTER UPDATE OF score, weight, student_id, subject_id, schedule_id ON grades
+        FOR EACH ROW
+        WHEN (
+            OLD.score IS DISTINCT FROM NEW.score
+            OR OLD.weight IS DISTINCT FROM NEW.weight
+            OR OLD.student_id IS DISTINCT FROM NEW.student_id
+            OR OLD.subject_id IS DISTINCT FROM NEW.subject_id
+            OR OLD.schedule_id IS DISTINCT FROM NEW.schedule_id
+        )
+        EXECUTE FUNCTION grades_maintain_averages()
+    """)
+    op.execute(GRADE_AVERAGES_FILL)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS grades_maintain_averages_upd ON grades")
+    op.execute("DROP TRIGGER IF EXISTS grades_maintain_averages_ins_del ON grades")
+    op.execute("DROP FUNCTION IF EXISTS grades_maintain_averages()")
+    op.execute("DROP FUNCTION IF EXISTS grade_averages_apply(integer, integer, integer, integer, integer, integer, timestamp, integer)")
+    op.drop_index('ix_grade_averages_period_subject', table_name='grade_averages')
+    op.drop_table('grade_averages')
+    op.drop_index('ix_grades_student_subject_created', table_name='grades')
+    op.drop_column('grades', 'weight')
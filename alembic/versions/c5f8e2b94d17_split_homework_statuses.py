@@ -0,0 +1,113 @@
+"""split homework into assignment and statuses
+
+Revision ID: c5f8e2b94d17
+Revises: b7d2f4a1e8c3
+Create Date: 2025-06-08 18:22:09.341876
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5f8e2b94d17'
+down_revision: Union[str, None] = 'b7d2f4a1e8c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Одинаковые задания урока, размноженные по ученикам, схлопываются в одно:
+# остаётся строка с минимальным id, остальные становятся статусами.
+HOMEWORK_CANONICAL = """
+CREATE TEMPORARY TABLE homework_canonical ON COMMIT DROP AS
+SELECT
+    id,
+    student_id,
+    is_done,
+    due_date,
+    min(id) OVER (
+        PARTITION BY schedule_id, teacher_id, subject_id, description, due_date, file_id
+    ) AS canonical_id
+FROM homework
+"""
+
+
+def upgrade() -> None:
+    op.create_table('homework_statuses',
+    sa.Column('homework_id', sa.Integer(), nullable=False),
+    sa.Column('student_id', sa.Integer(), nullable=False),
+    sa.Column('due_date', sa.DateTime(), nullable=True),
+    sa.Column('is_done', sa.Boolean(), server_default='false', nullable=False),
+    sa.Column('done_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['homework_id'], ['homework.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['student_id'], ['students.user_id'], ),
+    sa.PrimaryKeyConstraint('homework_id', 'student_id')
+    )
+    op.create_index('ix_homework_statuses_student_due', 'homework_statuses', ['student_id', 'due_date'], unique=False)
+
+    op.add_column('homework', sa.Column('class_id', sa.Integer(), nullable=True))
+    op.execute("""
+        UPDATE homework h SET class_id = s.class_id
+        FROM schedule s
+        WHERE s.id = h.schedule_id
+    """)
+
+    op.execute(HOMEWORK_CANONICAL)
+    op.execute("""
+        INSERT INTO homework_statuses (homework_id, student_id, due_date, is_done)
+        SELECT canonical_id, student_id, due_date, coalesce(bool_or(is_done), false)
+        FROM homework_canonical
+        GROUP BY canonical_id, student_id, due_date
+    """)
+    op.execute("""
+        UPDATE grades g SET homework_id = c.canonical_id
+        FROM homework_canonical c
+        WHERE g.homework_id = c.id AND c.id <> c.canonical_id
+    """)
+    op.execute("""
+        DELETE FROM homework h
+        USING homework_canonical c
+        WHERE h.id = c.id AND c.id <> c.canonical_id
+    """)
+
+    op.alter_column('homework', 'class_id', nullable=False)
+    op.create_foreign_key('homework_class_id_fkey', 'homework', 'classes', ['class_id'], ['id'])
+    op.drop_column('homework', 'is_done')
+    op.drop_column('homework', 'student_id')
+
+
+def downgrade() -> None:
+    # Задание снова размножается по ученикам: первая строка статуса остаётся
+    # за исходным заданием, для остальных создаются копии.
+    op.add_column('homework', sa.Column('student_id', sa.Integer(), nullable=True))
+    op.add_column('homework', sa.Column('is_done', sa.Boolean(), nullable=True))
+    op.execute("""
+        INSERT INTO homework (schedule_id, class_id, teacher_id, student_id, subject_id, description,
+                              assignment_at, due_date, is_done, created_at, file_id)
+        SELECT h.schedule_id, h.class_id, h.teacher_id, st.student_id, h.subject_id, h.description,
+               h.assignment_at, h.due_date, st.is_done, h.created_at, h.file_id
+        FROM homework h
+        JOIN homework_statuses st ON st.homework_id = h.id
+        WHERE st.student_id <> (
+            SELECT min(first.student_id) FROM homework_statuses first WHERE first.homework_id = h.id
+        )
+    """)
+    op.execute("""
+        UPDATE homework h SET student_id = st.student_id, is_done = st.is_done
+        FROM homework_statuses st
+        WHERE st.homework_id = h.id
+          AND h.student_id IS NULL
+          AND st.student_id = (
+              SELECT min(first.student_id) FROM homework_statuses first WHERE first.homework_id = h.id
+          )
+    """)
+    op.execute("DELETE FROM homework WHERE student_id IS NULL")
+    op.alter_column('homework', 'student_id', nullable=False)
+    op.create_foreign_key('homework_student_id_fkey', 'homework', 'students', ['student_id'], ['user_id'])
+
+    op.drop_constraint('homework_class_id_fkey', 'homework', type_='foreignkey')
+    op.drop_column('homework', 'class_id')
+    op.drop_index('ix_homework_statuses_student_due', table_name='homework_statuses')
+    op.drop_table('homework_statuses')
@@ -0,0 +1,197 @@
+"""partition schedule and grades by academic year
+
+Revision ID: e4b8a2c6f1d9
+Revises: d3a7c91e5b20
+Create Date: 2025-06-16 10:12:48.204517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b8a2c6f1d9'
+down_revision: Union[str, None] = 'd3a7c91e5b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SCHEDULE_COLUMNS = (
+    "id, week_id, lesson_time_id, class_id, teacher_id, subject_id, created_at, day_of_week, "
+    "location, description, is_replacement, is_cancelled, original_teacher_id"
+)
+GRADES_COLUMNS = (
+    "id, schedule_id, student_id, subject_id, teacher_id, homework_id, comment, score, weight, "
+    "created_at, updated_at"
+)
+
+CREATE_GRADES_TRIGGERS = (
+    """
+    CREATE TRIGGER grades_maintain_averages_ins_del
+    AFTER INSERT OR DELETE ON grades
+    FOR EACH ROW EXECUTE FUNCTION grades_maintain_averages()
+    """,
+    """
+    CREATE TRIGGER grades_maintain_averages_upd
+    AFTER UPDATE OF score, weight, student_id, subject_id, schedule_id ON grades
+    FOR EACH ROW
+    WHEN (
+        OLD.score IS DISTINCT FROM NEW.score
+        OR OLD.weight IS DISTINCT FROM NEW.weight
+        OR OLD.student_id IS DISTINCT FROM NEW.student_id
+        OR OLD.subject_id IS DISTINCT FROM NEW.subject_id
+        OR OLD.schedule_id IS DISTINCT FROM NEW.schedule_id
+    )
+    EXECUTE FUNCTION grades_maintain_averages()
+    """,
+)
+
+
+def _prefixed(columns: str, alias: str) -> str:
+    return ", ".join(f"{alias}.{name.strip()}" for name in columns.split(","))
+
+
+def _schedule_columns(partitioned: bool) -> list:
+    columns = [
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('schedule_id_seq'::regclass)"), nullable=False),
+        sa.Column('week_id', sa.Integer(), nullable=False),
+        sa.Column('lesson_time_id', sa.Integer(), nullable=False),
+        sa.Column('class_id', sa.Integer(), nullable=False),
+        sa.Column('teacher_id', sa.Integer(), nullable=False),
+        sa.Column('subject_id', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('day_of_week', sa.Integer(), nullable=False),
+        sa.Column('location', sa.String(), nullable=True),
+        sa.Column('description', sa.String(), nullable=True),
+        sa.Column('is_replacement', sa.Boolean(), nullable=True),
+        sa.Column('is_cancelled', sa.Boolean(), nullable=True),
+        sa.Column('original_teacher_id', sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(['class_id'], ['classes.id'], ),
+        sa.ForeignKeyConstraint(['lesson_time_id'], ['lesson_times.id'], ),
+        sa.ForeignKeyConstraint(['original_teacher_id'], ['teachers.user_id'], ),
+        sa.ForeignKeyConstraint(['subject_id'], ['subjects.id'], ),
+        sa.ForeignKeyConstraint(['teacher_id'], ['teachers.user_id'], ),
+        sa.ForeignKeyConstraint(['week_id'], ['academic_weeks.id'], ),
+    ]
+    if partitioned:
+        columns += [
+            sa.Column('year_id', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(['year_id'], ['academic_years.id'], ),
+            sa.PrimaryKeyConstraint('id', 'year_id'),
+        ]
+    else:
+        columns.append(sa.PrimaryKeyConstraint('id'))
+    return columns
+
+
+def _grades_columns(partitioned: bool) -> list:
+    columns = [
+        sa.Column('id', sa.Integer(), server_default=sa.text("nextval('grades_id_seq'::regclass)"), nullable=False),
+        sa.Column('schedule_id', sa.Integer(), nullable=False),
+        sa.Column('student_id', sa.Integer(), nullable=False),
+        sa.Column('subject_id', sa.Integer(), nullable=False),
+        sa.Column('teacher_id', sa.Integer(), nullable=False),
+        sa.Column('homework_id', sa.Integer(), nullable=True),
+        sa.Column('comment', sa.Text(), nullable=True),
+        sa.Column('score', sa.Integer(), nullable=False),
+        sa.Column('weight', sa.Integer(), server_default='1', nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['homework_id'], ['homework.id'], ),
+        sa.ForeignKeyConstraint(['student_id'], ['students.user_id'], ),
+        sa.ForeignKeyConstraint(['subject_id'], ['subjects.id'], ),
+        sa.ForeignKeyConstraint(['teacher_id'], ['teachers.user_id'], ),
+    ]
+    if partitioned:
+        columns += [
+            sa.Column('year_id', sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(
+                ['schedule_id', 'year_id'], ['schedule.id', 'schedule.year_id'], name='fk_grades_schedule_year'
+            ),
+            sa.PrimaryKeyConstraint('id', 'year_id'),
+        ]
+    else:
+        columns += [
+            sa.ForeignKeyConstraint(['schedule_id'], ['schedule.id'], ),
+            sa.PrimaryKeyConstraint('id'),
+        ]
+    return columns
+
+
+def _set_aside_old_tables() -> None:
+    """Переименовывает таблицы в *_old и снимает с них ключи, индексы и триггеры"""
+    op.execute("DROP TRIGGER IF EXISTS grades_maintain_averages_upd ON grades")
+    op.execute("DROP TRIGGER IF EXISTS grades_maintain_averages_ins_del ON grades")
+    op.rename_table('grades', 'grades_old')
+    op.rename_table('schedule', 'schedule_old')
+    # CASCADE снимает и ссылки homework/grades на schedule
+    op.execute("ALTER TABLE schedule_old DROP CONSTRAINT schedule_pkey CASCADE")
+    op.execute("ALTER TABLE grades_old DROP CONSTRAINT grades_pkey")
+    op.execute("DROP INDEX IF EXISTS ix_schedule_id")
+    op.execute("DROP INDEX IF EXISTS ix_grades_id")
+    op.execute("DROP INDEX IF EXISTS uq_grades_schedule_student_lesson")
+    op.execute("DROP INDEX IF EXISTS ix_grades_student_subject_created")
+    # Последовательности id переходят к новым таблицам
+    op.execute("ALTER SEQUENCE schedule_id_seq OWNED BY NONE")
+    op.execute("ALTER SEQUENCE grades_id_seq OWNED BY NONE")
+
+
+def _finish(grades_unique_columns: list) -> None:
+    op.drop_table('grades_old')
+    op.drop_table('schedule_old')
+    op.execute("ALTER SEQUENCE schedule_id_seq OWNED BY schedule.id")
+    op.execute("ALTER SEQUENCE grades_id_seq OWNED BY grades.id")
+    op.create_index(
+        'uq_grades_schedule_student_lesson', 'grades', grades_unique_columns,
+        unique=True, postgresql_where=sa.text('homework_id IS NULL')
+    )
+    op.create_index('ix_grades_student_subject_created', 'grades', ['student_id', 'subject_id', 'created_at'], unique=False)
+    # Данные перенесены до создания триггеров: grade_averages уже посчитаны
+    for statement in CREATE_GRADES_TRIGGERS:
+        op.execute(statement)
+
+
+def upgrade() -> None:
+    _set_aside_old_tables()
+
+    op.create_table('schedule', *_schedule_columns(partitioned=True), postgresql_partition_by='LIST (year_id)')
+    op.create_table('grades', *_grades_columns(partitioned=True), postgresql_partition_by='LIST (year_id)')
+
+    # Секция на каждый существующий учебный год; новые создает create_academic_year
+    year_ids = op.get_bind().execute(sa.text("SELECT id FROM academic_years ORDER BY id")).scalars().all()
+    for year_id in year_ids:
+        op.execute(f"CREATE TABLE schedule_y{year_id} PARTITION OF schedule FOR VALUES IN ({year_id})")
+        op.execute(f"CREATE TABLE grades_y{year_id} PARTITION OF grades FOR VALUES IN ({year_id})")
+
+    op.execute(f"""
+        INSERT INTO schedule ({SCHEDULE_COLUMNS}, year_id)
+        SELECT {_prefixed(SCHEDULE_COLUMNS, "s")}, p.year_id
+        FROM schedule_old s
+        JOIN academic_weeks w ON w.id = s.week_id
+        JOIN academic_periods p ON p.id = w.period_id
+    """)
+    op.execute(f"""
+        INSERT INTO grades ({GRADES_COLUMNS}, year_id)
+        SELECT {_prefixed(GRADES_COLUMNS, "g")}, s.year_id
+        FROM grades_old g
+        JOIN schedule s ON s.id = g.schedule_id
+    """)
+
+    _finish(['schedule_id', 'student_id', 'year_id'])
+
+
+def downgrade() -> None:
+    # Архивные годы (схема archive) нужно вернуть командой archive_academic_year --restore до отката
+    _set_aside_old_tables()
+
+    op.create_table('schedule', *_schedule_columns(partitioned=False))
+    op.create_table('grades', *_grades_columns(partitioned=False))
+    op.create_index(op.f('ix_schedule_id'), 'schedule', ['id'], unique=False)
+    op.create_index(op.f('ix_grades_id'), 'grades', ['id'], unique=False)
+
+    op.execute(f"INSERT INTO schedule ({SCHEDULE_COLUMNS}) SELECT {SCHEDULE_COLUMNS} FROM schedule_old")
+    op.execute(f"INSERT INTO grades ({GRADES_COLUMNS}) SELECT {GRADES_COLUMNS} FROM grades_old")
+    op.create_foreign_key('homework_schedule_id_fkey', 'homework', 'schedule', ['schedule_id'], ['id'])
+
+    _finish(['schedule_id', 'student_id'])
@@ -0,0 +1,26 @@
+"""add academic_weeks period_id start_date index
+
+Revision ID: f5c9d3b7a2e1
+Revises: e4b8a2c6f1d9
+Create Date: 2025-06-17 09:41:05.318240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f5c9d3b7a2e1'
+down_revision: Union[str, None] = 'e4b8a2c6f1d9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_academic_weeks_period_start', 'academic_weeks', ['period_id', 'start_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_academic_weeks_period_start', table_name='academic_weeks')
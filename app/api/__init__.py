@@ -1,6 +1,6 @@
 from fastapi import APIRouter
 
-from app.api.v1 import auth, files, users, class_, subject, academic_cycles
+from app.api.v1 import auth, files, users, class_, subject, academic_cycles, grades, analytics, homework, diary, admin, exports
 
 api_router = APIRouter()
 api_router.include_router(auth.router, prefix="/auth")
@@ -8,4 +8,10 @@ api_router.include_router(users.router, prefix="/users", tags=["users"])
 api_router.include_router(class_.router, prefix="/class", tags=["class"])
 api_router.include_router(files.router, prefix="/files", tags=["files"]) 
 api_router.include_router(subject.router, prefix="/subjects", tags=["subject"])
-api_router.include_router(academic_cycles.router, prefix="/academic_cycles", tags=["academic_cycles"])
\ No newline at end of file
+api_router.include_router(academic_cycles.router, prefix="/academic_cycles", tags=["academic_cycles"])
+api_router.include_router(grades.router, prefix="/grades", tags=["grades"])
+api_router.include_router(analytics.router, prefix="/analytics", tags=["analytics"])
+api_router.include_router(homework.router, prefix="/homework", tags=["homework"])
+api_router.include_router(diary.router, prefix="/diary", tags=["diary"])
+api_router.include_router(admin.router, prefix="/admin", tags=["admin"])
+api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
\ No newline at end of file
@@ -1,5 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 import logging
+from app.api.routing import FastJSONRoute
 from app.core.logger import setup_logging
 from app.schemas.base import BaseResponse, ErrorResponse, success_response, error_response
 from app.schemas.academic_cycles.academic_year import AcademicYearList, AcademicYearCreate
@@ -10,11 +11,12 @@ from app.core.dependencies import get_db, get_current_user
 from app.schemas.user.user import User, UserRole
 from fastapi import Depends
 from app.services.academic_cycles import create_academic_year
+from app.services.etag import get_resource_etag, is_not_modified, not_modified_response, set_etag
 
 setup_logging()
 logger = logging.getLogger("app")
 
-router = APIRouter(tags=["academic_cycles"])
+router = APIRouter(tags=["academic_cycles"], route_class=FastJSONRoute)
 
 @router.post("/", response_model=Union[BaseResponse[AcademicYearList], ErrorResponse])
 async def create_academic_year_endpoint(academic_year: AcademicYearCreate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
@@ -71,13 +73,16 @@ async def get_academic_years(skip: int = 0, limit: int = 10, db: AsyncSession =
         )
         
 @router.get("/current", response_model=Union[BaseResponse[AcademicYearList], ErrorResponse])
-async def get_current_academic_year(db: AsyncSession = Depends(get_db), _: User = Depends(get_current_user)):
+async def get_current_academic_year(request: Request, response: Response, db: AsyncSession = Depends(get_db), _: User = Depends(get_current_user)):
     """
     Получение текущего активного академического года.
     
     (Сгенерировано автоматически(C4S))@v1
     """
     try:
+        etag = await get_resource_etag(db, ["academic_cycles"])
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
         academic_year = await academic_years_repository.get_current_academic_year(db=db)
         if not academic_year:
             return error_response(
@@ -86,6 +91,7 @@ async def get_current_academic_year(db: AsyncSession = Depends(get_db), _: User
             )
             
         academic_year = AcademicYearList.model_validate(academic_year)
+        set_etag(response, etag)
         return success_response(
             data=academic_year,
             message="Current academic year retrieved successfully"
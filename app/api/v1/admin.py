@@ -0,0 +1,227 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, Query, UploadFile, File as FastAPIFile
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Union
+
+from app.api.routing import FastJSONRoute
+from app.core.config import settings
+from app.core.profiling import (
+    StackSampler, request_profiles, cpu_profile_lock, take_memory_baseline, memory_diff, stop_memory_tracing
+)
+
+from app.core.dependencies import get_db, get_current_user
+from app.db.slow_queries import slow_query_log
+from app.schemas.admin.admin import SlowQuery, ImportReport
+from app.schemas.base import BaseResponse, ErrorResponse, success_response, error_response
+from app.schemas.user.user import User, UserRole
+from app.services.imports import import_csv
+
+import logging
+from app.core.logger import setup_logging
+
+setup_logging()
+logger = logging.getLogger("app")
+
+router = APIRouter(tags=["admin"], route_class=FastJSONRoute)
+
+
+@router.get("/slow_queries", response_model=Union[BaseResponse[List[SlowQuery]], ErrorResponse])
+async def get_slow_queries(current_user: User = Depends(get_current_user)):
+    """
+    Последние медленные SQL-запросы воркера (с планами EXPLAIN, если включено).
+    """
+    if current_user.role != UserRole.ADMIN:
+        return error_response(
+            message="You are not allowed to access this resource",
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    return success_response(
+        data=slow_query_log.get_entries(),
+        message="Slow queries retrieved successfully"
+    )
+
+
+@router.delete("/slow_queries", response_model=Union[BaseResponse, ErrorResponse])
+async def clear_slow_queries(current_user: User = Depends(get_current_user)):
+    """
+    Очистка журнала медленных запросов.
+    """
+    if current_user.role != UserRole.ADMIN:
+        return error_response(
+            message="You are not allowed to access this resource",
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    slow_query_log.clear()
+    return success_response(
+        data=None,
+        message="Slow queries cleared successfully"
+    )
+
+
+@router.get("/profiling/cpu", response_model=None)
+async def profile_cpu(
+    seconds: float = Query(default=10, gt=0),
+    interval_ms: int = Query(default=None, ge=1, le=1000),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Сэмплирующий CPU-профиль воркера за N секунд в формате collapsed stacks (flamegraph).
+    """
+    if current_user.role != UserRole.ADMIN:
+        return error_response(
+            message="You are not allowed to access this resource",
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    if cpu_profile_lock.locked():
+        return error_response(
+            message="CPU profiling is already running",
+            error_code="PROFILING_IN_PROGRESS"
+        )
+
+    async with cpu_profile_lock:
+        sampler = StackSampler(interval=(interval_ms or settings.PROFILING_INTERVAL_MS) / 1000).start()
+        try:
+            await asyncio.sleep(min(seconds, settings.PROFILING_MAX_SECONDS))
+        finally:
+            collapsed = sampler.stop()
+    return PlainTextResponse(
+        collapsed,
+        headers={"Content-Disposition": 'attachment; filename="cpu.collapsed"'}
+    )
+
+
+@router.get("/profiling/requests", response_model=Union[BaseResponse[List[str]], ErrorResponse])
+async def get_request_profiles(current_user: User = Depends(get_current_user)):
+    """
+    Идентификаторы последних профилей запросов (заголовок X-Profile: 1).
+    """
+    if current_user.role != UserRole.ADMIN:
+        return error_response(
+            message="You are not allowed to access this resource",
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    return success_response(
+        data=request_profiles.list(),
+        message="Request profiles retrieved successfully"
+    )
+
+
+@router.get("/profiling/requests/{profile_id}", response_model=None)
+async def get_request_profile(profile_id: str, current_user: User = Depends(get_current_user)):
+    """
+    Профиль отдельного запроса в формате collapsed stacks.
+    """
+    if current_user.role != UserRole.ADMIN:
+        return error_response(
+            message="You are not allowed to access this resource",
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    collapsed = request_profiles.get(profile_id)
+    if collapsed is None:
+        return error_response(
+            message="Profile not found",
+            error_code="PROFILE_NOT_FOUND"
+        )
+    return PlainTextResponse(
+        collapsed,
+        headers={"Content-Disposition": f'attachment; filename="{profile_id}.collapsed"'}
+    )
+
+
+@router.post("/profiling/memory/snapshot", response_model=Union[BaseResponse[int], ErrorResponse])
+async def take_memory_snapshot(current_user: User = Depends(get_current_user)):
+    """
+    Включение tracemalloc и снимок памяти, с которым сравнивается последующий diff.
+    """
+    if current_user.role != UserRole.ADMIN:
+        return error_response(
+            message="You are not allowed to access this resource",
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    traces = await asyncio.to_thread(take_memory_baseline)
+    return success_response(
+        data=traces,
+        message="Memory snapshot taken successfully"
+    )
+
+
+@router.get("/profiling/memory/diff", response_model=Union[BaseResponse[List[str]], ErrorResponse])
+async def get_memory_diff(
+    limit: int = Query(default=25, ge=1, le=500),
+    group_by: str = Query(default="lineno", pattern="^(lineno|filename|traceback)$"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Разница выделений памяти с последним снимком (поиск утечек).
+    """
+    if current_user.role != UserRole.ADMIN:
+        return error_response(
+            message="You are not allowed to access this resource",
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    try:
+        diff = await asyncio.to_thread(memory_diff, limit, group_by)
+    except ValueError as e:
+        return error_response(
+            message=str(e),
+            error_code="MEMORY_BASELINE_NOT_FOUND"
+        )
+    return success_response(
+        data=diff,
+        message="Memory diff retrieved successfully"
+    )
+
+
+@router.delete("/profiling/memory", response_model=Union[BaseResponse, ErrorResponse])
+async def stop_memory_profiling(current_user: User = Depends(get_current_user)):
+    """
+    Отключение tracemalloc.
+    """
+    if current_user.role != UserRole.ADMIN:
+        return error_response(
+            message="You are not allowed to access this resource",
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    stop_memory_tracing()
+    return success_response(
+        data=None,
+        message="Memory tracing stopped"
+    )
+
+
+@router.post("/imports/{kind}", response_model=Union[BaseResponse[ImportReport], ErrorResponse])
+async def import_legacy_csv(
+    kind: str,
+    file: UploadFile = FastAPIFile(...),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Импорт CSV из старой системы (students, schedule, homework, grades).
+    Строки с ошибками пропускаются и попадают в отчет, остальные добавляются одной транзакцией.
+    """
+    if current_user.role != UserRole.ADMIN:
+        return error_response(
+            message="You are not allowed to access this resource",
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    try:
+        report = await import_csv(db=db, kind=kind, stream=file.file)
+        return success_response(
+            data=report,
+            message="Import completed"
+        )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
+    except Exception as e:
+        logger.error(f"IMPORT_ERROR: {e}")
+        return error_response(
+            message="Failed to import file",
+            error_code="IMPORT_ERROR"
+        )
@@ -0,0 +1,119 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Union
+
+from app.api.routing import FastJSONRoute
+from app.core.dependencies import get_read_db, get_current_user
+from app.db.repositories.user.teacher import teacher_repository
+from app.schemas.analytics.analytics import ClassAnalytics
+from app.schemas.base import BaseResponse, ErrorResponse, success_response, error_response
+from app.schemas.user.user import User, UserRole
+from app.services.analytics import get_class_analytics, get_grade_level_analytics, get_school_analytics
+
+import logging
+from app.core.logger import setup_logging
+
+setup_logging()
+logger = logging.getLogger("app")
+
+router = APIRouter(tags=["analytics"], route_class=FastJSONRoute)
+
+
+@router.get("/class/{class_id}", response_model=Union[BaseResponse[ClassAnalytics], ErrorResponse])
+async def get_class_analytics_endpoint(class_id: int, period_id: int = None, db: AsyncSession = Depends(get_read_db), current_user: User = Depends(get_current_user)):
+    """
+    Аналитика успеваемости класса за период: распределение оценок, статистика по предметам, группа риска.
+    """
+    try:
+        if current_user.role == UserRole.TEACHER:
+            teacher = await teacher_repository.get_user_teacher(db=db, user_id=current_user.id)
+            if not teacher or teacher.class_id != class_id:
+                return error_response(
+                    message="You are not allowed to access this resource",
+                    error_code="INSUFFICIENT_PERMISSIONS"
+                )
+        elif current_user.role != UserRole.ADMIN:
+            return error_response(
+                message="You are not allowed to access this resource",
+                error_code="INSUFFICIENT_PERMISSIONS"
+            )
+
+        analytics = await get_class_analytics(db=db, class_id=class_id, period_id=period_id)
+        return success_response(
+            data=analytics,
+            message="Class analytics retrieved successfully"
+        )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
+    except Exception as e:
+        logger.error(f"GET_CLASS_ANALYTICS_ERROR: {e}")
+        return error_response(
+            message="Failed to get class analytics",
+            error_code="GET_CLASS_ANALYTICS_ERROR"
+        )
+
+
+@router.get("/grade_level/{grade_level}", response_model=Union[BaseResponse[ClassAnalytics], ErrorResponse])
+async def get_grade_level_analytics_endpoint(grade_level: int, period_id: int = None, db: AsyncSession = Depends(get_read_db), current_user: User = Depends(get_current_user)):
+    """
+    Аналитика успеваемости параллели за период со сводкой по классам.
+    """
+    try:
+        if current_user.role != UserRole.ADMIN:
+            return error_response(
+                message="You are not allowed to access this resource",
+                error_code="INSUFFICIENT_PERMISSIONS"
+            )
+
+        analytics = await get_grade_level_analytics(db=db, grade_level=grade_level, period_id=period_id)
+        return success_response(
+            data=analytics,
+            message="Grade level analytics retrieved successfully"
+        )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
+    except Exception as e:
+        logger.error(f"GET_GRADE_LEVEL_ANALYTICS_ERROR: {e}")
+        return error_response(
+            message="Failed to get grade level analytics",
+            error_code="GET_GRADE_LEVEL_ANALYTICS_ERROR"
+        )
+
+
+@router.get("/school", response_model=Union[BaseResponse[ClassAnalytics], ErrorResponse])
+async def get_school_analytics_endpoint(period_id: int = None, db: AsyncSession = Depends(get_read_db), current_user: User = Depends(get_current_user)):
+    """
+    Аналитика успеваемости всей школы за период со сводкой по классам.
+    """
+    try:
+        if current_user.role != UserRole.ADMIN:
+            return error_response(
+                message="You are not allowed to access this resource",
+                error_code="INSUFFICIENT_PERMISSIONS"
+            )
+
+        analytics = await get_school_analytics(db=db, period_id=period_id)
+        return success_response(
+            data=analytics,
+            message="School analytics retrieved successfully"
+        )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
+    except Exception as e:
+        logger.error(f"GET_SCHOOL_ANALYTICS_ERROR: {e}")
+        return error_response(
+            message="Failed to get school analytics",
+            error_code="GET_SCHOOL_ANALYTICS_ERROR"
+        )
@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends
 from fastapi.security import OAuth2PasswordRequestForm
 
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.routing import FastJSONRoute
 from app.core.dependencies import get_current_user
 from app.db.session import get_db
 
@@ -22,7 +23,7 @@ setup_logging()
 logger = logging.getLogger("app")
 
 
-router = APIRouter(tags=["auth"])
+router = APIRouter(tags=["auth"], route_class=FastJSONRoute)
 
 @router.post("/login", response_model=Union[LoginSuccessResponse, ErrorResponse])
 async def login(
@@ -1,6 +1,7 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import FastJSONRoute
 from app.schemas.base import error_response, BaseResponse, ErrorResponse, success_response
 from app.schemas.user.user import UserRole, User
 from app.schemas.responses import UpdatedClassStudentsListData
@@ -17,8 +18,10 @@ from app.db.repositories.user.teacher import teacher_repository
 from app.schemas.class_.class_ import ClassList, ClassCreate, ClassCreateDb, ClassUpdate, ClassConfig, ClassUpdateDb, ClassWithStudentsList
 import logging
 from typing import List, Union
-from app.db.repositories.academic_cycles.academic_years import academic_years_repository
+from app.services.calendar import calendar_cache
 from app.services.class_ import add_students_to_class, remove_students_from_class, check_class_config
+from app.services.users import parse_student_fields, student_data
+from app.services.etag import get_resource_etag, bump_resource_versions, class_version_key, is_not_modified, not_modified_response, set_etag
 from app.schemas.user.teacher import UserWithTeacherInfo, Teacher
 from app.schemas.user.student import UserWithStudentInfo, Student
 from app.schemas.user.user import UserResponse
@@ -26,7 +29,7 @@ from app.schemas.user.user import UserResponse
 setup_logging()
 logger = logging.getLogger("app")
 
-router = APIRouter(tags=["class"])
+router = APIRouter(tags=["class"], route_class=FastJSONRoute)
 
 
 @router.put("/config", response_model=Union[BaseResponse[ClassConfig], ErrorResponse])
@@ -44,6 +47,7 @@ async def update_class_config(class_config: ClassConfig, db: AsyncSession = Depe
             )
         
         class_config = await class_config_repository.update_class_config(db=db, obj_in=class_config)
+        await bump_resource_versions(db, "class_config")
         
         return success_response(
             data=ClassConfig.model_validate(class_config),
@@ -63,7 +67,7 @@ async def update_class_config(class_config: ClassConfig, db: AsyncSession = Depe
         )
         
 @router.get("/config", response_model=Union[BaseResponse[ClassConfig], ErrorResponse])
-async def get_class_config(db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+async def get_class_config(request: Request, response: Response, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
     """
     Получение текущей конфигурации классов.
     
@@ -76,6 +80,9 @@ async def get_class_config(db: AsyncSession = Depends(get_db), current_user: Use
                 error_code="INSUFFICIENT_PERMISSIONS"
             )
             
+        etag = await get_resource_etag(db, ["class_config"])
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
         class_config = await class_config_repository.get_class_config(db=db)
         if not class_config:
             return error_response(
@@ -83,6 +90,7 @@ async def get_class_config(db: AsyncSession = Depends(get_db), current_user: Use
                 error_code="CLASS_CONFIG_NOT_FOUND"
             )
         
+        set_etag(response, etag)
         return success_response(
             data=ClassConfig.model_validate(class_config),
             message="Class config retrieved successfully"
@@ -185,14 +193,16 @@ async def update_class_students(class_id: int, new_students: List[int] = None, r
             error_code="ADD_STUDENTS_TO_CLASS_ERROR"
         )
         
-@router.get("/{class_id}/students", response_model=Union[BaseResponse[List[UserWithStudentInfo]], ErrorResponse])
-async def get_class_students(class_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+@router.get("/{class_id}/students", response_model=Union[BaseResponse[List[UserWithStudentInfo]], ErrorResponse], response_model_exclude_unset=True)
+async def get_class_students(class_id: int, fields: str = None, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
     """
     Получение списка студентов конкретного класса.
+    fields=id,full_name - вернуть (и выбрать из БД) только эти поля.
     
     (Сгенерировано автоматически(C4S))@v1
     """
     try:
+        user_fields, student_fields = parse_student_fields(fields)
         if current_user.role != UserRole.ADMIN:
             return error_response(
                 message="You are not allowed to access this resource",
@@ -206,19 +216,22 @@ async def get_class_students(class_id: int, db: AsyncSession = Depends(get_db),
                 error_code="CLASS_NOT_FOUND"
             )
             
-        students = await student_repository.get_students(db=db, class_id=class_id, order_by="full_name", order_direction="asc")        
-        students_list = []
-        for student in students:
-            student_data = UserWithStudentInfo(
-                user_info=UserResponse.model_validate(student.user),
-                student_info=Student.model_validate(student)
-            )
-            students_list.append(student_data)
+        students = await student_repository.get_students(
+            db=db, class_id=class_id, order_by="full_name", order_direction="asc",
+            user_fields=user_fields, student_fields=student_fields
+        )
+        students_list = [student_data(student, user_fields, student_fields) for student in students]
             
         return success_response(
             data=students_list,
             message="Students retrieved successfully"
         )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
     except Exception as e:
         logger.error(f"GET_CLASS_STUDENTS_ERROR: {e}")
         return error_response(
@@ -239,11 +252,15 @@ async def get_classes(skip: int = 0, limit: int = 100,
     (Сгенерировано автоматически(C4S))@v1
     """
     try:
+        year_id = None
+        if year:
+            calendar_year = (await calendar_cache.get(db=db)).year_by_name(str(year))
+            year_id = calendar_year.id if calendar_year else None
         if current_user.role == UserRole.TEACHER:
             teacher = await teacher_repository.get_user_teacher(db=db, user_id=current_user.id)
-            classes = await class_repository.get_classes(db=db, teacher=teacher, search=search, order_by=order_by, order_direction=order_direction, year=year, skip=skip, limit=limit)
+            classes = await class_repository.get_classes(db=db, teacher=teacher, search=search, order_by=order_by, order_direction=order_direction, year_id=year_id, skip=skip, limit=limit)
         elif current_user.role == UserRole.ADMIN:
-            classes = await class_repository.get_classes(db=db, search=search, order_by=order_by, order_direction=order_direction, year=year, skip=skip, limit=limit)
+            classes = await class_repository.get_classes(db=db, search=search, order_by=order_by, order_direction=order_direction, year_id=year_id, skip=skip, limit=limit)
         else:
             return error_response(
                 message="You are not allowed to access this resource",
@@ -307,7 +324,7 @@ async def create_class(class_create: ClassCreate, db: AsyncSession = Depends(get
                 error_code="INVALID_CLASS_CONFIG"
             )
         
-        year = await academic_years_repository.get_current_academic_year(db=db)
+        year = (await calendar_cache.get(db=db)).current_year
         if not year:
             return error_response(
                 message="Current academic year not found",
@@ -348,21 +365,28 @@ async def create_class(class_create: ClassCreate, db: AsyncSession = Depends(get
             error_code="CREATE_CLASS_ERROR"
         )
 
-@router.get("/{class_id}", response_model=Union[BaseResponse[ClassWithStudentsList], ErrorResponse])
-async def get_class_with_students(class_id: int, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+@router.get("/{class_id}", response_model=Union[BaseResponse[ClassWithStudentsList], ErrorResponse], response_model_exclude_unset=True)
+async def get_class_with_students(class_id: int, request: Request, response: Response, fields: str = None, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
     """
     Получение детальной информации о классе со списком студентов.
+    fields=id,full_name - поля учеников в ответе (для выпадающих списков).
     
     (Сгенерировано автоматически(C4S))@v1
     """
     try:
+        user_fields, student_fields = parse_student_fields(fields)
         if current_user.role not in [UserRole.ADMIN, UserRole.TEACHER]:
             return error_response(
                 message="You are not allowed to access this resource",
                 error_code="INSUFFICIENT_PERMISSIONS"
             )
         
-        class_ = await class_repository.get_with_relations(db=db, id=class_id)
+        etag = await get_resource_etag(db, [class_version_key(class_id), "users"], fields)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+        class_ = await class_repository.get_with_relations(
+            db=db, id=class_id, user_fields=user_fields, student_fields=student_fields
+        )
         if not class_:
             return error_response(
                 message="Class not found",
@@ -376,27 +400,32 @@ async def get_class_with_students(class_id: int, db: AsyncSession = Depends(get_
                 teacher_info=Teacher.model_validate(class_.teacher)
             )
         
-        students_list = []
-        for student in class_.students:
-            if student.user:
-                student_data = UserWithStudentInfo(
-                    user_info=UserResponse.model_validate(student.user),
-                    student_info=Student.model_validate(student)
-                )
-                students_list.append(student_data)
+        students_list = [student_data(student, user_fields, student_fields) for student in class_.students]
         
+        set_etag(response, etag)
         return success_response(
             data=ClassWithStudentsList(
-                id=class_.id,
-                name=class_.name,
-                year_id=class_.year_id,
-                year_name=class_.year.name,
-                created_at=class_.created_at,
+                class_info=ClassList(
+                    id=class_.id,
+                    name=class_.name,
+                    year_id=class_.year_id,
+                    year_name=class_.year.name,
+                    specialization=class_.specialization,
+                    students_count=len(students_list),
+                    created_at=class_.created_at,
+                    teacher=teacher_data
+                ),
                 teacher=teacher_data,
                 students=students_list
             ),
             message="Class retrieved successfully"
         )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
     except Exception as e:
         logger.error(f"GET_CLASS_ERROR: {e}")
         return error_response(
@@ -441,10 +470,14 @@ async def update_class(class_id: int, class_update: ClassUpdate, db: AsyncSessio
         
         updated_class = await class_repository.update(db=db, db_obj=class_, obj_in=class_update_db)
         
+        changed_classes = [class_version_key(class_id)]
         if class_update.teacher_id:
             teacher = await teacher_repository.get_user_teacher(db=db, user_id=class_update.teacher_id)
+            if teacher.class_id is not None:
+                changed_classes.append(class_version_key(teacher.class_id))
             teacher.class_id = updated_class.id
             await teacher_repository.update(db=db, db_obj=teacher, obj_in={"class_id": updated_class.id})
+        await bump_resource_versions(db, *changed_classes)
         
         updated_class = await class_repository.get_with_relations(db=db, id=class_id)
         
@@ -455,22 +488,20 @@ async def update_class(class_id: int, class_update: ClassUpdate, db: AsyncSessio
                 teacher_info=Teacher.model_validate(updated_class.teacher)
             )
         
-        students_list = []
-        for student in updated_class.students:
-            if student.user:
-                student_data = UserWithStudentInfo(
-                    user_info=UserResponse.model_validate(student.user),
-                    student_info=Student.model_validate(student)
-                )
-                students_list.append(student_data)
+        students_list = [student_data(student) for student in updated_class.students]
         
         return success_response(
             data=ClassWithStudentsList(
-                id=updated_class.id,
-                name=updated_class.name,
-                year_id=updated_class.year_id,
-                year_name=updated_class.year.name,
-                created_at=updated_class.created_at,
+                class_info=ClassList(
+                    id=updated_class.id,
+                    name=updated_class.name,
+                    year_id=updated_class.year_id,
+                    year_name=updated_class.year.name,
+                    specialization=updated_class.specialization,
+                    students_count=len(students_list),
+                    created_at=updated_class.created_at,
+                    teacher=teacher_data
+                ),
                 teacher=teacher_data,
                 students=students_list
             ),
@@ -0,0 +1,44 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Union
+
+from app.api.routing import FastJSONRoute
+from app.core.dependencies import get_read_db, get_current_user
+from app.schemas.base import BaseResponse, ErrorResponse, success_response, error_response
+from app.schemas.diary.diary import DiaryWeek
+from app.schemas.user.user import User
+from app.services.diary import get_student_diary_week
+from app.services.access import can_access_student
+
+import logging
+from app.core.logger import setup_logging
+
+setup_logging()
+logger = logging.getLogger("app")
+
+router = APIRouter(tags=["diary"], route_class=FastJSONRoute)
+
+
+@router.get("/{student_id}/week/{week_id}", response_model=Union[BaseResponse[DiaryWeek], ErrorResponse])
+async def get_diary_week_endpoint(student_id: int, week_id: int, db: AsyncSession = Depends(get_read_db), current_user: User = Depends(get_current_user)):
+    """
+    Дневник ученика за учебную неделю: уроки, домашние задания и оценки.
+    """
+    try:
+        if not await can_access_student(db=db, current_user=current_user, student_id=student_id):
+            return error_response(
+                message="You are not allowed to access this resource",
+                error_code="INSUFFICIENT_PERMISSIONS"
+            )
+
+        diary = await get_student_diary_week(db=db, student_id=student_id, week_id=week_id)
+        return success_response(
+            data=diary,
+            message="Diary retrieved successfully"
+        )
+    except Exception as e:
+        logger.error(f"GET_DIARY_ERROR: {e}")
+        return error_response(
+            message="Failed to get diary",
+            error_code="GET_DIARY_ERROR"
+        )
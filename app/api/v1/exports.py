@@ -0,0 +1,114 @@
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routing import FastJSONRoute
+from app.core.dependencies import get_read_db, get_current_user
+from app.db.replicas import request_user_key
+from app.db.repositories.export.export import (
+    export_repository, STUDENT_COLUMNS, TEACHER_COLUMNS, GRADE_COLUMNS, ROSTER_COLUMNS
+)
+from app.db.repositories.user.teacher import teacher_repository
+from app.schemas.base import error_response
+from app.schemas.user.user import User, UserRole
+from app.services.export import ExportFormat, export_response
+
+import logging
+from app.core.logger import setup_logging
+
+setup_logging()
+logger = logging.getLogger("app")
+
+router = APIRouter(tags=["exports"], route_class=FastJSONRoute)
+
+
+def _forbidden() -> dict:
+    return error_response(
+        message="You are not allowed to access this resource",
+        error_code="INSUFFICIENT_PERMISSIONS"
+    )
+
+
+async def _can_export_class(db: AsyncSession, current_user: User, class_id: int) -> bool:
+    if current_user.role == UserRole.ADMIN:
+        return True
+    if current_user.role == UserRole.TEACHER:
+        teacher = await teacher_repository.get_user_teacher(db=db, user_id=current_user.id)
+        return teacher is not None and teacher.class_id == class_id
+    return False
+
+
+@router.get("/students", response_model=None)
+async def export_students(
+    request: Request,
+    file_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Выгрузка всех учеников (CSV/XLSX), отдается потоком.
+    """
+    if current_user.role != UserRole.ADMIN:
+        return _forbidden()
+    return export_response(
+        export_repository.students_query(), STUDENT_COLUMNS, "students", file_format,
+        user_key=request_user_key(request.headers.get("authorization"))
+    )
+
+
+@router.get("/teachers", response_model=None)
+async def export_teachers(
+    request: Request,
+    file_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Выгрузка всех учителей (CSV/XLSX), отдается потоком.
+    """
+    if current_user.role != UserRole.ADMIN:
+        return _forbidden()
+    return export_response(
+        export_repository.teachers_query(), TEACHER_COLUMNS, "teachers", file_format,
+        user_key=request_user_key(request.headers.get("authorization"))
+    )
+
+
+@router.get("/grades", response_model=None)
+async def export_grades(
+    request: Request,
+    period_id: int,
+    class_id: int = None,
+    file_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Выгрузка оценок за учебный период (всей школы или одного класса).
+    Классный руководитель может выгрузить оценки своего класса.
+    """
+    if current_user.role != UserRole.ADMIN and (
+        class_id is None or not await _can_export_class(db=db, current_user=current_user, class_id=class_id)
+    ):
+        return _forbidden()
+    filename = f"grades_{period_id}" if class_id is None else f"grades_{period_id}_class_{class_id}"
+    return export_response(
+        export_repository.grades_query(period_id=period_id, class_id=class_id), GRADE_COLUMNS, filename, file_format,
+        user_key=request_user_key(request.headers.get("authorization"))
+    )
+
+
+@router.get("/class/{class_id}/roster", response_model=None)
+async def export_class_roster(
+    request: Request,
+    class_id: int,
+    file_format: ExportFormat = Query(default=ExportFormat.CSV, alias="format"),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Список класса с контактами родителей.
+    """
+    if not await _can_export_class(db=db, current_user=current_user, class_id=class_id):
+        return _forbidden()
+    return export_response(
+        export_repository.class_roster_query(class_id=class_id), ROSTER_COLUMNS, f"class_{class_id}_roster", file_format,
+        user_key=request_user_key(request.headers.get("authorization"))
+    )
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, UploadFile, File as FastAPIFile
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.api.routing import FastJSONRoute
 from app.core.config import settings
 from app.db.session import get_db
 
@@ -17,7 +18,7 @@ from app.core.logger import setup_logging
 setup_logging()
 logger = logging.getLogger("app")
 
-router = APIRouter(tags=["files"])
+router = APIRouter(tags=["files"], route_class=FastJSONRoute)
 
 @router.post("/")
 async def upload_file(
@@ -0,0 +1,86 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Union
+
+from app.api.routing import FastJSONRoute
+from app.core.dependencies import get_db, get_read_db, get_current_user
+from app.schemas.base import BaseResponse, ErrorResponse, success_response, error_response
+from app.schemas.schedule.grade import GradeEntry, GradeList, GradeAverageList
+from app.schemas.user.user import User, UserRole
+from app.services.grades import save_lesson_grades, get_student_averages
+from app.services.access import can_access_student
+
+import logging
+from app.core.logger import setup_logging
+
+setup_logging()
+logger = logging.getLogger("app")
+
+router = APIRouter(tags=["grades"], route_class=FastJSONRoute)
+
+
+@router.put("/schedule/{schedule_id}", response_model=Union[BaseResponse[List[GradeList]], ErrorResponse])
+async def save_lesson_grades_endpoint(schedule_id: int, grades: List[GradeEntry], db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """
+    Массовое выставление оценок за урок (upsert), возвращает всю колонку оценок урока.
+    """
+    try:
+        if current_user.role not in [UserRole.ADMIN, UserRole.TEACHER]:
+            return error_response(
+                message="You are not allowed to access this resource",
+                error_code="INSUFFICIENT_PERMISSIONS"
+            )
+
+        column = await save_lesson_grades(db=db, schedule_id=schedule_id, grades=grades, current_user=current_user)
+        return success_response(
+            data=column,
+            message="Grades saved successfully"
+        )
+    except PermissionError as e:
+        return error_response(
+            message=str(e),
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
+    except Exception as e:
+        logger.error(f"SAVE_GRADES_ERROR: {e}")
+        return error_response(
+            message="Failed to save grades",
+            error_code="SAVE_GRADES_ERROR"
+        )
+
+
+@router.get("/averages/{student_id}", response_model=Union[BaseResponse[List[GradeAverageList]], ErrorResponse])
+async def get_student_averages_endpoint(student_id: int, period_id: int = None, db: AsyncSession = Depends(get_read_db), current_user: User = Depends(get_current_user)):
+    """
+    Средние оценки ученика по предметам за период (из агрегатной таблицы).
+    """
+    try:
+        if not await can_access_student(db=db, current_user=current_user, student_id=student_id):
+            return error_response(
+                message="You are not allowed to access this resource",
+                error_code="INSUFFICIENT_PERMISSIONS"
+            )
+
+        averages = await get_student_averages(db=db, student_id=student_id, period_id=period_id)
+        return success_response(
+            data=averages,
+            message="Grade averages retrieved successfully"
+        )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
+    except Exception as e:
+        logger.error(f"GET_GRADE_AVERAGES_ERROR: {e}")
+        return error_response(
+            message="Failed to get grade averages",
+            error_code="GET_GRADE_AVERAGES_ERROR"
+        )
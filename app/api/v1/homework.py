@@ -0,0 +1,131 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Union
+from datetime import date
+
+from app.api.routing import FastJSONRoute
+from app.core.dependencies import get_db, get_current_user
+from app.schemas.base import BaseResponse, ErrorResponse, success_response, error_response
+from app.schemas.schedule.homework import HomeworkAssign, HomeworkList, HomeworkStatusUpdate, HomeworkStatusList, StudentHomework
+from app.schemas.user.user import User, UserRole
+from app.services.homework import assign_homework, get_student_homework, set_homework_done
+from app.services.access import can_access_student
+
+import logging
+from app.core.logger import setup_logging
+
+setup_logging()
+logger = logging.getLogger("app")
+
+router = APIRouter(tags=["homework"], route_class=FastJSONRoute)
+
+
+@router.post("/", response_model=Union[BaseResponse[HomeworkList], ErrorResponse])
+async def assign_homework_endpoint(homework: HomeworkAssign, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """
+    Выдача домашнего задания на урок всему классу.
+    """
+    try:
+        if current_user.role not in [UserRole.ADMIN, UserRole.TEACHER]:
+            return error_response(
+                message="You are not allowed to access this resource",
+                error_code="INSUFFICIENT_PERMISSIONS"
+            )
+
+        homework = await assign_homework(db=db, homework_in=homework, current_user=current_user)
+        return success_response(
+            data=homework,
+            message="Homework assigned successfully"
+        )
+    except PermissionError as e:
+        return error_response(
+            message=str(e),
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
+    except Exception as e:
+        logger.error(f"ASSIGN_HOMEWORK_ERROR: {e}")
+        return error_response(
+            message="Failed to assign homework",
+            error_code="ASSIGN_HOMEWORK_ERROR"
+        )
+
+
+@router.get("/me", response_model=Union[BaseResponse[List[StudentHomework]], ErrorResponse])
+async def get_my_homework_endpoint(date_from: date = None, date_to: date = None, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """
+    Домашние задания текущего ученика со сроком сдачи на этой неделе (или в указанном интервале).
+    """
+    if current_user.role != UserRole.STUDENT:
+        return error_response(
+            message="You are not allowed to access this resource",
+            error_code="INSUFFICIENT_PERMISSIONS"
+        )
+    return await get_student_homework_endpoint(student_id=current_user.id, date_from=date_from, date_to=date_to, db=db, current_user=current_user)
+
+
+@router.get("/student/{student_id}", response_model=Union[BaseResponse[List[StudentHomework]], ErrorResponse])
+async def get_student_homework_endpoint(student_id: int, date_from: date = None, date_to: date = None, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """
+    Домашние задания ученика со сроком сдачи на этой неделе (или в указанном интервале).
+    """
+    try:
+        if not await can_access_student(db=db, current_user=current_user, student_id=student_id):
+            return error_response(
+                message="You are not allowed to access this resource",
+                error_code="INSUFFICIENT_PERMISSIONS"
+            )
+
+        homework = await get_student_homework(db=db, student_id=student_id, date_from=date_from, date_to=date_to)
+        return success_response(
+            data=homework,
+            message="Homework retrieved successfully"
+        )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
+    except Exception as e:
+        logger.error(f"GET_HOMEWORK_ERROR: {e}")
+        return error_response(
+            message="Failed to get homework",
+            error_code="GET_HOMEWORK_ERROR"
+        )
+
+
+@router.patch("/{homework_id}/status", response_model=Union[BaseResponse[HomeworkStatusList], ErrorResponse])
+async def set_homework_status_endpoint(homework_id: int, status: HomeworkStatusUpdate, db: AsyncSession = Depends(get_db), current_user: User = Depends(get_current_user)):
+    """
+    Отметка ученика о выполнении домашнего задания.
+    """
+    try:
+        if current_user.role != UserRole.STUDENT:
+            return error_response(
+                message="You are not allowed to access this resource",
+                error_code="INSUFFICIENT_PERMISSIONS"
+            )
+
+        homework_status = await set_homework_done(db=db, homework_id=homework_id, student_id=current_user.id, is_done=status.is_done)
+        return success_response(
+            data=homework_status,
+            message="Homework status updated successfully"
+        )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
+    except Exception as e:
+        logger.error(f"UPDATE_HOMEWORK_STATUS_ERROR: {e}")
+        return error_response(
+            message="Failed to update homework status",
+            error_code="UPDATE_HOMEWORK_STATUS_ERROR"
+        )
@@ -1,5 +1,6 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
+from app.api.routing import FastJSONRoute
 from app.schemas.subject.subject import SubjectList, SubjectCreate, SubjectUpdate, TeacherWithSubjects
 from app.schemas.base import BaseResponse, ErrorResponse, success_response, error_response
 from app.schemas.user.teacher import UserWithTeacherInfo, Teacher
@@ -9,6 +10,7 @@ from app.db.repositories.subject.subject import subject_repository
 from app.db.repositories.subject.teacher_subject import teacher_subject_repository
 from app.db.repositories.user.teacher import teacher_repository
 from app.core.dependencies import get_db, get_current_user
+from app.services.etag import get_resource_etag, bump_resource_versions, is_not_modified, not_modified_response, set_etag
 from app.schemas.user.user import User, UserRole
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Union
@@ -20,10 +22,11 @@ from app.core.logger import setup_logging
 setup_logging()
 logger = logging.getLogger("app")
 
-router = APIRouter(tags=["subject"])
+router = APIRouter(tags=["subject"], route_class=FastJSONRoute)
 
 @router.get("/", response_model=Union[BaseResponse[List[SubjectList]], ErrorResponse])
-async def get_subjects(skip: int = 0, limit: int = 100, 
+async def get_subjects(request: Request, response: Response,
+                        skip: int = 0, limit: int = 100, 
                         search: str = None, 
                         order_by: str = "created_at", order_direction: str = "desc", 
                         is_active: bool = True,
@@ -34,7 +37,11 @@ async def get_subjects(skip: int = 0, limit: int = 100,
     (Сгенерировано автоматически(C4S))@v1
     """
     try:
+        etag = await get_resource_etag(db, ["subjects"], skip, limit, search, order_by, order_direction, is_active)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
         subjects = await subject_repository.get_all(db=db, skip=skip, limit=limit, search=search, order_by=order_by, order_direction=order_direction, is_active=is_active)
+        set_etag(response, etag)
         return success_response(data=subjects, message="Subjects retrieved successfully")
     except Exception as e:
         logger.error(f"GET_SUBJECTS_ERROR: {e}")
@@ -55,6 +62,7 @@ async def create_subject(subject: SubjectCreate, db: AsyncSession = Depends(get_
             )
             
         subject = await subject_repository.create(db=db, subject=subject)
+        await bump_resource_versions(db, "subjects")
         
         return success_response(data=subject, message="Subject created successfully")
     except ValueError as e:
@@ -86,6 +94,7 @@ async def update_subject(subject_id: int, subject: SubjectUpdate, db: AsyncSessi
             return error_response(message="Subject not found", error_code="SUBJECT_NOT_FOUND")
         
         subject = await subject_repository.update(db=db, db_obj=subject_db, obj_in=subject)
+        await bump_resource_versions(db, "subjects")
         return success_response(data=subject, message="Subject updated successfully")
     except ValueError as e:
         logger.error(f"VALIDATION_ERROR: {e}")
@@ -115,6 +124,7 @@ async def delete_subject(subject_id: int, db: AsyncSession = Depends(get_db), cu
             return error_response(message="Subject is not active", error_code="SUBJECT_IS_NOT_ACTIVE")
         
         await subject_repository.update(db=db, db_obj=subject, obj_in=SubjectUpdate(is_active=False))
+        await bump_resource_versions(db, "subjects")
         return success_response(data=None, message="Subject deleted successfully")
     except Exception as e:
         logger.error(f"DELETE_SUBJECT_ERROR: {e}")
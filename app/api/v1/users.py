@@ -2,6 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Union
 
+from app.api.routing import FastJSONRoute
 from app.core.dependencies import get_current_user
 from app.db.session import get_db
 
@@ -13,13 +14,15 @@ from app.schemas.user.user import User, UserRole, UserDeactivateData, UserRespon
 from app.db.repositories.user.user import user_repository
 from app.db.repositories.user.student import student_repository
 from app.db.repositories.user.teacher import teacher_repository
+from app.services.etag import bump_resource_versions
+from app.services.users import parse_student_fields, student_data
 import logging
 from app.core.logger import setup_logging
 
 setup_logging()
 logger = logging.getLogger("app")
 
-router = APIRouter(tags=["users"])
+router = APIRouter(tags=["users"], route_class=FastJSONRoute)
 
 @router.get("/me", response_model=Union[BaseResponse[User], ErrorResponse])
 async def get_current_user_info(
@@ -38,7 +41,7 @@ async def get_current_user_info(
             error_code="GET_CURRENT_USER_ERROR"
         )
 
-@router.get("/students", response_model=Union[BaseResponse[StudentsListData], ErrorResponse])
+@router.get("/students", response_model=Union[BaseResponse[StudentsListData], ErrorResponse], response_model_exclude_unset=True)
 async def get_user_students(
     skip: int = 0,
     limit: int = 100,
@@ -48,15 +51,19 @@ async def get_user_students(
     order_by: str = "created_at",
     order_direction: str = "desc",
     is_active: bool = None,
+    fields: str = None,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Получение списка студентов с фильтрацией и пагинацией.
+    fields=id,full_name,class_id - вернуть (и выбрать из БД) только эти поля.
     
     (Сгенерировано автоматически(C4S))@v1
     """
     try:
+        user_fields, student_fields = parse_student_fields(fields)
+
         if current_user.role == UserRole.TEACHER:
             teacher_id = current_user.id
         elif current_user.role != UserRole.ADMIN:
@@ -74,27 +81,12 @@ async def get_user_students(
             order_direction=order_direction, 
             is_active=is_active,
             skip=skip,
-            limit=limit
+            limit=limit,
+            user_fields=user_fields,
+            student_fields=student_fields
         )
             
-        students_data = []
-        for student in students:
-            students_data.append({
-                "user_info": {
-                    "id": student.user.id,
-                    "email": student.user.email,
-                    "username": student.user.username,
-                    "full_name": student.user.full_name,
-                    "is_active": student.user.is_active,
-                    "role": student.user.role
-                },
-                "student_info": {
-                    "class_id": student.class_id,
-                    "parent_phone": student.parent_phone,
-                    "parent_email": student.parent_email,
-                    "parent_fio": student.parent_fio
-                }
-            })
+        students_data = [student_data(student, user_fields, student_fields) for student in students]
         
         return success_response(
             data={
@@ -107,6 +99,12 @@ async def get_user_students(
             },
             message="Students retrieved successfully"
         )
+    except ValueError as e:
+        logger.error(f"VALIDATION_ERROR: {e}")
+        return error_response(
+            message=str(e),
+            error_code="VALIDATION_ERROR"
+        )
     except Exception as e:
         logger.error(f"GET_STUDENTS_ERROR: {e}")
         return error_response(
@@ -554,6 +552,7 @@ async def deactivate_user(
                 message="User not found",
                 error_code="USER_NOT_FOUND"
             )
+        await bump_resource_versions(db, "users")
         
         return success_response(
             data=UserDeactivateData(
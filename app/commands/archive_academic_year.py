@@ -0,0 +1,49 @@
+"""
+Архивирование учебного года: секции schedule и grades года отсоединяются
+и переносятся в схему archive. Рабочие таблицы и их индексы остаются
+только с актуальными годами, архив доступен как archive.schedule_yN / archive.grades_yN.
+
+    python -m app.commands.archive_academic_year --year-id ID [--restore]
+"""
+import argparse
+import asyncio
+
+from app.db.models.academic_cycles import AcademicYear
+from app.db.repositories.academic_cycles.partitions import ARCHIVE_SCHEMA, year_partition_repository
+from app.db.session import AsyncSessionLocal
+
+
+async def archive(year_id: int, restore: bool = False) -> None:
+    async with AsyncSessionLocal() as db:
+        year = await db.get(AcademicYear, year_id)
+        if year is None:
+            raise ValueError(f"Academic year {year_id} not found")
+        if restore:
+            if not await year_partition_repository.exists(db=db, table="grades", year_id=year_id, schema=ARCHIVE_SCHEMA):
+                raise ValueError(f"Academic year '{year.name}' is not archived")
+            await year_partition_repository.restore(db=db, year_id=year_id)
+        else:
+            if year.is_current:
+                raise ValueError("Current academic year cannot be archived")
+            if not await year_partition_repository.exists(db=db, table="grades", year_id=year_id):
+                raise ValueError(f"Academic year '{year.name}' has no attached partitions")
+            await year_partition_repository.archive(db=db, year_id=year_id)
+        await db.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive (detach) schedule and grades partitions of an academic year")
+    parser.add_argument("--year-id", type=int, required=True, help="Academic year id")
+    parser.add_argument("--restore", action="store_true", help="Attach archived partitions back")
+    args = parser.parse_args()
+
+    try:
+        asyncio.run(archive(year_id=args.year_id, restore=args.restore))
+    except ValueError as e:
+        parser.error(str(e))
+    action = "Restored" if args.restore else "Archived"
+    print(f"{action} academic year {args.year_id}")
+
+
+if __name__ == "__main__":
+    main()
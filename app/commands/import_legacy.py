@@ -0,0 +1,38 @@
+"""
+Импорт CSV из старой системы (для больших файлов, без HTTP-запроса).
+
+    python -m app.commands.import_legacy {students,schedule,homework,grades} FILE
+"""
+import argparse
+import asyncio
+
+from app.db.session import AsyncSessionLocal
+from app.schemas.admin.admin import ImportReport
+from app.services.imports import IMPORT_KINDS, import_csv
+
+
+async def run(kind: str, path: str) -> ImportReport:
+    async with AsyncSessionLocal() as db:
+        with open(path, "rb") as stream:
+            report = await import_csv(db=db, kind=kind, stream=stream)
+        await db.commit()
+        return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import legacy CSV data")
+    parser.add_argument("kind", choices=list(IMPORT_KINDS))
+    parser.add_argument("path", help="CSV file (UTF-8, header row)")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args.kind, args.path))
+    print(
+        f"Rows: {report.total_rows}, imported: {report.imported}, "
+        f"skipped: {report.skipped}, rejected: {report.rejected_count}"
+    )
+    for row in report.rejected:
+        print(f"  line {row.line}: {row.error}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+"""
+Полная пересборка таблицы grade_averages из grades.
+
+    python -m app.commands.rebuild_grade_averages [--period-id ID]
+"""
+import argparse
+import asyncio
+
+from app.db.session import AsyncSessionLocal
+from app.db.repositories.schedule.grade_average import grade_average_repository
+
+
+async def rebuild(period_id: int = None) -> int:
+    async with AsyncSessionLocal() as db:
+        rows = await grade_average_repository.rebuild(db=db, period_id=period_id)
+        await db.commit()
+        return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild grade averages rollup")
+    parser.add_argument("--period-id", type=int, default=None, help="Rebuild only one academic period")
+    args = parser.parse_args()
+
+    rows = asyncio.run(rebuild(period_id=args.period_id))
+    print(f"Rebuilt {rows} grade average rows")
+
+
+if __name__ == "__main__":
+    main()
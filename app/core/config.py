@@ -12,6 +12,9 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str = os.getenv("DATABASE_URL")
     DATABASE_URL_MIGRATE: str = os.getenv("DATABASE_URL_MIGRATE")
+    DATABASE_REPLICA_URLS: str = os.getenv("DATABASE_REPLICA_URLS", "")
+    REPLICA_HEALTH_CHECK_INTERVAL: float = os.getenv("REPLICA_HEALTH_CHECK_INTERVAL", 5)
+    READ_YOUR_WRITES_SECONDS: float = os.getenv("READ_YOUR_WRITES_SECONDS", 5)
     
     SECRET_KEY: str = os.getenv("SECRET_KEY", 'temp_secret')
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
@@ -32,6 +35,41 @@ class Settings(BaseSettings):
             self.MINIO_EXTERNAL_ENDPOINT = self.MINIO_ENDPOINT
         return self
 
+    ANALYTICS_CACHE_TTL: int = os.getenv("ANALYTICS_CACHE_TTL", 300)
+    AT_RISK_MEAN_THRESHOLD: float = os.getenv("AT_RISK_MEAN_THRESHOLD", 3.0)
+    AT_RISK_TREND_THRESHOLD: float = os.getenv("AT_RISK_TREND_THRESHOLD", -0.02)
+    AT_RISK_MIN_GRADES: int = os.getenv("AT_RISK_MIN_GRADES", 4)
+    DIARY_CACHE_TTL: int = os.getenv("DIARY_CACHE_TTL", 60)
+    ETAG_VERSION_TTL: float = os.getenv("ETAG_VERSION_TTL", 2)
+
+    NPLUSONE_DETECTION: str = os.getenv("NPLUSONE_DETECTION", "off")
+    NPLUSONE_THRESHOLD: int = os.getenv("NPLUSONE_THRESHOLD", 3)
+
+    LOG_LEVEL: str = os.getenv("LOG_LEVEL", "DEBUG")
+    LOG_FORMAT: str = os.getenv("LOG_FORMAT", "json")
+    LOG_DEBUG_SAMPLE_RATE: float = os.getenv("LOG_DEBUG_SAMPLE_RATE", 1.0)
+
+    PROFILING_INTERVAL_MS: int = os.getenv("PROFILING_INTERVAL_MS", 5)
+    PROFILING_MAX_SECONDS: int = os.getenv("PROFILING_MAX_SECONDS", 60)
+
+    COMPRESSION_MIN_SIZE: int = os.getenv("COMPRESSION_MIN_SIZE", 1024)
+    COMPRESSION_THREAD_MIN_SIZE: int = os.getenv("COMPRESSION_THREAD_MIN_SIZE", 65536)
+    COMPRESSION_GZIP_LEVEL: int = os.getenv("COMPRESSION_GZIP_LEVEL", 6)
+    COMPRESSION_BROTLI_QUALITY: int = os.getenv("COMPRESSION_BROTLI_QUALITY", 4)
+
+    BULK_COPY_THRESHOLD: int = os.getenv("BULK_COPY_THRESHOLD", 1000)
+    EXPORT_BATCH_SIZE: int = os.getenv("EXPORT_BATCH_SIZE", 1000)
+    EXPORT_CHUNK_SIZE: int = os.getenv("EXPORT_CHUNK_SIZE", 65536)
+    IMPORT_BATCH_SIZE: int = os.getenv("IMPORT_BATCH_SIZE", 10000)
+    IMPORT_MAX_REPORTED_ERRORS: int = os.getenv("IMPORT_MAX_REPORTED_ERRORS", 1000)
+    ACADEMIC_HOLIDAYS: str = os.getenv("ACADEMIC_HOLIDAYS", "10-27:11-04,12-29:01-11,03-23:03-31")
+
+    DB_ECHO: bool = os.getenv("DB_ECHO", "false").lower() == "true"
+    SLOW_QUERY_THRESHOLD_MS: int = os.getenv("SLOW_QUERY_THRESHOLD_MS", 200)
+    SLOW_QUERY_EXPLAIN: bool = os.getenv("SLOW_QUERY_EXPLAIN", "false").lower() == "true"
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = os.getenv("SLOW_QUERY_EXPLAIN_SAMPLE_RATE", 0.1)
+    SLOW_QUERY_BUFFER_SIZE: int = os.getenv("SLOW_QUERY_BUFFER_SIZE", 100)
+
     MAIL_USERNAME: Optional[str] = os.getenv("MAIL_USERNAME")
     MAIL_PASSWORD: Optional[str] = os.getenv("MAIL_PASSWORD")
     MAIL_FROM: Optional[str] = os.getenv("MAIL_FROM")
@@ -4,7 +4,7 @@ from jose import JWTError, jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.schemas.auth.auth import TokenData
 from app.services.auth import get_user_by_id
 
@@ -1,17 +1,98 @@
+import atexit
+import copy
+import json
 import logging
-from logging.handlers import RotatingFileHandler
+import queue
+import random
 import sys
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
+
+from app.core.config import settings
+from app.core.request_context import get_request_stats
+
+_listener: Optional[QueueListener] = None
+
+# Атрибуты LogRecord, которые не попадают в JSON как дополнительные поля
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+_LEVELS = {"WARNING": "warn", "CRITICAL": "fatal"}
+
+
+class JsonFormatter(logging.Formatter):
+    """JSON-строки в формате логов Caddy: level, ts, logger, msg и поля записи"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "level": _LEVELS.get(record.levelname, record.levelname.lower()),
+            "ts": record.created,
+            "logger": record.name,
+            "caller": f"{record.module}:{record.lineno}",
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["error"] = record.exc_text
+        if record.stack_info:
+            entry["stack"] = record.stack_info
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class RequestContextFilter(logging.Filter):
+    """Добавляет request_id текущего HTTP-запроса (вызывается в потоке приложения)"""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not hasattr(record, "request_id"):
+            stats = get_request_stats()
+            if stats is not None:
+                record.request_id = stats.request_id
+        return True
+
+
+class DebugSamplingFilter(logging.Filter):
+    """Пропускает только долю DEBUG-записей, остальные уровни - полностью"""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.rate >= 1 or random.random() < self.rate
+
+
+class _QueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Форматирование остается обработчикам в фоновом потоке,
+        # здесь только фиксируется текст сообщения и трейсбек.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
 
 def setup_logging():
+    """
+    Настраивает логгер "app" один раз: записи кладутся в очередь,
+    запись на диск и в stdout выполняет фоновый поток QueueListener.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
-    
-    fmt = "%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s"
-    formatter = logging.Formatter(fmt)
 
-    logger = logging.getLogger("app")
-    logger.setLevel(logging.DEBUG)
+    if settings.LOG_FORMAT == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter("%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s")
 
     handlers = [
         RotatingFileHandler(
@@ -21,11 +102,22 @@ def setup_logging():
         ),
         logging.StreamHandler(sys.stdout)
     ]
-
     for handler in handlers:
         handler.setFormatter(formatter)
-        logger.addHandler(handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = _QueueHandler(log_queue)
+    queue_handler.addFilter(RequestContextFilter())
+    queue_handler.addFilter(DebugSamplingFilter(settings.LOG_DEBUG_SAMPLE_RATE))
+
+    logger = logging.getLogger("app")
+    logger.setLevel(settings.LOG_LEVEL.upper())
+    logger.addHandler(queue_handler)
+
+    _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
 
     logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
     logging.getLogger("uvicorn").setLevel(logging.INFO)
-    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
\ No newline at end of file
+    logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -0,0 +1,89 @@
+import os
+import time
+from functools import wraps
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest, multiprocess
+)
+
+# При нескольких воркерах uvicorn метрики пишутся в файлы каталога
+# PROMETHEUS_MULTIPROC_DIR и собираются при каждом запросе /metrics.
+MULTIPROCESS = bool(os.getenv("PROMETHEUS_MULTIPROC_DIR"))
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being processed",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out_connections",
+    "Connections checked out from the SQLAlchemy pool",
+    ["database"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow_connections",
+    "Connections opened above the SQLAlchemy pool size",
+    ["database"],
+    multiprocess_mode="livesum",
+)
+SQL_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "SQL statement execution time",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+MINIO_LATENCY = Histogram(
+    "minio_operation_duration_seconds",
+    "MinIO operation latency",
+    ["operation", "outcome"],
+)
+MAIL_SENT = Counter(
+    "mail_send_total",
+    "Outgoing emails by outcome",
+    ["outcome"],
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hashing and verification time",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1),
+)
+
+
+def observe_minio(operation: str):
+    """Декоратор для методов MinioService: время операции с меткой результата"""
+    def decorator(func):
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await func(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                MINIO_LATENCY.labels(operation=operation, outcome=outcome).observe(time.perf_counter() - started)
+        return wrapper
+    return decorator
+
+
+def statement_operation(statement: str) -> str:
+    """Тип SQL-запроса (select, insert, ...) для метки гистограммы"""
+    operation = statement.lstrip().split(None, 1)[0].lower() if statement.strip() else "unknown"
+    return operation if operation in ("select", "insert", "update", "delete", "with") else "other"
+
+
+def render_metrics() -> tuple[bytes, str]:
+    if MULTIPROCESS:
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,105 @@
+import asyncio
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter, OrderedDict
+from typing import List, Optional
+
+
+class StackSampler:
+    """
+    Сэмплирующий CPU-профайлер: фоновый поток с заданным интервалом снимает
+    стеки потоков процесса (sys._current_frames) и считает одинаковые стеки.
+    Результат - collapsed stacks, совместимые с flamegraph.pl и speedscope.
+    """
+
+    def __init__(self, interval: float = 0.005, thread_id: Optional[int] = None):
+        self.interval = interval
+        self.thread_id = thread_id
+        self.counts: Counter = Counter()
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "StackSampler":
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> str:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        return self.collapsed()
+
+    def _run(self) -> None:
+        own_id = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id or (self.thread_id is not None and thread_id != self.thread_id):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                    frame = frame.f_back
+                self.counts[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        return "\n".join(f"{stack} {count}" for stack, count in self.counts.most_common())
+
+
+class ProfileStore:
+    """Последние профили отдельных запросов (по заголовку X-Profile)"""
+
+    def __init__(self, maxsize: int = 20):
+        self.maxsize = maxsize
+        self._profiles: "OrderedDict[str, str]" = OrderedDict()
+
+    def add(self, profile_id: str, collapsed: str) -> None:
+        self._profiles[profile_id] = collapsed
+        while len(self._profiles) > self.maxsize:
+            self._profiles.popitem(last=False)
+
+    def get(self, profile_id: str) -> Optional[str]:
+        return self._profiles.get(profile_id)
+
+    def list(self) -> List[str]:
+        return list(reversed(self._profiles))
+
+
+request_profiles = ProfileStore()
+cpu_profile_lock = asyncio.Lock()
+
+_memory_baseline: Optional[tracemalloc.Snapshot] = None
+
+
+def take_memory_baseline(frames: int = 10) -> int:
+    """Включает tracemalloc (если выключен) и запоминает снимок для сравнения"""
+    global _memory_baseline
+    if not tracemalloc.is_tracing():
+        tracemalloc.start(frames)
+    _memory_baseline = tracemalloc.take_snapshot()
+    return len(_memory_baseline.traces)
+
+
+def memory_diff(limit: int = 25, key_type: str = "lineno") -> List[str]:
+    """Самые заметные изменения выделений памяти относительно снимка-базы"""
+    if _memory_baseline is None or not tracemalloc.is_tracing():
+        raise ValueError("Memory baseline is not taken")
+    snapshot = tracemalloc.take_snapshot()
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ]
+    stats = snapshot.filter_traces(filters).compare_to(_memory_baseline.filter_traces(filters), key_type)
+    return [str(stat) for stat in stats[:limit]]
+
+
+def stop_memory_tracing() -> None:
+    global _memory_baseline
+    _memory_baseline = None
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
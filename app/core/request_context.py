@@ -0,0 +1,52 @@
+import time
+import uuid
+from collections import Counter
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+
+@dataclass
+class RequestStats:
+    """Метрики текущего запроса: время выполнения и SQL-запросы"""
+    method: str
+    path: str
+    request_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    route: Optional[str] = None
+    started_at: float = field(default_factory=time.perf_counter)
+    db_count: int = 0
+    db_time: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+    rollback: bool = False
+    nplusone: List[str] = field(default_factory=list)
+
+    def record_query(self, statement: str, elapsed: float) -> None:
+        self.db_count += 1
+        self.db_time += elapsed
+        self.statements[statement] += 1
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started_at
+
+
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def get_request_stats() -> Optional[RequestStats]:
+    return _request_stats.get()
+
+
+def start_request(stats: RequestStats) -> Token:
+    return _request_stats.set(stats)
+
+
+def finish_request(token: Token) -> None:
+    _request_stats.reset(token)
+
+
+def mark_rollback() -> None:
+    """Транзакция текущего запроса будет откачена вместо фиксации"""
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.rollback = True
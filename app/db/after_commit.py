@@ -0,0 +1,32 @@
+from typing import Any, Callable
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+AFTER_COMMIT_KEY = "after_commit"
+
+
+def after_commit(db: AsyncSession, callback: Callable[..., Any], *args: Any, **kwargs: Any) -> None:
+    """
+    Выполняет callback после фиксации транзакции сессии, при откате - отбрасывает.
+    Сброс кэшей воркера до commit позволил бы параллельному запросу снова
+    закэшировать незафиксированное состояние на весь TTL.
+    """
+    db.info.setdefault(AFTER_COMMIT_KEY, []).append((callback, args, kwargs))
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    # Освобождение SAVEPOINT еще не фиксирует данные
+    if session.in_nested_transaction():
+        return
+    for callback, args, kwargs in session.info.pop(AFTER_COMMIT_KEY, []):
+        callback(*args, **kwargs)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_after_rollback(session: Session, transaction: SessionTransaction) -> None:
+    # after_commit срабатывает раньше, здесь остаются только действия откаченной транзакции
+    if transaction.parent is None:
+        session.info.pop(AFTER_COMMIT_KEY, None)
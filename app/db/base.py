@@ -1,12 +1,18 @@
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Sequence, Type, TypeVar, Union
 
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import column, delete, insert, select, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.ext.declarative import declarative_base, DeclarativeMeta
 
+from app.core.config import settings
+
 Base = declarative_base()
 
+# Предел параметров одного запроса в протоколе PostgreSQL (asyncpg)
+MAX_BIND_PARAMS = 32767
+
 ModelType = TypeVar("ModelType", bound=DeclarativeMeta)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
@@ -29,20 +35,18 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         return result.scalars().all()
 
     async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        """
+        Только flush: первичный ключ и серверные значения приходят из
+        INSERT ... RETURNING, фиксирует транзакцию get_db в конце запроса.
+        """
         obj_in_data = obj_in.model_dump()
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        await db.flush()
         return db_obj
 
     async def create_without_commit(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
-        obj_in_data = obj_in.model_dump()
-        db_obj = self.model(**obj_in_data)
-        db.add(db_obj)
-        await db.flush() 
-        await db.refresh(db_obj)
-        return db_obj
+        return await self.create(db=db, obj_in=obj_in)
 
     async def update(
         self,
@@ -60,12 +64,171 @@ class BaseRepository(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             if field in update_data:
                 setattr(db_obj, field, update_data[field])
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        await db.flush()
         return db_obj
 
     async def remove(self, db: AsyncSession, *, id: int) -> ModelType:
-        obj = await self.get(db=db, id=id)
+        # db.get берет объект из сессии без SELECT, если он уже загружен;
+        # удаление через ORM сохраняет обработку связей
+        obj = await db.get(self.model, id)
         await db.delete(obj)
-        await db.commit()
-        return obj 
\ No newline at end of file
+        await db.flush()
+        return obj
+
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        *,
+        returning: bool = True
+    ) -> Union[List[ModelType], int]:
+        """
+        Вставка набора строк. С returning - многострочный INSERT ... RETURNING,
+        возвращает созданные объекты. Без returning от BULK_COPY_THRESHOLD строк
+        данные передаются через COPY (asyncpg), возвращается число строк.
+        """
+        rows = self._rows(objs_in)
+        if not rows:
+            return [] if returning else 0
+        if returning:
+            result = await db.scalars(insert(self.model).returning(self.model), rows)
+            return result.all()
+        if len(rows) >= settings.BULK_COPY_THRESHOLD:
+            conn = await db.connection()
+            if conn.dialect.driver == "asyncpg":
+                return await self._copy(conn, rows)
+        await db.execute(insert(self.model.__table__), rows)
+        return len(rows)
+
+    async def bulk_update(
+        self,
+        db: AsyncSession,
+        rows: Sequence[Dict[str, Any]],
+        *,
+        key: str = "id"
+    ) -> int:
+        """
+        Обновление набора строк UPDATE ... FROM (VALUES ...) по ключу key,
+        пачками в пределах MAX_BIND_PARAMS параметров в текущей транзакции.
+        У всех строк должен быть одинаковый набор полей. Уже загруженные
+        в сессию объекты не обновляются. Возвращает число обновленных строк.
+        """
+        rows = self._rows(rows)
+        if not rows:
+            return 0
+        table = self.model.__table__
+        columns = list(rows[0])
+        if key not in columns or len(columns) < 2:
+            raise ValueError(f"Rows must contain '{key}' and at least one field to update")
+        updated = 0
+        for batch in self._batches(rows, len(columns)):
+            data = values(*(column(name, table.c[name].type) for name in columns), name="data").data(
+                [tuple(row[name] for name in columns) for row in batch]
+            )
+            query = (
+                update(table)
+                .where(table.c[key] == data.c[key])
+                .values({name: data.c[name] for name in columns if name != key})
+            )
+            result = await db.execute(query)
+            updated += result.rowcount
+        return updated
+
+    async def bulk_upsert(
+        self,
+        db: AsyncSession,
+        objs_in: Sequence[Union[CreateSchemaType, Dict[str, Any]]],
+        *,
+        index_elements: Sequence[str],
+        update_fields: Optional[Sequence[str]] = None,
+        returning: bool = False
+    ) -> Union[List[ModelType], int]:
+        """
+        INSERT ... ON CONFLICT (index_elements) DO UPDATE. По умолчанию
+        обновляются все переданные поля, кроме ключа; пустой update_fields -
+        DO NOTHING. Строки отправляются пачками в пределах MAX_BIND_PARAMS
+        параметров в текущей транзакции.
+        """
+        rows = self._rows(objs_in)
+        if not rows:
+            return [] if returning else 0
+        if update_fields is None:
+            update_fields = [name for name in rows[0] if name not in index_elements]
+        created: List[ModelType] = []
+        upserted = 0
+        # Значения по умолчанию на стороне Python тоже становятся параметрами,
+        # поэтому пачка считается по всем колонкам таблицы
+        for batch in self._batches(rows, len(self.model.__table__.columns)):
+            query = pg_insert(self.model).values(batch)
+            if update_fields:
+                query = query.on_conflict_do_update(
+                    index_elements=list(index_elements),
+                    set_={name: query.excluded[name] for name in update_fields}
+                )
+            else:
+                query = query.on_conflict_do_nothing(index_elements=list(index_elements))
+            if returning:
+                result = await db.scalars(
+                    query.returning(self.model),
+                    execution_options={"populate_existing": True}
+                )
+                created.extend(result.all())
+            else:
+                result = await db.execute(query)
+                upserted += result.rowcount
+        return created if returning else upserted
+
+    async def delete_where(self, db: AsyncSession, *criteria: Any) -> int:
+        """
+        DELETE по условиям одним запросом, без выборки объектов.
+        Связи ORM не обрабатываются - каскады только на уровне БД.
+        """
+        if not criteria:
+            raise ValueError("delete_where requires at least one condition")
+        result = await db.execute(
+            delete(self.model).where(*criteria).execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+
+    def _rows(self, objs_in: Sequence[Union[BaseModel, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        rows = [obj.model_dump() if isinstance(obj, BaseModel) else dict(obj) for obj in objs_in]
+        if rows:
+            columns = set(rows[0])
+            if any(set(row) != columns for row in rows):
+                raise ValueError("All rows must have the same fields")
+        return rows
+
+    @staticmethod
+    def _batches(rows: List[Dict[str, Any]], params_per_row: int) -> List[List[Dict[str, Any]]]:
+        size = max(1, MAX_BIND_PARAMS // max(1, params_per_row))
+        return [rows[start:start + size] for start in range(0, len(rows), size)]
+
+    async def _copy(self, conn, rows: List[Dict[str, Any]]) -> int:
+        # COPY не вычисляет значения по умолчанию на стороне Python
+        # (default=datetime.now и т.п.) и не применяет типы SQLAlchemy,
+        # поэтому и то и другое делается здесь
+        table = self.model.__table__
+        defaults = {
+            col.name: col.default
+            for col in table.columns
+            if col.name not in rows[0] and col.default is not None and not col.default.is_sequence
+        }
+        names = list(rows[0]) + list(defaults)
+        processors = {name: table.c[name].type.bind_processor(conn.dialect) for name in names}
+        records = []
+        for row in rows:
+            record = []
+            for name in names:
+                if name in row:
+                    value = row[name]
+                else:
+                    default = defaults[name]
+                    value = default.arg(None) if default.is_callable else default.arg
+                processor = processors[name]
+                record.append(processor(value) if processor is not None and value is not None else value)
+            records.append(tuple(record))
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table.name, schema_name=table.schema, records=records, columns=names
+        )
+        return len(records) 
\ No newline at end of file
@@ -0,0 +1,46 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.metrics import DB_POOL_CHECKED_OUT, DB_POOL_OVERFLOW, SQL_DURATION, statement_operation
+from app.core.config import settings
+from app.core.request_context import get_request_stats
+from app.db.slow_queries import slow_query_log
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    SQL_DURATION.labels(operation=statement_operation(statement)).observe(elapsed)
+    stats = get_request_stats()
+    if stats is not None:
+        stats.record_query(statement, elapsed)
+    if elapsed * 1000 >= settings.SLOW_QUERY_THRESHOLD_MS:
+        slow_query_log.record(statement, parameters, elapsed)
+
+
+def _handle_error(exception_context):
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def instrument_engine(engine: Engine, database: str = "primary") -> None:
+    """Подключает учет SQL-запросов и состояния пула соединений к синхронному движку"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+    pool = engine.pool
+
+    def update_pool_metrics(*args):
+        if hasattr(pool, "checkedout"):
+            DB_POOL_CHECKED_OUT.labels(database=database).set(pool.checkedout())
+            DB_POOL_OVERFLOW.labels(database=database).set(max(pool.overflow(), 0))
+
+    event.listen(engine, "checkout", update_pool_metrics)
+    event.listen(engine, "checkin", update_pool_metrics)
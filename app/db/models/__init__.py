@@ -3,6 +3,7 @@ from .class_ import Class
 from .subject import Subject, TeacherSubject
 from .file import File
 from .academic_cycles import AcademicYear, AcademicPeriod, AcademicWeek
-from .schedule import LessonTimes, Schedule, Homework, Grade
+from .schedule import LessonTimes, Schedule, Homework, HomeworkStatus, Grade, GradeAverage
+from .resource_version import ResourceVersion
 
-__all__ = ["User", "Student", "Teacher", "UserInvite", "Class", "Subject", "TeacherSubject", "File", "AcademicYear", "AcademicPeriod", "AcademicWeek", "LessonTimes", "Schedule", "Homework", "Grade"]
\ No newline at end of file
+__all__ = ["User", "Student", "Teacher", "UserInvite", "Class", "Subject", "TeacherSubject", "File", "AcademicYear", "AcademicPeriod", "AcademicWeek", "LessonTimes", "Schedule", "Homework", "HomeworkStatus", "Grade", "GradeAverage", "ResourceVersion"]
\ No newline at end of file
@@ -1,5 +1,5 @@
 from app.db.base import Base
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Date
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Date, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -33,6 +33,10 @@ class AcademicPeriod(Base):
 
 class AcademicWeek(Base):
     __tablename__ = "academic_weeks"
+    __table_args__ = (
+        # Поиск недели по дате внутри периода - одна проба индекса
+        Index("ix_academic_weeks_period_start", "period_id", "start_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     period_id = Column(Integer, ForeignKey("academic_periods.id"), nullable=False)
@@ -27,6 +27,7 @@ class Class(Base):
     students = relationship("Student", back_populates="class_")
     teacher = relationship("Teacher", back_populates="class_", uselist=False)
     schedule = relationship("Schedule", back_populates="class_")
+    homework = relationship("Homework", back_populates="class_")
     class_history = relationship("StudentClassHistory", back_populates="class_")
     promotions_from = relationship("ClassPromotion", back_populates="from_class", foreign_keys="[ClassPromotion.from_class_id]")
     promotions_to = relationship("ClassPromotion", back_populates="to_class", foreign_keys="[ClassPromotion.to_class_id]")
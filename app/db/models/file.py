@@ -18,4 +18,7 @@ class File(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
-    homework = relationship("Homework", back_populates="file")
\ No newline at end of file
+    homework = relationship("Homework", back_populates="file")
+
+    # updated_at вычисляется в БД при UPDATE: забираем его через RETURNING вместо refresh
+    __mapper_args__ = {"eager_defaults": True}
\ No newline at end of file
@@ -0,0 +1,13 @@
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class ResourceVersion(Base):
+    """Версия ресурса для ETag: увеличивается при каждой записи в ресурс"""
+    __tablename__ = "resource_versions"
+
+    key = Column(String(100), primary_key=True)
+    version = Column(BigInteger, nullable=False, server_default="0")
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -1,5 +1,8 @@
 from app.db.base import Base
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean, Text, Time
+from sqlalchemy import (
+    Column, Integer, String, DateTime, ForeignKey, ForeignKeyConstraint, Boolean, Text, Time, Index, Numeric,
+    Computed, text
+)
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -16,9 +19,14 @@ class LessonTimes(Base):
     period = relationship("AcademicPeriod", back_populates="lesson_times")
     schedule = relationship("Schedule", back_populates="lesson_time")
 class Schedule(Base):
+    """
+    Уроки. Таблица секционирована по учебному году (LIST по year_id):
+    ключ секционирования входит в первичный ключ, ORM различает строки по id.
+    """
     __tablename__ = "schedule"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    year_id = Column(Integer, ForeignKey("academic_years.id"), primary_key=True)
     week_id = Column(Integer, ForeignKey("academic_weeks.id"), nullable=False)
     lesson_time_id = Column(Integer, ForeignKey("lesson_times.id"), nullable=False)
     class_id = Column(Integer, ForeignKey("classes.id"), nullable=False)
@@ -36,8 +44,17 @@ class Schedule(Base):
     lesson_time = relationship("LessonTimes", back_populates="schedule")
     class_ = relationship("Class", back_populates="schedule")
     subject = relationship("Subject", back_populates="schedule")
-    homework = relationship("Homework", back_populates="schedule")
+    homework = relationship(
+        "Homework",
+        primaryjoin="Schedule.id == foreign(Homework.schedule_id)",
+        back_populates="schedule"
+    )
     grades = relationship("Grade", back_populates="schedule")
+
+    __table_args__ = (
+        {"postgresql_partition_by": "LIST (year_id)"},
+    )
+    __mapper_args__ = {"primary_key": [id]}
     
     teacher = relationship(
         "Teacher", 
@@ -54,38 +71,100 @@ class Homework(Base):
     __tablename__ = "homework"
 
     id = Column(Integer, primary_key=True, index=True)
-    schedule_id = Column(Integer, ForeignKey("schedule.id"), nullable=False)
+    # Без внешнего ключа: schedule секционирована, ключ урока - (id, year_id)
+    schedule_id = Column(Integer, nullable=False)
+    class_id = Column(Integer, ForeignKey("classes.id"), nullable=False)
     teacher_id = Column(Integer, ForeignKey("teachers.user_id"), nullable=False)
-    student_id = Column(Integer, ForeignKey("students.user_id"), nullable=False)
     subject_id = Column(Integer, ForeignKey("subjects.id"), nullable=False)
     description = Column(String, nullable=False)
     assignment_at = Column(DateTime, nullable=False)
     due_date = Column(DateTime, nullable=True)
-    is_done = Column(Boolean, default=False)    
     created_at = Column(DateTime, default=datetime.now)
     file_id = Column(Integer, ForeignKey("files.id"), nullable=True)
     
-    schedule = relationship("Schedule", back_populates="homework")
-    student = relationship("Student", back_populates="homework")
+    schedule = relationship(
+        "Schedule",
+        primaryjoin="foreign(Homework.schedule_id) == Schedule.id",
+        back_populates="homework"
+    )
+    class_ = relationship("Class", back_populates="homework")
     subject = relationship("Subject", back_populates="homework")
     teacher = relationship("Teacher", back_populates="homework")
     file = relationship("File", back_populates="homework")
     grades = relationship("Grade", back_populates="homework")
+    statuses = relationship("HomeworkStatus", back_populates="homework", passive_deletes=True)
+class HomeworkStatus(Base):
+    __tablename__ = "homework_statuses"
+
+    homework_id = Column(Integer, ForeignKey("homework.id", ondelete="CASCADE"), primary_key=True)
+    student_id = Column(Integer, ForeignKey("students.user_id"), primary_key=True)
+    due_date = Column(DateTime, nullable=True)
+    is_done = Column(Boolean, nullable=False, default=False, server_default="false")
+    done_at = Column(DateTime, nullable=True)
+
+    homework = relationship("Homework", back_populates="statuses")
+    student = relationship("Student", back_populates="homework_statuses")
+
+    __table_args__ = (
+        Index("ix_homework_statuses_student_due", "student_id", "due_date"),
+    )
 class Grade(Base):
+    """Оценки. Секционирована по учебному году, как и schedule"""
     __tablename__ = "grades"
 
-    id = Column(Integer, primary_key=True, index=True)
-    schedule_id = Column(Integer, ForeignKey("schedule.id"), nullable=False)
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    year_id = Column(Integer, primary_key=True)
+    schedule_id = Column(Integer, nullable=False)
     student_id = Column(Integer, ForeignKey("students.user_id"), nullable=False)
     subject_id = Column(Integer, ForeignKey("subjects.id"), nullable=False)
     teacher_id = Column(Integer, ForeignKey("teachers.user_id"), nullable=False)
     homework_id = Column(Integer, ForeignKey("homework.id"), nullable=True)
     comment = Column(Text, nullable=True)
     score = Column(Integer, nullable=False)
+    weight = Column(Integer, nullable=False, default=1, server_default="1")
     created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    __table_args__ = (
+        # Одна оценка за работу на уроке на ученика: цель для ON CONFLICT при массовом выставлении
+        Index(
+            "uq_grades_schedule_student_lesson",
+            "schedule_id", "student_id", "year_id",
+            unique=True,
+            postgresql_where=text("homework_id IS NULL")
+        ),
+        ForeignKeyConstraint(
+            ["schedule_id", "year_id"], ["schedule.id", "schedule.year_id"],
+            name="fk_grades_schedule_year"
+        ),
+        {"postgresql_partition_by": "LIST (year_id)"},
+    )
+    __mapper_args__ = {"primary_key": [id]}
     
     schedule = relationship("Schedule", back_populates="grades")
     student = relationship("Student", back_populates="grades")
     subject = relationship("Subject", back_populates="grades")
     teacher = relationship("Teacher", back_populates="grades")
-    homework = relationship("Homework", back_populates="grades")
\ No newline at end of file
+    homework = relationship("Homework", back_populates="grades")
+
+class GradeAverage(Base):
+    """
+    Агрегат оценок ученика по предмету за период. Поддерживается триггером
+    на таблице grades, пересобирается командой app.commands.rebuild_grade_averages.
+    """
+    __tablename__ = "grade_averages"
+
+    student_id = Column(Integer, ForeignKey("students.user_id"), primary_key=True)
+    subject_id = Column(Integer, ForeignKey("subjects.id"), primary_key=True)
+    period_id = Column(Integer, ForeignKey("academic_periods.id"), primary_key=True)
+    grades_count = Column(Integer, nullable=False, default=0)
+    score_sum = Column(Integer, nullable=False, default=0)
+    weighted_sum = Column(Integer, nullable=False, default=0)
+    weight_sum = Column(Integer, nullable=False, default=0)
+    average = Column(Numeric(4, 2), Computed("round(weighted_sum::numeric / NULLIF(weight_sum, 0), 2)"))
+    last_grade_id = Column(Integer, nullable=True)
+    last_score = Column(Integer, nullable=True)
+    last_graded_at = Column(DateTime, nullable=True)
+    updated_at = Column(DateTime, default=datetime.now)
+
+    subject = relationship("Subject", viewonly=True)
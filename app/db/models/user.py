@@ -37,7 +37,7 @@ class Student(Base):
 
     user = relationship("User", back_populates="student", uselist=False)
     class_ = relationship("Class", back_populates="students", uselist=False)
-    homework = relationship("Homework", back_populates="student")
+    homework_statuses = relationship("HomeworkStatus", back_populates="student")
     grades = relationship("Grade", back_populates="student")
     class_history = relationship("StudentClassHistory", back_populates="student")
 
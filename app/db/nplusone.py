@@ -0,0 +1,73 @@
+import logging
+from contextlib import contextmanager
+from typing import Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.core.config import settings
+from app.core.request_context import RequestStats, get_request_stats, start_request, finish_request
+
+logger = logging.getLogger("app.nplusone")
+
+
+class NPlusOneError(Exception):
+    pass
+
+
+def _report(message: str) -> None:
+    if settings.NPLUSONE_DETECTION not in ("log", "raise"):
+        return
+    stats = get_request_stats()
+    if stats is not None:
+        message = f"{message} [{stats.method} {stats.route or stats.path}, request_id={stats.request_id}]"
+    if settings.NPLUSONE_DETECTION == "raise":
+        # Исключение может перехватить эндпоинт (except Exception -> error_response),
+        # поэтому нарушение запоминается: RequestTimingMiddleware заменит ответ на 500
+        if stats is not None:
+            stats.nplusone.append(message)
+        raise NPlusOneError(message)
+    logger.warning(message, stack_info=True)
+
+
+def _on_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    if orm_execute_state.lazy_loaded_from is None:
+        return
+    path = orm_execute_state.loader_strategy_path
+    relationship = path[-1] if path else orm_execute_state.lazy_loaded_from.class_.__name__
+    _report(f"Lazy load of {relationship}, add an eager loading option to the query")
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = get_request_stats()
+    if stats is None or executemany:
+        return
+    if stats.statements[statement] == settings.NPLUSONE_THRESHOLD:
+        _report(f"Statement executed {settings.NPLUSONE_THRESHOLD} times in one request: {statement}")
+
+
+def install_nplusone_detector(engine: Engine) -> None:
+    """
+    Включает детектор N+1: ленивые загрузки связей и повторы одного SQL-запроса
+    в рамках запроса. Режим NPLUSONE_DETECTION: off, log (предупреждение со стеком)
+    или raise (исключение и ответ 500, для тестов и CI). Повторный вызов не
+    добавляет обработчики второй раз.
+    """
+    if settings.NPLUSONE_DETECTION not in ("log", "raise"):
+        return
+    if not event.contains(Session, "do_orm_execute", _on_orm_execute):
+        event.listen(Session, "do_orm_execute", _on_orm_execute)
+    if not event.contains(engine, "after_cursor_execute", _after_cursor_execute):
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+@contextmanager
+def track_queries(name: str = "test") -> Iterator[RequestStats]:
+    """Область учета запросов вне HTTP-запроса (тесты, команды)"""
+    stats = RequestStats(method="SCOPE", path=name)
+    token = start_request(stats)
+    try:
+        yield stats
+    finally:
+        finish_request(token)
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import time
+from typing import List, Optional
+
+from jose import JWTError, jwt
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import sessionmaker
+
+from app.core.cache import TTLCache
+
+logger = logging.getLogger("app.db")
+
+# Ключ session.info, по которому видно, что сессия читает из реплики
+REPLICA_KEY = "replica"
+
+
+class Replica:
+    def __init__(self, name: str, engine: AsyncEngine):
+        self.name = name
+        self.engine = engine
+        self.session_factory = sessionmaker(
+            engine, class_=AsyncSession, expire_on_commit=False, info={REPLICA_KEY: name}
+        )
+        self.healthy = True
+
+
+class ReplicaPool:
+    """
+    Реплики для чтения: выбор по кругу среди здоровых, фоновая проверка
+    доступности и привязка пользователя к основной базе на короткое окно
+    после его записи (read-your-writes). Состояние хранится в воркере.
+    """
+
+    def __init__(self, check_interval: float, sticky_seconds: float):
+        self.replicas: List[Replica] = []
+        self.check_interval = check_interval
+        self.sticky_writers = TTLCache(ttl=sticky_seconds, maxsize=65536)
+        self._next = 0
+        self._task: Optional[asyncio.Task] = None
+
+    def add(self, name: str, engine: AsyncEngine) -> None:
+        replica = Replica(name, engine)
+        self.replicas.append(replica)
+
+        # Обрыв соединения виден здесь, даже если эндпоинт перехватит исключение
+        # и вернет error_response: реплика сразу исключается из выбора
+        def handle_error(exception_context) -> None:
+            error = exception_context.original_exception
+            if exception_context.is_disconnect or is_disconnect(error):
+                self.mark_down(replica, repr(error))
+
+        # Ошибка подключения до handle_error не доходит
+        def do_connect(dialect, conn_rec, cargs, cparams):
+            try:
+                return dialect.connect(*cargs, **cparams)
+            except Exception as e:
+                if is_disconnect(e):
+                    self.mark_down(replica, repr(e))
+                raise
+
+        event.listen(engine.sync_engine, "handle_error", handle_error)
+        event.listen(engine.sync_engine, "do_connect", do_connect)
+
+    def choose(self, user_key: Optional[str]) -> Optional[Replica]:
+        """Следующая здоровая реплика; None - читать из основной базы"""
+        if user_key is not None and self.sticky_writers.get(user_key) is not None:
+            return None
+        for _ in range(len(self.replicas)):
+            replica = self.replicas[self._next % len(self.replicas)]
+            self._next += 1
+            if replica.healthy:
+                return replica
+        return None
+
+    def mark_written(self, user_key: Optional[str]) -> None:
+        if user_key is not None and self.replicas:
+            self.sticky_writers.set(user_key, time.monotonic())
+
+    def mark_down(self, replica: Replica, reason: str) -> None:
+        if replica.healthy:
+            logger.warning(f"Replica {replica.name} is unavailable, reading from primary: {reason}")
+        replica.healthy = False
+
+    async def check(self, replica: Replica) -> None:
+        try:
+            async with replica.engine.connect() as conn:
+                await asyncio.wait_for(conn.execute(text("SELECT 1")), timeout=self.check_interval)
+        except Exception as e:
+            self.mark_down(replica, repr(e))
+        else:
+            if not replica.healthy:
+                logger.info(f"Replica {replica.name} is available again")
+            replica.healthy = True
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.gather(*(self.check(replica) for replica in self.replicas))
+            await asyncio.sleep(self.check_interval)
+
+    def start(self) -> None:
+        if self.replicas and self._task is None:
+            self._task = asyncio.create_task(self._health_loop())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+
+def is_disconnect(error: Exception) -> bool:
+    return isinstance(error, (OSError, ConnectionError)) or (
+        isinstance(error, DBAPIError) and error.connection_invalidated
+    )
+
+
+def request_user_key(authorization: Optional[str]) -> Optional[str]:
+    """
+    Пользователь из Bearer-токена для привязки к основной базе. Подпись не
+    проверяется: ключ влияет только на выбор базы, доступ проверяет get_current_user.
+    """
+    if not authorization or not authorization.lower().startswith("bearer "):
+        return None
+    try:
+        subject = jwt.get_unverified_claims(authorization[7:]).get("sub")
+    except JWTError:
+        return None
+    return str(subject) if subject is not None else None
@@ -0,0 +1,10 @@
+from app.db.base import BaseRepository
+from app.db.models.academic_cycles import AcademicPeriod
+from app.schemas.academic_cycles.academic_period import AcademicPeriodCreate, AcademicPeriodUpdate
+
+
+class AcademicPeriodRepository(BaseRepository[AcademicPeriod, AcademicPeriodCreate, AcademicPeriodUpdate]):
+    pass
+
+
+academic_periods_repository = AcademicPeriodRepository(AcademicPeriod)
@@ -0,0 +1,10 @@
+from app.db.base import BaseRepository
+from app.db.models.academic_cycles import AcademicWeek
+from app.schemas.academic_cycles.academic_week import AcademicWeekCreate, AcademicWeekUpdate
+
+
+class AcademicWeekRepository(BaseRepository[AcademicWeek, AcademicWeekCreate, AcademicWeekUpdate]):
+    pass
+
+
+academic_weeks_repository = AcademicWeekRepository(AcademicWeek)
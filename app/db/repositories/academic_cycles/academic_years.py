@@ -3,10 +3,12 @@ from app.db.base import BaseRepository
 from typing import Optional
 from sqlalchemy import select
 from app.schemas.academic_cycles.academic_year import AcademicYearCreate, AcademicYearUpdate
-from app.db.models.academic_cycles import AcademicYear
+from app.db.models.academic_cycles import AcademicYear, AcademicPeriod, AcademicWeek
+from app.db.models.schedule import LessonTimes
 from app.schemas.academic_cycles.academic_year import AcademicYearList
 from sqlalchemy.orm import joinedload
-from typing import List
+from typing import List, Any, Dict
+from datetime import date
 class Academic_years_repository(BaseRepository[AcademicYear, AcademicYearCreate, AcademicYearUpdate]):
     async def get_all(self, db: AsyncSession, skip: int = 0, limit: int = 10) -> List[AcademicYear]:
         query = select(AcademicYear).offset(skip).limit(limit).options(joinedload(AcademicYear.periods))
@@ -28,5 +30,35 @@ class Academic_years_repository(BaseRepository[AcademicYear, AcademicYearCreate,
         query = select(AcademicYear).where(AcademicYear.id == academic_year_id).options(joinedload(AcademicYear.periods))
         result = await db.execute(query)
         return result.unique().scalar_one_or_none()
+    async def get_current_period(self, db: AsyncSession) -> Optional[AcademicPeriod]:
+        today = date.today()
+        query = select(AcademicPeriod).where(
+            (AcademicPeriod.is_current == True) | 
+            ((AcademicPeriod.start_date <= today) & (AcademicPeriod.end_date >= today))
+        ).order_by(AcademicPeriod.is_current.desc()).limit(1)
+        result = await db.execute(query)
+        return result.scalars().first()
+
+    async def get_calendar_rows(self, db: AsyncSession) -> Dict[str, List[Any]]:
+        """Строки годов, периодов, недель и времени уроков для кэша календаря (без ORM-объектов)"""
+        queries = {
+            "years": select(
+                AcademicYear.id, AcademicYear.name, AcademicYear.start_date, AcademicYear.end_date,
+                AcademicYear.is_current
+            ).order_by(AcademicYear.start_date),
+            "periods": select(
+                AcademicPeriod.id, AcademicPeriod.year_id, AcademicPeriod.name, AcademicPeriod.order_num,
+                AcademicPeriod.start_date, AcademicPeriod.end_date, AcademicPeriod.is_current
+            ).order_by(AcademicPeriod.year_id, AcademicPeriod.order_num),
+            "weeks": select(
+                AcademicWeek.id, AcademicWeek.period_id, AcademicWeek.week_num, AcademicWeek.name,
+                AcademicWeek.start_date, AcademicWeek.end_date, AcademicWeek.is_holiday
+            ),
+            "lesson_times": select(
+                LessonTimes.id, LessonTimes.period_id, LessonTimes.lesson_num,
+                LessonTimes.start_time, LessonTimes.end_time
+            ),
+        }
+        return {name: (await db.execute(query)).all() for name, query in queries.items()}
     
 academic_years_repository = Academic_years_repository(AcademicYear)
\ No newline at end of file
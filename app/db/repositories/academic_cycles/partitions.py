@@ -0,0 +1,90 @@
+from typing import List, Union
+
+from sqlalchemy import ScalarSelect, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.db.models.academic_cycles import AcademicPeriod, AcademicWeek
+
+# Таблицы, секционированные по учебному году (LIST по year_id).
+# Порядок важен: grades ссылается на schedule
+PARTITIONED_TABLES = ("schedule", "grades")
+ARCHIVE_SCHEMA = "archive"
+GRADES_SCHEDULE_FK = "fk_grades_schedule_year"
+
+
+def partition_name(table: str, year_id: int) -> str:
+    return f"{table}_y{int(year_id)}"
+
+
+def week_year_id(week_id: int) -> ScalarSelect:
+    """Учебный год недели: условие по year_id отсекает секции других лет"""
+    return (
+        select(AcademicPeriod.year_id)
+        .join(AcademicWeek, AcademicWeek.period_id == AcademicPeriod.id)
+        .where(AcademicWeek.id == week_id)
+        .scalar_subquery()
+    )
+
+
+def period_year_id(period_id: int) -> ScalarSelect:
+    """Учебный год периода: условие по year_id отсекает секции других лет"""
+    return select(AcademicPeriod.year_id).where(AcademicPeriod.id == period_id).scalar_subquery()
+
+
+class YearPartitionRepository:
+    """
+    Секции schedule и grades по учебным годам. Секции года создаются вместе
+    с годом; старые годы отсоединяются в схему archive, чтобы индексы рабочих
+    таблиц содержали только актуальные годы.
+    """
+
+    async def exists(self, db: AsyncSession, table: str, year_id: int, schema: str = "public") -> bool:
+        name = f"{schema}.{partition_name(table, year_id)}"
+        return await db.scalar(text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name})
+
+    async def attached_year_ids(self, db: AsyncSession) -> List[int]:
+        """Годы, секции которых подключены к grades (не в архиве)"""
+        result = await db.execute(text(
+            "SELECT substring(c.relname FROM '_y([0-9]+)$')::int FROM pg_inherits i "
+            "JOIN pg_class c ON c.oid = i.inhrelid WHERE i.inhparent = 'grades'::regclass"
+        ))
+        return sorted(result.scalars().all())
+
+    async def create(self, db: Union[AsyncSession, AsyncConnection], year_id: int) -> None:
+        for table in PARTITIONED_TABLES:
+            await db.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {partition_name(table, year_id)} "
+                f"PARTITION OF {table} FOR VALUES IN ({int(year_id)})"
+            ))
+
+    async def archive(self, db: AsyncSession, year_id: int) -> None:
+        """
+        Отсоединяет секции года и переносит их в схему archive. Данные остаются
+        доступны запросами к archive.schedule_yN / archive.grades_yN.
+        """
+        schedule = partition_name("schedule", year_id)
+        grades = partition_name("grades", year_id)
+        await db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+        await db.execute(text(f"ALTER TABLE grades DETACH PARTITION {grades}"))
+        # Отсоединенная секция сохраняет ссылку на schedule - она не дала бы отсоединить уроки
+        await db.execute(text(f"ALTER TABLE {grades} DROP CONSTRAINT {GRADES_SCHEDULE_FK}"))
+        await db.execute(text(f"ALTER TABLE schedule DETACH PARTITION {schedule}"))
+        for name in (schedule, grades):
+            await db.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+        await db.execute(text(
+            f"ALTER TABLE {ARCHIVE_SCHEMA}.{grades} ADD CONSTRAINT {GRADES_SCHEDULE_FK} "
+            f"FOREIGN KEY (schedule_id, year_id) REFERENCES {ARCHIVE_SCHEMA}.{schedule} (id, year_id)"
+        ))
+
+    async def restore(self, db: AsyncSession, year_id: int) -> None:
+        """Возвращает архивные секции года в schedule и grades"""
+        schedule = partition_name("schedule", year_id)
+        grades = partition_name("grades", year_id)
+        await db.execute(text(f"ALTER TABLE {ARCHIVE_SCHEMA}.{grades} DROP CONSTRAINT {GRADES_SCHEDULE_FK}"))
+        for name in (schedule, grades):
+            await db.execute(text(f"ALTER TABLE {ARCHIVE_SCHEMA}.{name} SET SCHEMA public"))
+        await db.execute(text(f"ALTER TABLE schedule ATTACH PARTITION {schedule} FOR VALUES IN ({int(year_id)})"))
+        await db.execute(text(f"ALTER TABLE grades ATTACH PARTITION {grades} FOR VALUES IN ({int(year_id)})"))
+
+
+year_partition_repository = YearPartitionRepository()
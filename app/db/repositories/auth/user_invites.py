@@ -28,17 +28,14 @@ class UserInviteRepository(BaseRepository[UserInvite, UserInviteCreate, UserInvi
             expires_at=obj_in.expires_at,
         )
         db.add(db_obj)
-        await db.commit()
-        await db.refresh(db_obj)
+        await db.flush()
         return db_obj
     
     async def update_sent_status(self, db: AsyncSession, *, user_invite_id: int):
         query = update(UserInvite).where(UserInvite.id == user_invite_id).values(is_sent=True)
         await db.execute(query)
-        await db.commit()
     async def update_used_status(self, db: AsyncSession, *, user_invite_id: int):
         query = update(UserInvite).where(UserInvite.id == user_invite_id).values(used_at=datetime.now())
         await db.execute(query)
-        await db.commit()
 
 user_invite_repository = UserInviteRepository(UserInvite)
\ No newline at end of file
@@ -1,5 +1,4 @@
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Optional, Set
 
 from sqlalchemy import select, or_, exists
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,6 +9,7 @@ from app.db.models.class_ import Class
 from app.db.models.academic_cycles import AcademicYear
 from app.db.models.schedule import Schedule
 from app.db.models.user import Teacher, Student
+from app.db.repositories.user.student import StudentRepository
 from app.schemas.class_.class_ import ClassCreate, ClassUpdate
 
 
@@ -22,7 +22,7 @@ class ClassRepository(BaseRepository[Class, ClassCreate, ClassUpdate]):
         search: Optional[str] = None,
         order_by: str = "created_at", 
         order_direction: str = "desc", 
-        year: int = datetime.now().year, 
+        year_id: Optional[int] = None,
         teacher: Teacher = None
     ) -> List[Class]:
         query = select(Class).options(
@@ -44,12 +44,8 @@ class ClassRepository(BaseRepository[Class, ClassCreate, ClassUpdate]):
         if search:
             query = query.where(Class.name.ilike(f"%{search}%"))
         
-        if year:
-            year_id = await db.scalar(
-                select(AcademicYear.id).where(AcademicYear.name == str(year))
-            )
-            if year_id is not None:
-                query = query.where(Class.year_id == year_id)
+        if year_id is not None:
+            query = query.where(Class.year_id == year_id)
         
         order_column = getattr(Class, order_by, Class.created_at)
         if order_direction == "desc":
@@ -78,11 +74,17 @@ class ClassRepository(BaseRepository[Class, ClassCreate, ClassUpdate]):
         result = await db.execute(query)
         return result.scalar()
 
-    async def get_with_relations(self, db: AsyncSession, id: int) -> Class:
+    async def get_with_relations(
+        self,
+        db: AsyncSession,
+        id: int,
+        user_fields: Optional[Set[str]] = None,
+        student_fields: Optional[Set[str]] = None
+    ) -> Class:
         result = await db.execute(
             select(Class)
             .options(
-                selectinload(Class.students).joinedload(Student.user),
+                *StudentRepository.student_load_options(user_fields, student_fields, path=selectinload(Class.students)),
                 joinedload(Class.teacher).joinedload(Teacher.user),
                 joinedload(Class.year).load_only(AcademicYear.name)
             )
@@ -20,8 +20,7 @@ class ClassConfigRepository(BaseRepository[ClassTemplate, ClassConfigCreate, Cla
         class_config.grade_levels = obj_in.grade_levels
         class_config.letters = obj_in.letters
         
-        await db.commit()
-        await db.refresh(class_config)
+        await db.flush()
         
         return class_config
     
@@ -28,8 +28,6 @@ class StudentClassHistoryRepository(BaseRepository[StudentClassHistory, StudentC
             previous_history.end_date = datetime.now()
             previous_history.is_active = False
             db.add(previous_history)
-            await db.commit()
-            await db.refresh(previous_history)
             
         history = StudentClassHistory()
         history.student_id = student_id
@@ -37,8 +35,7 @@ class StudentClassHistoryRepository(BaseRepository[StudentClassHistory, StudentC
         history.reason = reason
         history.is_active = is_active
         db.add(history)
-        await db.commit()
-        await db.refresh(history)
+        await db.flush()
         return history
 
 
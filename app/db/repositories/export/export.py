@@ -0,0 +1,95 @@
+from typing import Any, AsyncIterator, Optional, Tuple
+
+from sqlalchemy import Select, select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.core.config import settings
+from app.db.models.academic_cycles import AcademicWeek
+from app.db.models.class_ import Class
+from app.db.models.schedule import Grade, Schedule
+from app.db.models.subject import Subject
+from app.db.models.user import Student, Teacher, User
+from app.db.repositories.academic_cycles.partitions import period_year_id
+
+STUDENT_COLUMNS = ("id", "full_name", "username", "email", "class", "admission_year",
+                   "parent_fio", "parent_phone", "parent_email", "is_active")
+TEACHER_COLUMNS = ("id", "full_name", "username", "email", "class", "degree", "experience", "is_active")
+GRADE_COLUMNS = ("id", "date", "class", "student_id", "student", "subject", "teacher",
+                 "score", "weight", "comment", "created_at")
+ROSTER_COLUMNS = ("id", "full_name", "email", "parent_fio", "parent_phone", "parent_email")
+
+
+class ExportRepository:
+    """
+    Выгрузки больших таблиц. Строки читаются через серверный курсор
+    (AsyncSession.stream + yield_per) пачками по EXPORT_BATCH_SIZE,
+    в памяти никогда не бывает всей выборки.
+    """
+
+    async def stream_rows(self, db: AsyncSession, query: Select) -> AsyncIterator[Tuple[Any, ...]]:
+        result = await db.stream(query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        async for partition in result.partitions():
+            for row in partition:
+                yield tuple(row)
+
+    def students_query(self) -> Select:
+        return (
+            select(
+                User.id, User.full_name, User.username, User.email, Class.name,
+                Student.admission_year, Student.parent_fio, Student.parent_phone,
+                Student.parent_email, User.is_active
+            )
+            .join(User, User.id == Student.user_id)
+            .outerjoin(Class, Class.id == Student.class_id)
+            .order_by(User.id)
+        )
+
+    def teachers_query(self) -> Select:
+        return (
+            select(
+                User.id, User.full_name, User.username, User.email, Class.name,
+                Teacher.degree, Teacher.experience, User.is_active
+            )
+            .join(User, User.id == Teacher.user_id)
+            .outerjoin(Class, Class.id == Teacher.class_id)
+            .order_by(User.id)
+        )
+
+    def grades_query(self, period_id: int, class_id: Optional[int] = None) -> Select:
+        student = aliased(User)
+        teacher = aliased(User)
+        # День урока: понедельник недели + day_of_week (1 - понедельник)
+        lesson_date = func.date(AcademicWeek.start_date + func.make_interval(0, 0, 0, Schedule.day_of_week - 1))
+        query = (
+            select(
+                Grade.id, lesson_date, Class.name, Grade.student_id, student.full_name,
+                Subject.name, teacher.full_name, Grade.score, Grade.weight, Grade.comment,
+                Grade.created_at
+            )
+            .join(Schedule, (Schedule.id == Grade.schedule_id) & (Schedule.year_id == Grade.year_id))
+            .join(AcademicWeek, AcademicWeek.id == Schedule.week_id)
+            .join(Class, Class.id == Schedule.class_id)
+            .join(Subject, Subject.id == Grade.subject_id)
+            .join(student, student.id == Grade.student_id)
+            .join(teacher, teacher.id == Grade.teacher_id)
+            .where(AcademicWeek.period_id == period_id, Grade.year_id == period_year_id(period_id))
+            .order_by(Grade.id)
+        )
+        if class_id is not None:
+            query = query.where(Schedule.class_id == class_id)
+        return query
+
+    def class_roster_query(self, class_id: int) -> Select:
+        return (
+            select(
+                User.id, User.full_name, User.email, Student.parent_fio,
+                Student.parent_phone, Student.parent_email
+            )
+            .join(User, User.id == Student.user_id)
+            .where(Student.class_id == class_id)
+            .order_by(User.full_name)
+        )
+
+
+export_repository = ExportRepository()
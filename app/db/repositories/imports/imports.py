@@ -0,0 +1,405 @@
+from typing import Any, List, Sequence, Tuple
+
+from sqlalchemy import (
+    Column, Date, DateTime, Integer, MetaData, String, Table, Text, Select,
+    and_, case, cast, exists, extract, func, literal, select, text
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.models.academic_cycles import AcademicPeriod, AcademicWeek, AcademicYear
+from app.db.models.class_ import Class, StudentClassHistory, StudentClassHistoryReason
+from app.db.models.schedule import Grade, Homework, LessonTimes, Schedule
+from app.db.models.subject import Subject
+from app.db.models.user import Student, Teacher, User, UserRole
+from app.db.repositories.schedule.grade_average import grade_average_repository
+
+# Промежуточные таблицы импорта: временные, живут до конца транзакции.
+# Отдельный MetaData - чтобы alembic их не видел.
+staging_metadata = MetaData()
+
+
+def _staging_table(name: str, *columns: Column) -> Table:
+    return Table(
+        name, staging_metadata,
+        Column("line", Integer, nullable=False),
+        *columns,
+        prefixes=["TEMPORARY"],
+        postgresql_on_commit="DROP"
+    )
+
+
+students_staging = _staging_table(
+    "import_students",
+    Column("email", String), Column("username", String), Column("full_name", String),
+    Column("class_name", String), Column("admission_year", Integer), Column("parent_fio", String),
+    Column("parent_phone", String), Column("parent_email", String)
+)
+schedule_staging = _staging_table(
+    "import_schedule",
+    Column("class_name", String), Column("lesson_date", Date), Column("lesson_num", Integer),
+    Column("subject_name", String), Column("teacher_email", String), Column("location", String),
+    Column("description", String)
+)
+homework_staging = _staging_table(
+    "import_homework",
+    Column("class_name", String), Column("lesson_date", Date), Column("lesson_num", Integer),
+    Column("subject_name", String), Column("description", String), Column("due_date", DateTime)
+)
+grades_staging = _staging_table(
+    "import_grades",
+    Column("student_email", String), Column("class_name", String), Column("lesson_date", Date),
+    Column("lesson_num", Integer), Column("subject_name", String), Column("score", Integer),
+    Column("weight", Integer), Column("comment", Text)
+)
+
+
+def _lesson_slot(staging: Table) -> Select:
+    """
+    Разрешение класса, недели, номера урока и предмета по естественным ключам
+    строки (название класса, дата, номер урока, название предмета). Класс ищется
+    в учебном году, в который попадает дата; year_id (ключ секции уроков
+    и оценок) - год учебной недели. Неразрешенные ссылки остаются NULL.
+    """
+    day_of_week = cast(extract("isodow", staging.c.lesson_date), Integer)
+    return (
+        select(
+            staging, Class.id.label("class_id"), AcademicWeek.id.label("week_id"),
+            AcademicWeek.period_id.label("period_id"), AcademicPeriod.year_id.label("year_id"),
+            LessonTimes.id.label("lesson_time_id"),
+            Subject.id.label("subject_id"), day_of_week.label("day_of_week")
+        )
+        .select_from(staging)
+        .outerjoin(AcademicYear, staging.c.lesson_date.between(AcademicYear.start_date, AcademicYear.end_date))
+        .outerjoin(Class, and_(Class.year_id == AcademicYear.id, Class.name == staging.c.class_name))
+        .outerjoin(AcademicWeek, staging.c.lesson_date.between(
+            func.date(AcademicWeek.start_date), func.date(AcademicWeek.end_date)
+        ))
+        .outerjoin(AcademicPeriod, AcademicPeriod.id == AcademicWeek.period_id)
+        .outerjoin(LessonTimes, and_(
+            LessonTimes.period_id == AcademicWeek.period_id, LessonTimes.lesson_num == staging.c.lesson_num
+        ))
+        .outerjoin(Subject, Subject.name == staging.c.subject_name)
+    )
+
+
+def _slot_reason(slot) -> Any:
+    return case(
+        (slot.c.class_id.is_(None), "Unknown class"),
+        (slot.c.week_id.is_(None), "Date is outside academic weeks"),
+        (slot.c.lesson_time_id.is_(None), "Unknown lesson number"),
+        (slot.c.subject_id.is_(None), "Unknown subject"),
+        else_=None
+    )
+
+
+def _lesson(staging: Table) -> Select:
+    """Строка с найденным уроком расписания (для заданий и оценок)"""
+    slot = _lesson_slot(staging).subquery("slot")
+    return (
+        select(
+            slot, Schedule.id.label("schedule_id"), Schedule.teacher_id.label("teacher_id"),
+            func.coalesce(
+                _slot_reason(slot),
+                case((Schedule.id.is_(None), "Lesson not found in schedule"), else_=None)
+            ).label("reason")
+        )
+        .select_from(slot)
+        .outerjoin(Schedule, and_(
+            Schedule.year_id == slot.c.year_id,
+            Schedule.class_id == slot.c.class_id,
+            Schedule.week_id == slot.c.week_id,
+            Schedule.lesson_time_id == slot.c.lesson_time_id,
+            Schedule.day_of_week == slot.c.day_of_week,
+            Schedule.subject_id == slot.c.subject_id
+        ))
+    )
+
+
+class ImportRepository:
+    """
+    Импорт исторических данных: строки CSV загружаются COPY во временные
+    таблицы, затем переносятся в основные таблицы одним INSERT ... SELECT
+    на вид данных. Ссылки разрешаются по естественным ключам в SQL.
+    """
+
+    tables = {
+        "students": students_staging,
+        "schedule": schedule_staging,
+        "homework": homework_staging,
+        "grades": grades_staging,
+    }
+
+    def columns(self, kind: str) -> List[str]:
+        return [column.name for column in self.tables[kind].columns]
+
+    async def create_staging(self, db: AsyncSession, kind: str) -> None:
+        table = self.tables[kind]
+        conn = await db.connection()
+        await conn.run_sync(lambda sync_conn: table.create(sync_conn, checkfirst=True))
+        await db.execute(table.delete())
+
+    async def copy(self, db: AsyncSession, kind: str, records: Sequence[Tuple[Any, ...]]) -> None:
+        table = self.tables[kind]
+        conn = await db.connection()
+        raw = await conn.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table.name, records=records, columns=self.columns(kind)
+        )
+
+    async def analyze(self, db: AsyncSession, kind: str) -> None:
+        # Временные таблицы не анализирует autovacuum, без статистики планы переноса плохие
+        await db.execute(text(f"ANALYZE {self.tables[kind].name}"))
+
+    def resolve(self, kind: str) -> Select:
+        """Строки промежуточной таблицы с найденными ссылками и причиной отказа (reason)"""
+        if kind == "students":
+            return self._resolve_students()
+        if kind == "schedule":
+            return self._resolve_schedule()
+        if kind == "grades":
+            return self._resolve_grades()
+        return _lesson(homework_staging)
+
+    async def rejected(self, db: AsyncSession, kind: str) -> Tuple[int, List[Tuple[int, str]]]:
+        """Число строк с неразрешенными ссылками и первые из них с причиной"""
+        resolved = self.resolve(kind).subquery("resolved")
+        count = await db.scalar(
+            select(func.count()).select_from(resolved).where(resolved.c.reason.is_not(None))
+        )
+        if not count:
+            return 0, []
+        result = await db.execute(
+            select(resolved.c.line, resolved.c.reason)
+            .where(resolved.c.reason.is_not(None))
+            .order_by(resolved.c.line)
+            .limit(settings.IMPORT_MAX_REPORTED_ERRORS)
+        )
+        return count, [tuple(row) for row in result.all()]
+
+    async def affected_lessons(self, db: AsyncSession, kind: str) -> Tuple[List[int], List[int]]:
+        """Периоды и классы принятых строк уроков, заданий или оценок (до переноса)"""
+        resolved = self.resolve(kind).subquery("resolved")
+        result = await db.execute(
+            select(resolved.c.period_id, resolved.c.class_id)
+            .where(resolved.c.reason.is_(None))
+            .distinct()
+        )
+        rows = result.all()
+        return sorted({row.period_id for row in rows}), sorted({row.class_id for row in rows})
+
+    async def merge(self, db: AsyncSession, kind: str, **params: Any) -> int:
+        """Переносит разрешенные строки в основные таблицы, возвращает число добавленных"""
+        return await getattr(self, f"_merge_{kind}")(db, **params)
+
+    def _resolve_students(self) -> Select:
+        staging = students_staging
+        current_class = (
+            select(Class.id)
+            .join(AcademicYear, AcademicYear.id == Class.year_id)
+            .where(AcademicYear.is_current == True, Class.name == staging.c.class_name)
+            .limit(1)
+            .scalar_subquery()
+        )
+        # Случайный суффикс SurnameIO000 дает всего 900 вариантов: повтор в файле
+        # или совпадение с существующим пользователем получает номер строки
+        ranked = select(
+            staging, current_class.label("class_id"),
+            func.row_number().over(partition_by=staging.c.username, order_by=staging.c.line).label("username_rank")
+        ).subquery("ranked_row")
+        username_taken = (ranked.c.username_rank > 1) | exists().where(User.username == ranked.c.username)
+        row = select(
+            *(column for column in ranked.c if column.name not in ("username", "username_rank")),
+            case(
+                (username_taken, ranked.c.username + "_" + cast(ranked.c.line, String)),
+                else_=ranked.c.username
+            ).label("username")
+        ).subquery("student_row")
+        reason = case(
+            (and_(row.c.class_name.is_not(None), row.c.class_id.is_(None)), "Unknown class in current year"),
+            (exists().where(User.email == row.c.email), "User with this email already exists"),
+            (exists().where(User.username == row.c.username), "Username already exists"),
+            else_=None
+        )
+        return select(row, reason.label("reason"))
+
+    def _resolve_schedule(self) -> Select:
+        staging = schedule_staging
+        slot = _lesson_slot(staging).subquery("slot")
+        reason = func.coalesce(
+            _slot_reason(slot),
+            case((Teacher.user_id.is_(None), "Unknown teacher"), else_=None)
+        )
+        return (
+            select(slot, Teacher.user_id.label("teacher_id"), reason.label("reason"))
+            .select_from(slot)
+            .outerjoin(User, User.email == slot.c.teacher_email)
+            .outerjoin(Teacher, Teacher.user_id == User.id)
+        )
+
+    async def _merge_students(self, db: AsyncSession, hashed_password: str) -> int:
+        resolved = self.resolve("students").subquery("resolved")
+        # Повтор email в файле: остается первая строка
+        source = (
+            select(resolved)
+            .where(resolved.c.reason.is_(None))
+            .distinct(resolved.c.email)
+            .order_by(resolved.c.email, resolved.c.line)
+            .cte("source")
+        )
+        new_users = (
+            insert(User)
+            .from_select(
+                ["email", "username", "hashed_password", "full_name", "role", "is_active", "created_at", "updated_at"],
+                select(
+                    source.c.email, source.c.username, literal(hashed_password), source.c.full_name,
+                    literal(UserRole.STUDENT, User.role.type), literal(True), func.now(), func.now()
+                )
+            )
+            .on_conflict_do_nothing()
+            .returning(User.id, User.email)
+            .cte("new_users")
+        )
+        new_students = (
+            insert(Student)
+            .from_select(
+                ["user_id", "class_id", "admission_year", "parent_fio", "parent_phone", "parent_email"],
+                select(
+                    new_users.c.id, source.c.class_id, source.c.admission_year,
+                    source.c.parent_fio, source.c.parent_phone, source.c.parent_email
+                ).join(source, source.c.email == new_users.c.email)
+            )
+            .returning(Student.user_id, Student.class_id)
+            .cte("new_students")
+        )
+        history = (
+            insert(StudentClassHistory)
+            .from_select(
+                ["student_id", "class_id", "start_date", "reason", "is_active", "created_at"],
+                select(
+                    new_students.c.user_id, new_students.c.class_id, func.now(),
+                    literal(StudentClassHistoryReason.ADMISSION, StudentClassHistory.reason.type),
+                    literal(True), func.now()
+                ).where(new_students.c.class_id.is_not(None))
+            )
+            .cte("history")
+        )
+        # Пользователи, ученики и история класса создаются одним запросом
+        return await db.scalar(
+            select(func.count()).select_from(new_students).add_cte(history)
+        )
+
+    async def _merge_schedule(self, db: AsyncSession) -> int:
+        resolved = self.resolve("schedule").subquery("resolved")
+        slot_taken = exists().where(
+            Schedule.year_id == resolved.c.year_id,
+            Schedule.class_id == resolved.c.class_id,
+            Schedule.week_id == resolved.c.week_id,
+            Schedule.lesson_time_id == resolved.c.lesson_time_id,
+            Schedule.day_of_week == resolved.c.day_of_week
+        )
+        # Уже существующие уроки пропускаются - повторный импорт файла безопасен
+        source = (
+            select(resolved)
+            .where(resolved.c.reason.is_(None), ~slot_taken)
+            .distinct(resolved.c.class_id, resolved.c.week_id, resolved.c.lesson_time_id, resolved.c.day_of_week)
+            .order_by(
+                resolved.c.class_id, resolved.c.week_id, resolved.c.lesson_time_id,
+                resolved.c.day_of_week, resolved.c.line
+            )
+            .subquery("source")
+        )
+        result = await db.execute(
+            insert(Schedule).from_select(
+                ["year_id", "week_id", "lesson_time_id", "class_id", "teacher_id", "subject_id", "day_of_week",
+                 "location", "description", "is_replacement", "is_cancelled", "created_at"],
+                select(
+                    source.c.year_id, source.c.week_id, source.c.lesson_time_id, source.c.class_id, source.c.teacher_id,
+                    source.c.subject_id, source.c.day_of_week, source.c.location, source.c.description,
+                    literal(False), literal(False), func.now()
+                )
+            )
+        )
+        return result.rowcount
+
+    async def _merge_homework(self, db: AsyncSession) -> int:
+        resolved = self.resolve("homework").subquery("resolved")
+        duplicate = exists().where(
+            Homework.schedule_id == resolved.c.schedule_id,
+            Homework.description == resolved.c.description
+        )
+        source = (
+            select(resolved)
+            .where(resolved.c.reason.is_(None), ~duplicate)
+            .distinct(resolved.c.schedule_id, resolved.c.description)
+            .order_by(resolved.c.schedule_id, resolved.c.description, resolved.c.line)
+            .subquery("source")
+        )
+        result = await db.execute(
+            insert(Homework).from_select(
+                ["schedule_id", "class_id", "teacher_id", "subject_id", "description",
+                 "assignment_at", "due_date", "created_at"],
+                select(
+                    source.c.schedule_id, source.c.class_id, source.c.teacher_id, source.c.subject_id,
+                    source.c.description, cast(source.c.lesson_date, DateTime), source.c.due_date, func.now()
+                )
+            )
+        )
+        return result.rowcount
+
+    def _resolve_grades(self) -> Select:
+        lesson = _lesson(grades_staging).subquery("lesson")
+        reason = func.coalesce(
+            lesson.c.reason,
+            case((Student.user_id.is_(None), "Unknown student"), else_=None)
+        )
+        return (
+            select(
+                *(column for column in lesson.c if column.key != "reason"),
+                Student.user_id.label("student_id"), reason.label("reason")
+            )
+            .select_from(lesson)
+            .outerjoin(User, User.email == lesson.c.student_email)
+            .outerjoin(Student, Student.user_id == User.id)
+        )
+
+    async def _merge_grades(self, db: AsyncSession) -> int:
+        resolved = self.resolve("grades").subquery("resolved")
+        # Несколько оценок ученика за один урок в файле: остается последняя,
+        # иначе ON CONFLICT DO UPDATE затронет строку дважды
+        source = (
+            select(resolved)
+            .where(resolved.c.reason.is_(None))
+            .distinct(resolved.c.schedule_id, resolved.c.student_id)
+            .order_by(resolved.c.schedule_id, resolved.c.student_id, resolved.c.line.desc())
+            .subquery("source")
+        )
+        lesson_at = cast(source.c.lesson_date, DateTime)
+        # Построчный триггер агрегатов отключен на время переноса:
+        # import_csv пересобирает grade_averages затронутых периодов
+        await grade_average_repository.skip_trigger(db=db, skip=True)
+        query = insert(Grade).from_select(
+            ["schedule_id", "year_id", "student_id", "subject_id", "teacher_id", "score", "weight",
+             "comment", "created_at", "updated_at"],
+            select(
+                source.c.schedule_id, source.c.year_id, source.c.student_id, source.c.subject_id, source.c.teacher_id,
+                source.c.score, func.coalesce(source.c.weight, 1), source.c.comment, lesson_at, func.now()
+            )
+        )
+        query = query.on_conflict_do_update(
+            index_elements=[Grade.schedule_id, Grade.student_id, Grade.year_id],
+            index_where=Grade.homework_id.is_(None),
+            set_={
+                "score": query.excluded.score,
+                "weight": query.excluded.weight,
+                "comment": query.excluded.comment,
+                "updated_at": query.excluded.updated_at,
+            }
+        )
+        result = await db.execute(query)
+        await grade_average_repository.skip_trigger(db=db, skip=False)
+        return result.rowcount
+
+
+import_repository = ImportRepository()
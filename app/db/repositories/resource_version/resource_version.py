@@ -0,0 +1,31 @@
+from typing import Dict, Iterable
+
+from sqlalchemy import select, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.resource_version import ResourceVersion
+
+
+class ResourceVersionRepository:
+    """Счетчики версий ресурсов, общие для всех воркеров"""
+
+    async def get_versions(self, db: AsyncSession, keys: Iterable[str]) -> Dict[str, int]:
+        query = select(ResourceVersion.key, ResourceVersion.version).where(ResourceVersion.key.in_(list(keys)))
+        result = await db.execute(query)
+        return dict(result.all())
+
+    async def bump(self, db: AsyncSession, keys: Iterable[str]) -> None:
+        """Увеличивает версии одним INSERT ... ON CONFLICT; новые ключи получают версию 1"""
+        rows = [{"key": key, "version": 1} for key in sorted(set(keys))]
+        if not rows:
+            return
+        query = insert(ResourceVersion).values(rows)
+        query = query.on_conflict_do_update(
+            index_elements=[ResourceVersion.key],
+            set_={"version": ResourceVersion.version + 1, "updated_at": func.now()}
+        )
+        await db.execute(query)
+
+
+resource_version_repository = ResourceVersionRepository()
@@ -0,0 +1,75 @@
+from typing import List, Dict, Any
+from datetime import datetime
+
+from sqlalchemy import select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.base import BaseRepository
+from app.db.repositories.academic_cycles.partitions import week_year_id
+from app.db.models.schedule import Grade, Schedule
+from app.schemas.schedule.grade import GradeCreate, GradeUpdate
+
+
+class GradeRepository(BaseRepository[Grade, GradeCreate, GradeUpdate]):
+    async def upsert_lesson_grades(
+        self,
+        db: AsyncSession,
+        schedule_id: int,
+        year_id: int,
+        rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Выставляет оценки за урок одним INSERT ... ON CONFLICT DO UPDATE
+        и в том же запросе возвращает всю колонку оценок урока.
+        year_id - учебный год урока (ключ секции).
+        """
+        now = datetime.now()
+        values = [
+            {**row, "schedule_id": schedule_id, "year_id": year_id, "created_at": now, "updated_at": now}
+            for row in rows
+        ]
+
+        stmt = insert(Grade).values(values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Grade.schedule_id, Grade.student_id, Grade.year_id],
+            index_where=text("homework_id IS NULL"),
+            set_={
+                "score": stmt.excluded.score,
+                "weight": stmt.excluded.weight,
+                "comment": stmt.excluded.comment,
+                "teacher_id": stmt.excluded.teacher_id,
+                "updated_at": stmt.excluded.updated_at,
+            }
+        )
+        upserted = stmt.returning(*Grade.__table__.columns).cte("upserted")
+
+        column = select(*Grade.__table__.columns).where(
+            Grade.schedule_id == schedule_id,
+            Grade.year_id == year_id,
+            Grade.id.not_in(select(upserted.c.id))
+        ).union_all(
+            select(upserted)
+        )
+
+        result = await db.execute(column)
+        grades = [dict(row) for row in result.mappings().all()]
+        return sorted(grades, key=lambda grade: grade["student_id"])
+
+    async def get_student_week_grades(self, db: AsyncSession, student_id: int, week_id: int) -> List[Grade]:
+        """Оценки ученика за уроки недели"""
+        query = (
+            select(Grade)
+            .join(Schedule, (Schedule.id == Grade.schedule_id) & (Schedule.year_id == Grade.year_id))
+            .where(
+                Grade.student_id == student_id,
+                Schedule.week_id == week_id,
+                Grade.year_id == week_year_id(week_id)
+            )
+            .order_by(Grade.created_at)
+        )
+        result = await db.execute(query)
+        return result.scalars().all()
+
+
+grade_repository = GradeRepository(Grade)
@@ -0,0 +1,91 @@
+from typing import List, Optional
+
+from sqlalchemy import select, delete, insert, func, text
+from sqlalchemy.dialects.postgresql import array_agg, aggregate_order_by
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.db.models.schedule import Grade, GradeAverage, Schedule
+from app.db.models.academic_cycles import AcademicPeriod, AcademicWeek
+from app.db.repositories.academic_cycles.partitions import period_year_id, year_partition_repository
+
+# Параметр транзакции, при котором grades_maintain_averages не ведет агрегаты
+SKIP_TRIGGER_SETTING = "app.skip_grade_averages"
+
+
+class GradeAverageRepository:
+    """
+    Чтение агрегатов из grade_averages. Инкрементально таблицу ведет триггер
+    grades_maintain_averages, здесь только выборки и полная пересборка.
+    """
+
+    async def get_student_averages(self, db: AsyncSession, student_id: int, period_id: int) -> List[GradeAverage]:
+        query = select(GradeAverage).where(
+            GradeAverage.student_id == student_id,
+            GradeAverage.period_id == period_id
+        ).options(
+            joinedload(GradeAverage.subject)
+        ).order_by(GradeAverage.subject_id)
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    async def skip_trigger(self, db: AsyncSession, skip: bool) -> None:
+        """
+        Отключает (до конца транзакции или повторного вызова) построчное ведение
+        агрегатов для массовой записи оценок; после нее нужна пересборка периодов.
+        """
+        await db.execute(
+            select(func.set_config(SKIP_TRIGGER_SETTING, "on" if skip else "off", True))
+        )
+
+    async def rebuild(self, db: AsyncSession, period_id: Optional[int] = None) -> int:
+        """Пересчитывает агрегаты с нуля одним INSERT ... SELECT ... GROUP BY"""
+        last_order = (Grade.created_at.desc(), Grade.id.desc())
+        source = select(
+            Grade.student_id,
+            Grade.subject_id,
+            AcademicWeek.period_id,
+            func.count(),
+            func.sum(Grade.score),
+            func.sum(Grade.score * Grade.weight),
+            func.sum(Grade.weight),
+            array_agg(aggregate_order_by(Grade.id, *last_order))[1],
+            array_agg(aggregate_order_by(Grade.score, *last_order))[1],
+            func.max(Grade.created_at),
+            func.now()
+        ).join(
+            Schedule, (Schedule.id == Grade.schedule_id) & (Schedule.year_id == Grade.year_id)
+        ).join(
+            AcademicWeek, AcademicWeek.id == Schedule.week_id
+        ).group_by(
+            Grade.student_id, Grade.subject_id, AcademicWeek.period_id
+        )
+
+        clear = delete(GradeAverage)
+        if period_id is not None:
+            source = source.where(AcademicWeek.period_id == period_id, Grade.year_id == period_year_id(period_id))
+            clear = clear.where(GradeAverage.period_id == period_id)
+        else:
+            # Оценок архивных лет в grades нет - их агрегаты не трогаем
+            year_ids = await year_partition_repository.attached_year_ids(db)
+            clear = clear.where(GradeAverage.period_id.in_(
+                select(AcademicPeriod.id).where(AcademicPeriod.year_id.in_(year_ids))
+            ))
+
+        # Блокировка ждет незакоммиченные дельты триггера и не дает новым вклиниться в пересборку
+        await db.execute(text("LOCK TABLE grade_averages IN EXCLUSIVE MODE"))
+        await db.execute(clear)
+        result = await db.execute(
+            insert(GradeAverage).from_select(
+                [
+                    "student_id", "subject_id", "period_id",
+                    "grades_count", "score_sum", "weighted_sum", "weight_sum",
+                    "last_grade_id", "last_score", "last_graded_at", "updated_at"
+                ],
+                source
+            )
+        )
+        return result.rowcount
+
+
+grade_average_repository = GradeAverageRepository()
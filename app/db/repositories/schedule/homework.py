@@ -0,0 +1,90 @@
+from typing import List, Optional, Tuple
+from datetime import datetime
+
+from sqlalchemy import select, insert, update, literal
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, contains_eager
+
+from app.db.base import BaseRepository
+from app.db.repositories.academic_cycles.partitions import week_year_id
+from app.db.models.schedule import Homework, HomeworkStatus, Schedule
+from app.db.models.user import Student
+from app.schemas.schedule.homework import HomeworkCreate, HomeworkUpdate
+
+
+class HomeworkRepository(BaseRepository[Homework, HomeworkCreate, HomeworkUpdate]):
+    async def assign_to_class(self, db: AsyncSession, homework_in: HomeworkCreate) -> Tuple[Homework, int]:
+        """
+        Создаёт одно задание на класс и статусы для всех учеников класса
+        одним INSERT ... SELECT, без выборки состава класса в приложение.
+        """
+        homework = Homework(**homework_in.model_dump())
+        db.add(homework)
+        await db.flush()
+
+        statuses = insert(HomeworkStatus).from_select(
+            ["homework_id", "student_id", "due_date"],
+            select(
+                literal(homework.id),
+                Student.user_id,
+                literal(homework.due_date, HomeworkStatus.due_date.type)
+            ).where(Student.class_id == homework.class_id)
+        )
+        result = await db.execute(statuses)
+        return homework, result.rowcount
+
+    async def get_student_homework(
+        self,
+        db: AsyncSession,
+        student_id: int,
+        date_from: datetime,
+        date_to: datetime
+    ) -> List[HomeworkStatus]:
+        """Задания ученика со сроком сдачи в интервале (индекс student_id, due_date)"""
+        query = (
+            select(HomeworkStatus)
+            .where(
+                HomeworkStatus.student_id == student_id,
+                HomeworkStatus.due_date >= date_from,
+                HomeworkStatus.due_date < date_to
+            )
+            .options(joinedload(HomeworkStatus.homework).joinedload(Homework.subject))
+            .order_by(HomeworkStatus.due_date)
+        )
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    async def get_student_week_statuses(self, db: AsyncSession, student_id: int, week_id: int) -> List[HomeworkStatus]:
+        """Задания, выданные на уроках недели, со статусом ученика и файлом в одном запросе"""
+        query = (
+            select(HomeworkStatus)
+            .join(HomeworkStatus.homework)
+            .join(Schedule, Schedule.id == Homework.schedule_id)
+            .where(
+                HomeworkStatus.student_id == student_id,
+                Schedule.week_id == week_id,
+                Schedule.year_id == week_year_id(week_id)
+            )
+            .options(contains_eager(HomeworkStatus.homework).joinedload(Homework.file))
+        )
+        result = await db.execute(query)
+        return result.scalars().all()
+
+    async def set_status(
+        self,
+        db: AsyncSession,
+        homework_id: int,
+        student_id: int,
+        is_done: bool
+    ) -> Optional[HomeworkStatus]:
+        query = (
+            update(HomeworkStatus)
+            .where(HomeworkStatus.homework_id == homework_id, HomeworkStatus.student_id == student_id)
+            .values(is_done=is_done, done_at=datetime.now() if is_done else None)
+            .returning(HomeworkStatus)
+        )
+        result = await db.execute(query)
+        return result.scalars().first()
+
+
+homework_repository = HomeworkRepository(Homework)
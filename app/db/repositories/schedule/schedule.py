@@ -0,0 +1,36 @@
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.db.base import BaseRepository
+from app.db.repositories.academic_cycles.partitions import week_year_id
+from app.db.models.schedule import Schedule
+from app.db.models.user import Student, Teacher
+from app.schemas.schedule.schedule import ScheduleCreate, ScheduleUpdate
+
+
+class ScheduleRepository(BaseRepository[Schedule, ScheduleCreate, ScheduleUpdate]):
+    async def get_student_week(self, db: AsyncSession, student_id: int, week_id: int) -> List[Schedule]:
+        """Уроки класса ученика за неделю с предметом, учителем, временем и неделей в одном запросе"""
+        query = (
+            select(Schedule)
+            .join(Student, Student.class_id == Schedule.class_id)
+            .where(
+                Student.user_id == student_id,
+                Schedule.week_id == week_id,
+                Schedule.year_id == week_year_id(week_id)
+            )
+            .options(
+                joinedload(Schedule.subject),
+                joinedload(Schedule.teacher).joinedload(Teacher.user),
+                joinedload(Schedule.lesson_time),
+                joinedload(Schedule.week),
+            )
+        )
+        result = await db.execute(query)
+        return result.scalars().all()
+
+
+schedule_repository = ScheduleRepository(Schedule)
@@ -36,8 +36,7 @@ class SubjectRepository(BaseRepository[Subject, SubjectCreate, SubjectUpdate]):
     async def create(self, db: AsyncSession, subject: SubjectCreate) -> SubjectList:
         subject_obj = Subject(**subject.model_dump())
         db.add(subject_obj)
-        await db.commit()
-        await db.refresh(subject_obj)
+        await db.flush()
         return SubjectList.model_validate(subject_obj)
     
     async def delete(self, db: AsyncSession, id: int) -> None:
@@ -45,7 +44,7 @@ class SubjectRepository(BaseRepository[Subject, SubjectCreate, SubjectUpdate]):
         if not subject:
             raise ValueError("Subject not found")
         await db.delete(subject)
-        await db.commit()
+        await db.flush()
         return None
 
 
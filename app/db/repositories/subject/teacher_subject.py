@@ -14,8 +14,7 @@ class TeacherSubjectRepository(BaseRepository[TeacherSubject, TeacherSubjectCrea
     async def add_teacher_subject(self, db: AsyncSession, subject_id: int, teacher_id: int) -> TeacherSubject:
         teacher_subject = TeacherSubject(subject_id=subject_id, teacher_id=teacher_id)
         db.add(teacher_subject)
-        await db.commit()
-        await db.refresh(teacher_subject)
+        await db.flush()
         return teacher_subject
     
     async def remove_teacher_subject(self, db: AsyncSession, subject_id: int, teacher_id: int) -> None:
@@ -23,7 +22,7 @@ class TeacherSubjectRepository(BaseRepository[TeacherSubject, TeacherSubjectCrea
         if not teacher_subject:
             raise ValueError("Teacher subject not found")
         await db.delete(teacher_subject)
-        await db.commit()
+        await db.flush()
         return None
     
     async def get_teacher_subject(self, db: AsyncSession, subject_id: int, teacher_id: int) -> Optional[TeacherSubject]:
@@ -1,8 +1,8 @@
-from typing import Optional, List
+from typing import Optional, List, Set
 
 from sqlalchemy import select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import selectinload, load_only
 
 from app.db.base import BaseRepository
 from app.db.models.user import User, Student
@@ -14,8 +14,7 @@ class StudentRepository(BaseRepository[Student, StudentInDb, StudentUpdate]):
     async def create_student(self, db: AsyncSession, student_in: StudentInDb) -> Student:
         db_add = Student(**student_in.model_dump())
         db.add(db_add)
-        await db.commit()
-        await db.refresh(db_add)
+        await db.flush()
         return db_add
 
     async def get_user_student(self, db: AsyncSession, user_id: int) -> Optional[UserStudent]:
@@ -33,9 +32,11 @@ class StudentRepository(BaseRepository[Student, StudentInDb, StudentUpdate]):
         order_direction: str = "desc",
         is_active: Optional[bool] = None,
         skip: int = 0, 
-        limit: int = 100
+        limit: int = 100,
+        user_fields: Optional[Set[str]] = None,
+        student_fields: Optional[Set[str]] = None
     ) -> List[UserStudent]:
-        query = select(Student).options(selectinload(Student.user))
+        query = select(Student).options(*self.student_load_options(user_fields, student_fields))
         
         if teacher_id:
             query = query.where(
@@ -89,5 +90,35 @@ class StudentRepository(BaseRepository[Student, StudentInDb, StudentUpdate]):
         result = await db.execute(query)
         return result.scalars().all()
 
+    @staticmethod
+    def student_load_options(user_fields: Optional[Set[str]] = None, student_fields: Optional[Set[str]] = None, path=None) -> list:
+        """
+        Опции загрузки только нужных колонок (None - все). users не загружается,
+        если из нее нужен только id (он же students.user_id).
+        path - путь до учеников из другой сущности, например selectinload(Class.students).
+        """
+        options = []
+        if student_fields is not None:
+            columns = [Student.user_id, *(getattr(Student, field) for field in sorted(student_fields))]
+            options.append(path.load_only(*columns) if path is not None else load_only(*columns))
+        user_columns = None if user_fields is None else sorted(user_fields - {"id"})
+        if user_columns is None or user_columns:
+            user_path = path.joinedload(Student.user) if path is not None else selectinload(Student.user)
+            if user_columns:
+                user_path = user_path.load_only(*[getattr(User, field) for field in user_columns])
+            options.append(user_path)
+        elif path is not None:
+            options.append(path)
+        return options
+
+    async def get_class_student_ids(self, db: AsyncSession, class_id: int, student_ids: List[int]) -> Set[int]:
+        """Возвращает те из переданных id, которые числятся в классе (одним запросом)"""
+        query = select(Student.user_id).where(
+            Student.class_id == class_id,
+            Student.user_id.in_(student_ids)
+        )
+        result = await db.execute(query)
+        return set(result.scalars().all())
+
 
 student_repository = StudentRepository(Student) 
\ No newline at end of file
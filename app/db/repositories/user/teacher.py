@@ -14,8 +14,7 @@ class TeacherRepository(BaseRepository[Teacher, TeacherInDb, TeacherUpdate]):
     async def create_teacher(self, db: AsyncSession, teacher_in: TeacherInDb) -> Teacher:
         db_add = Teacher(**teacher_in.model_dump())
         db.add(db_add)
-        await db.commit()
-        await db.refresh(db_add)
+        await db.flush()
         return db_add
 
     async def get_user_teacher(self, db: AsyncSession, user_id: int) -> Optional[UserTeacher]:
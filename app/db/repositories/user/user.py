@@ -76,8 +76,7 @@ class UserRepository(BaseRepository[User, UserCreate, UserUpdate]):
             return None 
         user.is_active = False
         db.add(user)
-        await db.commit()
-        await db.refresh(user)
+        await db.flush()
         return user
 
 
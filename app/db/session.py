@@ -1,22 +1,99 @@
-from typing import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, AsyncIterator, Optional
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 from app.core.config import settings
+from app.core.request_context import get_request_stats
+from app.db.instrumentation import instrument_engine
+from app.db.nplusone import install_nplusone_detector
+from app.db.replicas import REPLICA_KEY, ReplicaPool, request_user_key
+from app.db.slow_queries import slow_query_log
 
 db_url = str(settings.DATABASE_URL)
 
-engine = create_async_engine(db_url, echo=True)
+engine = create_async_engine(db_url, echo=settings.DB_ECHO)
+instrument_engine(engine.sync_engine)
+install_nplusone_detector(engine.sync_engine)
+slow_query_log.bind(engine)
 AsyncSessionLocal = sessionmaker(
     engine, class_=AsyncSession, expire_on_commit=False
 )
 
+replica_pool = ReplicaPool(
+    check_interval=float(settings.REPLICA_HEALTH_CHECK_INTERVAL),
+    sticky_seconds=float(settings.READ_YOUR_WRITES_SECONDS)
+)
+for index, replica_url in enumerate(url.strip() for url in settings.DATABASE_REPLICA_URLS.split(",")):
+    if not replica_url:
+        continue
+    replica_engine = create_async_engine(replica_url, echo=settings.DB_ECHO, pool_pre_ping=True)
+    instrument_engine(replica_engine.sync_engine, database=f"replica{index}")
+    install_nplusone_detector(replica_engine.sync_engine)
+    replica_pool.add(f"replica{index}", replica_engine)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Сессия запроса - единица работы: репозитории только делают flush,
+    транзакция фиксируется один раз после эндпоинта. Исключение или ответ
+    error_response откатывают все изменения запроса.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+        else:
+            stats = get_request_stats()
+            if stats is not None and (stats.rollback or stats.nplusone):
+                await session.rollback()
+            elif session.in_transaction():
+                await session.commit()
+                if request.method not in SAFE_METHODS:
+                    replica_pool.mark_written(request_user_key(request.headers.get("authorization")))
+        finally:
+            await session.close()
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Dependency for getting async DB session"""
+
+@asynccontextmanager
+async def read_session(user_key: Optional[str] = None) -> AsyncIterator[AsyncSession]:
+    """
+    Сессия только для чтения (отчеты, аналитика, выгрузки): реплика по кругу,
+    если они настроены и доступны, иначе основная база. Пользователь, недавно
+    выполнявший запись, читает из основной базы READ_YOUR_WRITES_SECONDS секунд.
+    """
+    replica = replica_pool.choose(user_key)
+    session_factory = replica.session_factory if replica is not None else AsyncSessionLocal
+    async with session_factory() as session:
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+@asynccontextmanager
+async def primary_session(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """
+    Сессия для заполнения общих кэшей воркера: сама db, если она на основной
+    базе, иначе отдельная сессия основной базы. Отстающая реплика не должна
+    попасть в кэш на весь TTL.
+    """
+    if REPLICA_KEY not in db.info:
+        yield db
+        return
     async with AsyncSessionLocal() as session:
         try:
             yield session
         finally:
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    async with read_session(request_user_key(request.headers.get("authorization"))) as session:
+        yield session
\ No newline at end of file
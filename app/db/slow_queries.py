@@ -0,0 +1,97 @@
+import asyncio
+import logging
+import random
+import re
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.config import settings
+from app.core.request_context import get_request_stats
+
+logger = logging.getLogger("app.slow_query")
+
+EXPLAIN_PREFIX = "EXPLAIN (ANALYZE, BUFFERS) "
+# SELECT с блокировкой строк повторно не выполняется
+ROW_LOCK_RE = re.compile(r"\bFOR\s+(?:NO\s+KEY\s+UPDATE|UPDATE|KEY\s+SHARE|SHARE)\b", re.IGNORECASE)
+
+
+class SlowQueryLog:
+    """
+    Журнал медленных SQL-запросов: запись в лог с параметрами и маршрутом
+    и кольцевой буфер последних записей с планами EXPLAIN (ANALYZE, BUFFERS).
+    """
+
+    def __init__(self, maxsize: int):
+        self.entries: Deque[Dict[str, Any]] = deque(maxlen=maxsize)
+        self.engine: Optional[AsyncEngine] = None
+        self._tasks = set()
+
+    def bind(self, engine: AsyncEngine) -> None:
+        self.engine = engine
+
+    def record(self, statement: str, parameters: Any, elapsed: float) -> None:
+        if statement.startswith(EXPLAIN_PREFIX):
+            return
+
+        stats = get_request_stats()
+        entry = {
+            "recorded_at": datetime.now(),
+            "duration_ms": round(elapsed * 1000, 2),
+            "statement": statement,
+            "parameters": repr(parameters)[:1000],
+            "route": f"{stats.method} {stats.route or stats.path}" if stats else None,
+            "request_id": stats.request_id if stats else None,
+            "plan": None,
+        }
+        self.entries.append(entry)
+        logger.warning(
+            f"Slow query {entry['duration_ms']}ms ({entry['route']}): {statement} {entry['parameters']}",
+            extra={key: value for key, value in entry.items() if key not in ("plan", "recorded_at")}
+        )
+
+        if self._should_explain(statement):
+            self._schedule_explain(entry, statement, parameters)
+
+    def _should_explain(self, statement: str) -> bool:
+        # ANALYZE выполняет запрос повторно, поэтому только для чтения
+        # и без блокировок строк; побочные эффекты функций отсекает READ ONLY в _explain
+        return (
+            settings.SLOW_QUERY_EXPLAIN
+            and self.engine is not None
+            and statement.lstrip().upper().startswith("SELECT")
+            and not ROW_LOCK_RE.search(statement)
+            and random.random() < settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE
+        )
+
+    def _schedule_explain(self, entry: Dict[str, Any], statement: str, parameters: Any) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._explain(entry, statement, parameters))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _explain(self, entry: Dict[str, Any], statement: str, parameters: Any) -> None:
+        try:
+            async with self.engine.connect() as conn:
+                try:
+                    await conn.exec_driver_sql("SET TRANSACTION READ ONLY")
+                    result = await conn.exec_driver_sql(EXPLAIN_PREFIX + statement, tuple(parameters or ()))
+                    entry["plan"] = "\n".join(row[0] for row in result)
+                finally:
+                    await conn.rollback()
+        except Exception as e:
+            entry["plan"] = f"EXPLAIN failed: {e}"
+
+    def get_entries(self) -> List[Dict[str, Any]]:
+        return list(reversed(self.entries))
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
+slow_query_log = SlowQueryLog(maxsize=settings.SLOW_QUERY_BUFFER_SIZE)
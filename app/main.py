@@ -1,15 +1,22 @@
 import uvicorn
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.api import api_router
 from app.core.config import settings
 from app.core.logger import setup_logging
+from app.core.metrics import render_metrics
+from app.db.session import replica_pool
+from app.middleware.compression import CompressionMiddleware
+from app.middleware.timing import RequestTimingMiddleware
+from app.middleware.profiling import RequestProfilingMiddleware
 import logging
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse
 )
 setup_logging()
 logger = logging.getLogger("app")
@@ -20,15 +27,35 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing", "X-Request-ID", "X-Profile-Id"],
 )
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(RequestProfilingMiddleware)
+app.add_middleware(RequestTimingMiddleware)
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
 
+@app.on_event("startup")
+async def start_replica_health_checks():
+    replica_pool.start()
+
+
+@app.on_event("shutdown")
+async def stop_replica_health_checks():
+    await replica_pool.stop()
+
+
 @app.get("/")
 async def root():
     return {"message": "Welcome to School Diary API"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    content, content_type = render_metrics()
+    return Response(content=content, headers={"Content-Type": content_type})
+
+
 if __name__ == "__main__":
     uvicorn.run("app.main:app", host="0.0.0.0", port=settings.PORT, reload=True)
\ No newline at end of file
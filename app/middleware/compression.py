@@ -0,0 +1,164 @@
+import gzip
+import zlib
+from typing import Optional
+
+import anyio.to_thread
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+
+SUPPORTED_ENCODINGS = ("br", "gzip")
+COMPRESSIBLE_TYPES = (
+    "application/json", "application/javascript", "application/xml",
+    "application/problem+json", "image/svg+xml", "text/"
+)
+
+
+def select_encoding(accept_encoding: str) -> Optional[str]:
+    """Выбор кодирования по Accept-Encoding с учетом q; при равенстве - br"""
+    weights = {}
+    for part in accept_encoding.lower().split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            weights[coding.strip()] = quality
+    wildcard = weights.get("*", 0.0)
+    best, best_quality = None, 0.0
+    for coding in SUPPORTED_ENCODINGS:
+        quality = weights.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    content_type = content_type.split(";", 1)[0].strip().lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or content_type.endswith(("+json", "+xml"))
+
+
+class CompressionMiddleware:
+    """
+    Сжатие ответов gzip/brotli по Accept-Encoding. Сжимаются только
+    текстовые типы (JSON, CSV, ...) не меньше minimum_size байт; ответы с
+    Content-Encoding и бинарные файлы (архивы, изображения, xlsx) отдаются
+    как есть. Тела от thread_min_size байт сжимаются в пуле потоков, чтобы не
+    блокировать цикл событий; потоковые ответы сжимаются по частям.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = settings.COMPRESSION_MIN_SIZE,
+        thread_min_size: int = settings.COMPRESSION_THREAD_MIN_SIZE,
+        gzip_level: int = settings.COMPRESSION_GZIP_LEVEL,
+        brotli_quality: int = settings.COMPRESSION_BROTLI_QUALITY,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.thread_min_size = thread_min_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressionResponder(self, encoding, send)(self.app, scope, receive)
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, mode=brotli.MODE_TEXT, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+
+class _StreamCompressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(mode=brotli.MODE_TEXT, quality=brotli_quality)
+            self._zlib = None
+        else:
+            self._brotli = None
+            self._zlib = zlib.compressobj(gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def chunk(self, data: bytes, last: bool) -> bytes:
+        # Каждая часть сбрасывается сразу, чтобы клиент получал данные по мере выгрузки
+        if self._brotli is not None:
+            return self._brotli.process(data) + (self._brotli.finish() if last else self._brotli.flush())
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_FINISH if last else zlib.Z_SYNC_FLUSH)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start_message: Optional[Message] = None
+        self.passthrough = False
+        self.stream: Optional[_StreamCompressor] = None
+
+    async def __call__(self, app: ASGIApp, scope: Scope, receive: Receive) -> None:
+        await app(scope, receive, self.send_wrapper)
+
+    async def send_wrapper(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                "content-encoding" in headers
+                or message["status"] in (204, 304)
+                or not is_compressible(headers.get("content-type", ""))
+            )
+            if self.passthrough:
+                await self.send(message)
+            else:
+                # Заголовки отправляются вместе с первой частью тела,
+                # когда станет известно, сжимается ли ответ
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.stream is not None:
+            message["body"] = self.stream.chunk(body, last=not more_body)
+            await self.send(message)
+            return
+
+        headers = MutableHeaders(scope=self.start_message)
+        headers.add_vary_header("Accept-Encoding")
+
+        if not more_body:
+            if len(body) >= self.middleware.minimum_size:
+                if len(body) >= self.middleware.thread_min_size:
+                    body = await anyio.to_thread.run_sync(self.middleware.compress, self.encoding, body)
+                else:
+                    body = self.middleware.compress(self.encoding, body)
+                headers["Content-Encoding"] = self.encoding
+                headers["Content-Length"] = str(len(body))
+                message["body"] = body
+            await self.send(self.start_message)
+            await self.send(message)
+            return
+
+        self.stream = _StreamCompressor(self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+        headers["Content-Encoding"] = self.encoding
+        if "content-length" in headers:
+            del headers["Content-Length"]
+        await self.send(self.start_message)
+        message["body"] = self.stream.chunk(body, last=False)
+        await self.send(message)
@@ -0,0 +1,64 @@
+import threading
+import uuid
+
+from jose import JWTError, jwt
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.profiling import StackSampler, request_profiles
+from app.db.models.user import UserRole
+from app.db.session import AsyncSessionLocal
+from app.services.auth import get_user_by_id
+
+
+async def _is_admin(headers: Headers) -> bool:
+    authorization = headers.get("authorization", "")
+    if not authorization.lower().startswith("bearer "):
+        return False
+    try:
+        payload = jwt.decode(authorization[7:], settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        user_id = int(payload.get("sub"))
+    except (JWTError, TypeError, ValueError):
+        return False
+    async with AsyncSessionLocal() as db:
+        user = await get_user_by_id(db, user_id)
+    return user is not None and user.is_active and user.role == UserRole.ADMIN
+
+
+class RequestProfilingMiddleware:
+    """
+    Профилирование отдельного запроса администратора по заголовку X-Profile: 1.
+    Сэмплируется поток event loop, поэтому в профиль попадают и конкурентные запросы.
+    Идентификатор профиля возвращается в заголовке X-Profile-Id,
+    сам профиль - через GET /admin/profiling/requests/{profile_id}.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if headers.get("x-profile") != "1" or not await _is_admin(headers):
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = uuid.uuid4().hex
+        sampler = StackSampler(
+            interval=settings.PROFILING_INTERVAL_MS / 1000,
+            thread_id=threading.get_ident()
+        ).start()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["X-Profile-Id"] = profile_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_profiles.add(profile_id, sampler.stop())
@@ -0,0 +1,101 @@
+import logging
+
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import REQUEST_LATENCY, REQUESTS_IN_FLIGHT
+from app.core.request_context import RequestStats, start_request, finish_request
+
+logger = logging.getLogger("app.request")
+
+
+def route_template(scope: Scope) -> str:
+    """Шаблон пути маршрута (/class/{class_id}) вместо фактического пути"""
+    route = scope.get("route")
+    return getattr(route, "path_format", None) or getattr(route, "path", None) or "unmatched"
+
+
+class RequestTimingMiddleware:
+    """
+    Замеряет время обработки запроса и время/количество SQL-запросов к БД.
+    Результат отдается в заголовке Server-Timing и пишется в лог одной записью.
+    При NPLUSONE_DETECTION=raise ответ запроса с N+1 заменяется на 500.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(method=scope["method"], path=scope["path"])
+        request_id = Headers(scope=scope).get("x-request-id")
+        if request_id:
+            stats.request_id = request_id[:64]
+        token = start_request(stats)
+        status_code = 500
+        replaced = False
+        REQUESTS_IN_FLIGHT.inc()
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code, replaced
+            if replaced:
+                # Тело исходного ответа не отправляется
+                return
+            body = None
+            if message["type"] == "http.response.start" and stats.nplusone and settings.NPLUSONE_DETECTION == "raise":
+                replaced = True
+                message, body = self.nplusone_response(stats)
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                stats.route = route_template(scope)
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", self.server_timing(stats))
+                headers["X-Request-ID"] = stats.request_id
+            await send(message)
+            if body is not None:
+                await send({"type": "http.response.body", "body": body})
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            stats.route = route_template(scope)
+            REQUEST_LATENCY.labels(method=stats.method, route=stats.route, status=status_code).observe(stats.elapsed)
+            elapsed_ms = stats.elapsed * 1000
+            logger.info(
+                f"{stats.method} {stats.route} {status_code} {elapsed_ms:.1f}ms "
+                f"db={stats.db_count}/{stats.db_time * 1000:.1f}ms",
+                extra={
+                    "request_id": stats.request_id,
+                    "method": stats.method,
+                    "path": stats.path,
+                    "route": stats.route,
+                    "status": status_code,
+                    "duration_ms": round(elapsed_ms, 2),
+                    "db_count": stats.db_count,
+                    "db_time_ms": round(stats.db_time * 1000, 2),
+                }
+            )
+            finish_request(token)
+
+    @staticmethod
+    def nplusone_response(stats: RequestStats):
+        logger.error(f"N+1 detected: {stats.nplusone[0]}", extra={"request_id": stats.request_id})
+        response = ORJSONResponse(
+            {"result": False, "message": stats.nplusone[0], "error_code": "NPLUSONE_DETECTED"},
+            status_code=500
+        )
+        message = {"type": "http.response.start", "status": response.status_code, "headers": response.raw_headers}
+        return message, response.body
+
+    @staticmethod
+    def server_timing(stats: RequestStats) -> str:
+        return (
+            f'db;dur={stats.db_time * 1000:.1f};desc="{stats.db_count} queries", '
+            f"app;dur={stats.elapsed * 1000:.1f}"
+        )
@@ -11,4 +11,18 @@ class AcademicPeriodList(BaseModel):
     year_id: int
     
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class AcademicPeriodCreate(BaseModel):
+    year_id: int
+    name: str
+    order_num: int
+    start_date: date
+    end_date: date
+    is_current: bool = False
+
+class AcademicPeriodUpdate(BaseModel):
+    name: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    is_current: Optional[bool] = None
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+class AcademicWeekCreate(BaseModel):
+    period_id: int
+    week_num: int
+    name: str
+    start_date: datetime
+    end_date: datetime
+    is_holiday: bool = False
+
+class AcademicWeekUpdate(BaseModel):
+    name: Optional[str] = None
+    is_holiday: Optional[bool] = None
+
+class AcademicWeekList(BaseModel):
+    id: int
+    period_id: int
+    week_num: int
+    name: str
+    start_date: datetime
+    end_date: datetime
+    is_holiday: bool
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,27 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+
+
+class SlowQuery(BaseModel):
+    recorded_at: datetime
+    duration_ms: float
+    statement: str
+    parameters: Optional[str] = None
+    route: Optional[str] = None
+    request_id: Optional[str] = None
+    plan: Optional[str] = None
+
+
+class ImportRejectedRow(BaseModel):
+    line: int
+    error: str
+
+
+class ImportReport(BaseModel):
+    kind: str
+    total_rows: int
+    imported: int
+    skipped: int
+    rejected_count: int
+    rejected: List[ImportRejectedRow]
@@ -0,0 +1,38 @@
+from pydantic import BaseModel
+from typing import Optional, List, Dict
+
+
+class SubjectStats(BaseModel):
+    subject_id: int
+    subject_name: Optional[str] = None
+    grades_count: int
+    mean: float
+    std: float
+    p25: float
+    median: float
+    p75: float
+
+class AtRiskStudent(BaseModel):
+    student_id: int
+    full_name: Optional[str] = None
+    class_id: int
+    grades_count: int
+    mean: float
+    trend: float
+    reasons: List[str]
+
+class ClassSummary(BaseModel):
+    class_id: int
+    class_name: Optional[str] = None
+    grades_count: int
+    mean: Optional[float] = None
+    at_risk_count: int
+
+class ClassAnalytics(BaseModel):
+    period_id: int
+    grades_count: int
+    mean: Optional[float] = None
+    distribution: Dict[int, int]
+    subjects: List[SubjectStats] = []
+    at_risk: List[AtRiskStudent] = []
+    classes: List[ClassSummary] = []
@@ -1,5 +1,7 @@
 from pydantic import BaseModel
-from typing import Generic, TypeVar, Optional, List
+
+from app.core.request_context import mark_rollback
+from typing import Generic, TypeVar, Optional, List, Iterable, Set
 
 T = TypeVar('T')
 
@@ -33,8 +35,20 @@ def success_response(data, message: str = "Success") -> dict:
     }
 
 def error_response(message: str, error_code: Optional[str] = None) -> dict:
+    # Ответ с ошибкой не фиксирует частично выполненные изменения запроса
+    mark_rollback()
     return {
         "result": False,
         "message": message,
         "error_code": error_code
-    } 
\ No newline at end of file
+    }
+
+def parse_fields(fields: Optional[str], allowed: Iterable[str]) -> Optional[Set[str]]:
+    """Разбор параметра fields=a,b,c; None - запрошены все поля"""
+    if not fields:
+        return None
+    requested = {field.strip() for field in fields.split(",") if field.strip()}
+    unknown = requested - set(allowed)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested
@@ -0,0 +1,53 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import date, datetime, time
+
+
+class DiaryGrade(BaseModel):
+    id: int
+    score: int
+    weight: int
+    comment: Optional[str] = None
+    homework_id: Optional[int] = None
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+class DiaryHomework(BaseModel):
+    homework_id: int
+    description: str
+    due_date: Optional[datetime] = None
+    file_id: Optional[int] = None
+    file_name: Optional[str] = None
+    is_done: bool
+    done_at: Optional[datetime] = None
+
+class DiaryLesson(BaseModel):
+    schedule_id: int
+    lesson_num: int
+    start_time: time
+    end_time: time
+    subject_id: int
+    subject_name: str
+    teacher_id: int
+    teacher_name: Optional[str] = None
+    location: Optional[str] = None
+    description: Optional[str] = None
+    is_replacement: bool = False
+    is_cancelled: bool = False
+    homework: List[DiaryHomework] = []
+    grades: List[DiaryGrade] = []
+
+class DiaryDay(BaseModel):
+    day_of_week: int
+    date: Optional[date] = None
+    lessons: List[DiaryLesson] = []
+
+class DiaryWeek(BaseModel):
+    student_id: int
+    week_id: int
+    week_name: Optional[str] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+    days: List[DiaryDay] = []
@@ -0,0 +1,50 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+
+class GradeEntry(BaseModel):
+    student_id: int
+    score: int = Field(ge=1, le=5)
+    weight: int = Field(default=1, ge=1, le=10)
+    comment: Optional[str] = None
+
+class GradeCreate(BaseModel):
+    schedule_id: int
+    student_id: int
+    subject_id: int
+    teacher_id: int
+    homework_id: Optional[int] = None
+    score: int
+    weight: int = 1
+    comment: Optional[str] = None
+
+class GradeUpdate(BaseModel):
+    score: Optional[int] = None
+    weight: Optional[int] = None
+    comment: Optional[str] = None
+
+class GradeList(BaseModel):
+    id: int
+    schedule_id: int
+    student_id: int
+    subject_id: int
+    teacher_id: int
+    homework_id: Optional[int] = None
+    score: int
+    weight: int
+    comment: Optional[str] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class GradeAverageList(BaseModel):
+    subject_id: int
+    subject_name: str
+    period_id: int
+    grades_count: int
+    average: Optional[float] = None
+    last_score: Optional[int] = None
+    last_graded_at: Optional[datetime] = None
@@ -0,0 +1,66 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class HomeworkAssign(BaseModel):
+    schedule_id: int
+    description: str
+    due_date: Optional[datetime] = None
+    file_id: Optional[int] = None
+
+class HomeworkCreate(BaseModel):
+    schedule_id: int
+    class_id: int
+    teacher_id: int
+    subject_id: int
+    description: str
+    assignment_at: datetime
+    due_date: Optional[datetime] = None
+    file_id: Optional[int] = None
+
+class HomeworkUpdate(BaseModel):
+    description: Optional[str] = None
+    due_date: Optional[datetime] = None
+    file_id: Optional[int] = None
+
+class HomeworkList(BaseModel):
+    id: int
+    schedule_id: int
+    class_id: int
+    teacher_id: int
+    subject_id: int
+    description: str
+    assignment_at: datetime
+    due_date: Optional[datetime] = None
+    file_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    students_count: int = 0
+
+    class Config:
+        from_attributes = True
+
+class HomeworkStatusUpdate(BaseModel):
+    is_done: bool
+
+class HomeworkStatusList(BaseModel):
+    homework_id: int
+    student_id: int
+    due_date: Optional[datetime] = None
+    is_done: bool
+    done_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class StudentHomework(BaseModel):
+    homework_id: int
+    schedule_id: int
+    subject_id: int
+    subject_name: str
+    description: str
+    assignment_at: datetime
+    due_date: Optional[datetime] = None
+    file_id: Optional[int] = None
+    is_done: bool
+    done_at: Optional[datetime] = None
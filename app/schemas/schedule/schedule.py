@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class ScheduleCreate(BaseModel):
+    week_id: int
+    lesson_time_id: int
+    class_id: int
+    teacher_id: int
+    subject_id: int
+    day_of_week: int
+    location: Optional[str] = None
+    description: Optional[str] = None
+    is_replacement: bool = False
+    is_cancelled: bool = False
+    original_teacher_id: Optional[int] = None
+
+class ScheduleUpdate(BaseModel):
+    week_id: Optional[int] = None
+    lesson_time_id: Optional[int] = None
+    teacher_id: Optional[int] = None
+    subject_id: Optional[int] = None
+    day_of_week: Optional[int] = None
+    location: Optional[str] = None
+    description: Optional[str] = None
+    is_replacement: Optional[bool] = None
+    is_cancelled: Optional[bool] = None
+    original_teacher_id: Optional[int] = None
@@ -26,6 +26,10 @@ class StudentUpdate(StudentBase):
     parent_email: Optional[str] = None
     parent_fio: Optional[str] = None
 
+# Поля, доступные в параметре fields= списков учеников
+STUDENT_USER_FIELDS = ("id", "email", "username", "full_name", "is_active", "role")
+STUDENT_INFO_FIELDS = ("class_id", "parent_phone", "parent_email", "parent_fio")
+
 class UserWithStudentInfo(BaseModel):
     user_info: UserResponse
     student_info: Student
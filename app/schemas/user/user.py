@@ -10,6 +10,9 @@ class UserBase(BaseModel):
     role: Optional[UserRole] = None
 
 class UserResponse(UserBase):
+    # Адрес из базы проверен при создании пользователя; повторная проверка
+    # email_validator в ответах - основная стоимость сериализации списков
+    email: Optional[str] = None
     id: int
     
     class Config:
@@ -28,6 +31,7 @@ class UserInDBBase(UserBase):
         from_attributes = True
 
 class User(UserInDBBase):
+    email: Optional[str] = None
     id: int
 
 class UserInDB(UserInDBBase):
@@ -1,14 +1,143 @@
+from calendar import isleap
+from datetime import date, datetime, time, timedelta
+from typing import List, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, or_, and_, update
+from app.core.config import settings
+from app.db.after_commit import after_commit
 from app.db.models.academic_cycles import AcademicYear
 from app.schemas.academic_cycles.academic_year import AcademicYearCreate, AcademicYearList
+from app.schemas.academic_cycles.academic_period import AcademicPeriodCreate
+from app.schemas.academic_cycles.academic_week import AcademicWeekCreate
 from app.db.repositories.academic_cycles.academic_years import academic_years_repository
+from app.db.repositories.academic_cycles.academic_periods import academic_periods_repository
+from app.db.repositories.academic_cycles.academic_weeks import academic_weeks_repository
+from app.db.repositories.academic_cycles.partitions import year_partition_repository
+from app.services.calendar import calendar_cache
+from app.services.etag import bump_resource_versions
+
+# Название периода по их количеству в году
+PERIOD_NAMES = {2: "полугодие", 3: "триместр", 4: "четверть"}
+
+
+def parse_holidays(value: str) -> List[Tuple[Tuple[int, int], Tuple[int, int]]]:
+    """Каникулы вида "MM-DD:MM-DD,..."; диапазон может переходить через новый год"""
+    ranges = []
+    for item in filter(None, (part.strip() for part in value.split(","))):
+        try:
+            bounds = []
+            for bound in item.split(":"):
+                month, day = (int(num) for num in bound.split("-"))
+                # Проверка даты в високосном году: 02-29 допустимо
+                date(2000, month, day)
+                bounds.append((month, day))
+            begin, end = bounds
+            ranges.append((begin, end))
+        except ValueError:
+            raise ValueError(f"Invalid holiday range '{item}', expected MM-DD:MM-DD")
+    return ranges
+
+
+def _month_day(year: int, month_day: Tuple[int, int]) -> date:
+    month, day = month_day
+    # 29 февраля в невисокосный год - 28 февраля
+    if (month, day) == (2, 29) and not isleap(year):
+        day = 28
+    return date(year, month, day)
+
+
+def _holiday_dates(start_date: date, end_date: date, holidays) -> Set[date]:
+    days = set()
+    for year in range(start_date.year - 1, end_date.year + 1):
+        for begin, end in holidays:
+            first = _month_day(year, begin)
+            last = _month_day(year + 1 if end < begin else year, end)
+            day = max(first, start_date)
+            while day <= min(last, end_date):
+                days.add(day)
+                day += timedelta(days=1)
+    return days
+
+
+def build_periods_and_weeks(start_date: date, end_date: date, holidays) -> List[Tuple[dict, List[dict]]]:
+    """
+    Делит учебный год на недели (понедельник - воскресенье) и периоды.
+    Неделя каникулярная, если большая часть ее будних дней в пределах года
+    попадает в каникулы;
+    новый период начинается с первой учебной недели после каникул.
+    Возвращает пары (период, недели периода) без year_id и period_id.
+    """
+    holiday_days = _holiday_dates(start_date, end_date, holidays)
+    groups: List[List[Tuple[date, bool]]] = []
+    monday = start_date - timedelta(days=start_date.weekday())
+    after_holiday = False
+    while monday <= end_date:
+        workdays = [
+            day for day in (monday + timedelta(days=offset) for offset in range(5))
+            if start_date <= day <= end_date
+        ]
+        is_holiday = sum(day in holiday_days for day in workdays) * 2 > len(workdays) or not workdays
+        if not groups or (after_holiday and not is_holiday and any(
+            not week_holiday for _, week_holiday in groups[-1]
+        )):
+            groups.append([])
+        groups[-1].append((monday, is_holiday))
+        after_holiday = is_holiday
+        monday += timedelta(weeks=1)
+
+    name = PERIOD_NAMES.get(len(groups), "период")
+    result = []
+    for index, group in enumerate(groups):
+        period_start = max(group[0][0], start_date)
+        period_end = groups[index + 1][0][0] - timedelta(days=1) if index + 1 < len(groups) else end_date
+        period = {
+            "name": f"{index + 1} {name}",
+            "order_num": index + 1,
+            "start_date": period_start,
+            "end_date": period_end,
+        }
+        weeks = []
+        for week_num, (week_start, is_holiday) in enumerate(group, start=1):
+            start = datetime.combine(week_start, time.min)
+            weeks.append({
+                "week_num": week_num,
+                "name": f"Неделя {week_num}",
+                "start_date": start,
+                "end_date": start + timedelta(days=6, hours=23, minutes=59),
+                "is_holiday": is_holiday,
+            })
+        result.append((period, weeks))
+    return result
+
+
+async def _create_periods_and_weeks(db: AsyncSession, year: AcademicYear) -> None:
+    """
+    Периоды - одним INSERT ... RETURNING, недели всех периодов - одним INSERT.
+    is_current периодам не ставится: текущий период определяется по дате (Calendar.current_period).
+    """
+    plan = build_periods_and_weeks(year.start_date, year.end_date, parse_holidays(settings.ACADEMIC_HOLIDAYS))
+    periods = await academic_periods_repository.bulk_create(db=db, objs_in=[
+        AcademicPeriodCreate(year_id=year.id, **period)
+        for period, _ in plan
+    ])
+    period_ids = {period.order_num: period.id for period in periods}
+    await academic_weeks_repository.bulk_create(db=db, objs_in=[
+        AcademicWeekCreate(period_id=period_ids[period["order_num"]], **week)
+        for period, weeks in plan
+        for week in weeks
+    ], returning=False)
+
 
 async def create_academic_year(db: AsyncSession, academic_year: AcademicYearCreate) -> AcademicYearList:
     """
-    Создает год(с проверкой на пересечения по датам и названию).
+    Создает год(с проверкой на пересечения по датам и названию),
+    секции года в schedule и grades, периоды и недели по датам года
+    (каникулы из ACADEMIC_HOLIDAYS отмечаются is_holiday).
     """
     try:
+        if academic_year.end_date <= academic_year.start_date:
+            raise ValueError("Academic year end date must be after start date")
+
         query = select(AcademicYear).where(
             or_(
                 AcademicYear.name == academic_year.name,
@@ -38,6 +167,10 @@ async def create_academic_year(db: AsyncSession, academic_year: AcademicYearCrea
             )
         
         created_year = await academic_years_repository.create(db=db, obj_in=academic_year)
+        await year_partition_repository.create(db=db, year_id=created_year.id)
+        await _create_periods_and_weeks(db=db, year=created_year)
+        await bump_resource_versions(db, "academic_cycles")
+        after_commit(db, calendar_cache.invalidate)
         
         return AcademicYearList.model_validate(created_year)
         
@@ -0,0 +1,26 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.user import User, UserRole
+from app.db.repositories.user.student import student_repository
+from app.db.repositories.user.teacher import teacher_repository
+
+
+async def can_access_student(db: AsyncSession, current_user: User, student_id: int) -> bool:
+    """
+    Доступ к данным ученика: администратор, сам ученик,
+    классный руководитель или учитель, ведущий уроки в классе ученика.
+    """
+    if current_user.role == UserRole.ADMIN:
+        return True
+    if current_user.role == UserRole.STUDENT:
+        return current_user.id == student_id
+    if current_user.role != UserRole.TEACHER:
+        return False
+
+    student = await student_repository.get_user_student(db=db, user_id=student_id)
+    if not student or not student.class_id:
+        return False
+    teacher = await teacher_repository.get_user_teacher(db=db, user_id=current_user.id)
+    if teacher and teacher.class_id == student.class_id:
+        return True
+    return await teacher_repository.is_class_teacher(db=db, user_id=current_user.id, class_id=student.class_id)
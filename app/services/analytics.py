@@ -0,0 +1,262 @@
+from typing import Dict, List, Optional
+
+import numpy as np
+from sqlalchemy import select, func, cast, Float
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.models.academic_cycles import AcademicWeek
+from app.db.models.class_ import Class
+from app.db.models.schedule import Grade, Schedule
+from app.db.models.subject import Subject
+from app.db.models.user import User
+from app.db.repositories.academic_cycles.partitions import period_year_id
+from app.db.session import primary_session
+from app.schemas.analytics.analytics import ClassAnalytics
+from app.services.calendar import calendar_cache
+
+# Промах кэша считается по основной базе (primary_session): результат живет
+# ANALYTICS_CACHE_TTL секунд и не должен отставать вместе с репликой
+analytics_cache = TTLCache(ttl=settings.ANALYTICS_CACHE_TTL, maxsize=512)
+
+# Агрегированные отчеты (параллель, школа) сбрасываются при любой записи оценок
+AGGREGATE_TAG = "analytics:aggregate"
+
+SCORES = (1, 2, 3, 4, 5)
+PERCENTILES = (0.25, 0.5, 0.75)
+
+
+async def _load_grade_columns(
+    db: AsyncSession,
+    period_id: int,
+    class_id: Optional[int] = None,
+    grade_level: Optional[int] = None
+) -> Dict[str, np.ndarray]:
+    """
+    Загружает оценки периода одним запросом сразу в виде колонок (array_agg),
+    без построчного создания ORM-объектов.
+    """
+    day = cast(func.extract("epoch", Grade.created_at) / 86400, Float)
+    query = select(
+        func.array_agg(Grade.student_id),
+        func.array_agg(Grade.subject_id),
+        func.array_agg(Schedule.class_id),
+        func.array_agg(Grade.score),
+        func.array_agg(Grade.weight),
+        func.array_agg(day)
+    ).join(
+        Schedule, (Schedule.id == Grade.schedule_id) & (Schedule.year_id == Grade.year_id)
+    ).join(
+        AcademicWeek, AcademicWeek.id == Schedule.week_id
+    ).where(
+        AcademicWeek.period_id == period_id,
+        Grade.year_id == period_year_id(period_id)
+    )
+    if class_id is not None:
+        query = query.where(Schedule.class_id == class_id)
+    if grade_level is not None:
+        query = query.join(Class, Class.id == Schedule.class_id).where(Class.grade_level == grade_level)
+
+    row = (await db.execute(query)).one()
+    names = ("student_id", "subject_id", "class_id", "score", "weight", "day")
+    dtypes = (np.int64, np.int64, np.int64, np.float64, np.float64, np.float64)
+    return {
+        name: np.asarray(values or [], dtype=dtype)
+        for name, values, dtype in zip(names, row, dtypes)
+    }
+
+
+def _group_percentiles(inverse: np.ndarray, values: np.ndarray, counts: np.ndarray) -> List[np.ndarray]:
+    """Перцентили (линейная интерполяция, как np.percentile) для всех групп сразу"""
+    sorted_values = values[np.lexsort((values, inverse))]
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    result = []
+    for q in PERCENTILES:
+        position = starts + (counts - 1) * q
+        lower = np.floor(position).astype(np.int64)
+        upper = np.ceil(position).astype(np.int64)
+        result.append(sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower))
+    return result
+
+
+def compute_statistics(columns: Dict[str, np.ndarray]) -> dict:
+    """
+    Векторный расчет статистики по колонкам оценок: распределение, средние
+    и разброс по предметам, сводка по классам и ученики группы риска.
+    """
+    score = columns["score"]
+    weight = columns["weight"]
+    total = int(score.size)
+    if total == 0:
+        return {
+            "grades_count": 0,
+            "mean": None,
+            "distribution": {value: 0 for value in SCORES},
+            "subjects": [],
+            "at_risk": [],
+            "classes": [],
+        }
+
+    weighted = score * weight
+    distribution = np.bincount(score.astype(np.int64), minlength=max(SCORES) + 1)
+
+    # По предметам
+    subject_ids, subject_inv, subject_counts = np.unique(columns["subject_id"], return_inverse=True, return_counts=True)
+    subject_mean = np.bincount(subject_inv, weighted) / np.bincount(subject_inv, weight)
+    subject_plain_mean = np.bincount(subject_inv, score) / subject_counts
+    subject_var = np.bincount(subject_inv, score * score) / subject_counts - subject_plain_mean ** 2
+    subject_std = np.sqrt(np.clip(subject_var, 0, None))
+    p25, median, p75 = _group_percentiles(subject_inv, score, subject_counts)
+
+    # По ученикам: среднее и наклон линейного тренда оценки во времени (баллов в день)
+    student_ids, student_first, student_inv, student_counts = np.unique(
+        columns["student_id"], return_index=True, return_inverse=True, return_counts=True
+    )
+    student_class = columns["class_id"][student_first]
+    student_mean = np.bincount(student_inv, weighted) / np.bincount(student_inv, weight)
+    x = columns["day"] - columns["day"].min()
+    n = student_counts.astype(np.float64)
+    sx = np.bincount(student_inv, x)
+    sy = np.bincount(student_inv, score)
+    sxy = np.bincount(student_inv, x * score)
+    sxx = np.bincount(student_inv, x * x)
+    denominator = n * sxx - sx ** 2
+    trend = np.divide(n * sxy - sx * sy, denominator, out=np.zeros_like(denominator), where=denominator > 1e-9)
+
+    enough = student_counts >= settings.AT_RISK_MIN_GRADES
+    falling = enough & (trend <= settings.AT_RISK_TREND_THRESHOLD)
+    low = enough & (student_mean < settings.AT_RISK_MEAN_THRESHOLD)
+    at_risk = np.flatnonzero(falling | low)
+    at_risk = at_risk[np.argsort(student_mean[at_risk], kind="stable")]
+
+    # По классам
+    class_ids, class_inv, class_counts = np.unique(columns["class_id"], return_inverse=True, return_counts=True)
+    class_mean = np.bincount(class_inv, weighted) / np.bincount(class_inv, weight)
+    class_at_risk = np.bincount(
+        np.searchsorted(class_ids, student_class[at_risk]), minlength=class_ids.size
+    )
+
+    return {
+        "grades_count": total,
+        "mean": round(float(weighted.sum() / weight.sum()), 2),
+        "distribution": {value: int(distribution[value]) for value in SCORES},
+        "subjects": [
+            {
+                "subject_id": subject_id,
+                "grades_count": count,
+                "mean": round(mean, 2),
+                "std": round(std, 2),
+                "p25": q1,
+                "median": q2,
+                "p75": q3,
+            }
+            for subject_id, count, mean, std, q1, q2, q3 in zip(
+                subject_ids.tolist(), subject_counts.tolist(), subject_mean.tolist(),
+                subject_std.tolist(), p25.tolist(), median.tolist(), p75.tolist()
+            )
+        ],
+        "at_risk": [
+            {
+                "student_id": int(student_ids[index]),
+                "class_id": int(student_class[index]),
+                "grades_count": int(student_counts[index]),
+                "mean": round(float(student_mean[index]), 2),
+                "trend": round(float(trend[index]), 4),
+                "reasons": [
+                    reason for reason, flag in (("low_average", low[index]), ("falling_trend", falling[index])) if flag
+                ],
+            }
+            for index in at_risk.tolist()
+        ],
+        "classes": [
+            {
+                "class_id": class_id,
+                "grades_count": count,
+                "mean": round(mean, 2),
+                "at_risk_count": risk_count,
+            }
+            for class_id, count, mean, risk_count in zip(
+                class_ids.tolist(), class_counts.tolist(), class_mean.tolist(), class_at_risk.tolist()
+            )
+        ],
+    }
+
+
+async def _names(db: AsyncSession, id_column, name_column, ids: List[int]) -> Dict[int, str]:
+    if not ids:
+        return {}
+    result = await db.execute(select(id_column, name_column).where(id_column.in_(ids)))
+    return dict(result.all())
+
+
+async def _build_analytics(db: AsyncSession, period_id: int, columns: Dict[str, np.ndarray]) -> ClassAnalytics:
+    stats = compute_statistics(columns)
+
+    subject_names = await _names(db, Subject.id, Subject.name, [item["subject_id"] for item in stats["subjects"]])
+    student_names = await _names(db, User.id, User.full_name, [item["student_id"] for item in stats["at_risk"]])
+    class_names = await _names(db, Class.id, Class.name, [item["class_id"] for item in stats["classes"]])
+    for item in stats["subjects"]:
+        item["subject_name"] = subject_names.get(item["subject_id"])
+    for item in stats["at_risk"]:
+        item["full_name"] = student_names.get(item["student_id"])
+    for item in stats["classes"]:
+        item["class_name"] = class_names.get(item["class_id"])
+
+    return ClassAnalytics(period_id=period_id, **stats)
+
+
+async def _resolve_period_id(db: AsyncSession, period_id: Optional[int]) -> int:
+    if period_id is not None:
+        return period_id
+    period = (await calendar_cache.get(db=db)).current_period()
+    if not period:
+        raise ValueError("Current academic period not found")
+    return period.id
+
+
+async def get_class_analytics(db: AsyncSession, class_id: int, period_id: Optional[int] = None) -> ClassAnalytics:
+    period_id = await _resolve_period_id(db, period_id)
+    key = ("class", class_id, period_id)
+    cached = analytics_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async with primary_session(db) as primary:
+        columns = await _load_grade_columns(db=primary, period_id=period_id, class_id=class_id)
+        analytics = await _build_analytics(db=primary, period_id=period_id, columns=columns)
+    analytics_cache.set(key, analytics, tags=[f"class:{class_id}"])
+    return analytics
+
+
+async def get_grade_level_analytics(db: AsyncSession, grade_level: int, period_id: Optional[int] = None) -> ClassAnalytics:
+    period_id = await _resolve_period_id(db, period_id)
+    key = ("grade_level", grade_level, period_id)
+    cached = analytics_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async with primary_session(db) as primary:
+        columns = await _load_grade_columns(db=primary, period_id=period_id, grade_level=grade_level)
+        analytics = await _build_analytics(db=primary, period_id=period_id, columns=columns)
+    analytics_cache.set(key, analytics, tags=[AGGREGATE_TAG])
+    return analytics
+
+
+async def get_school_analytics(db: AsyncSession, period_id: Optional[int] = None) -> ClassAnalytics:
+    period_id = await _resolve_period_id(db, period_id)
+    key = ("school", period_id)
+    cached = analytics_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async with primary_session(db) as primary:
+        columns = await _load_grade_columns(db=primary, period_id=period_id)
+        analytics = await _build_analytics(db=primary, period_id=period_id, columns=columns)
+    analytics_cache.set(key, analytics, tags=[AGGREGATE_TAG])
+    return analytics
+
+
+def invalidate_class_analytics(*class_ids: int) -> None:
+    """Сбрасывает кэш аналитики классов и агрегированных отчетов после записи оценок"""
+    analytics_cache.invalidate_tags(*(f"class:{class_id}" for class_id in class_ids), AGGREGATE_TAG)
@@ -0,0 +1,187 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from typing import Callable, Dict, Generic, List, Optional, Sequence, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.academic_cycles.academic_years import academic_years_repository
+from app.db.session import primary_session
+from app.services.etag import get_resource_versions
+
+# Версия ресурса, которую увеличивает запись учебных циклов (bump_resource_versions)
+CALENDAR_VERSION_KEY = "academic_cycles"
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class CalendarYear:
+    id: int
+    name: str
+    start_date: date
+    end_date: date
+    is_current: bool
+
+
+@dataclass(frozen=True)
+class CalendarPeriod:
+    id: int
+    year_id: int
+    name: str
+    order_num: int
+    start_date: date
+    end_date: date
+    is_current: bool
+
+
+@dataclass(frozen=True)
+class CalendarWeek:
+    id: int
+    period_id: int
+    week_num: int
+    name: str
+    start_date: date
+    end_date: date
+    is_holiday: bool
+
+
+@dataclass(frozen=True)
+class CalendarLessonTime:
+    id: int
+    period_id: int
+    lesson_num: int
+    start_time: time
+    end_time: time
+
+
+def _as_date(value) -> date:
+    return value.date() if isinstance(value, datetime) else value
+
+
+class _DateRanges(Generic[T]):
+    """Непересекающиеся интервалы дат, отсортированные по началу: поиск по дате за O(log n)"""
+
+    def __init__(self, items: Sequence[T], start: Callable[[T], date], end: Callable[[T], date]):
+        self.items: List[T] = sorted(items, key=start)
+        self._starts = [start(item) for item in self.items]
+        self._end = end
+
+    def find(self, day: date) -> Optional[T]:
+        index = bisect_right(self._starts, day) - 1
+        if index < 0:
+            return None
+        item = self.items[index]
+        return item if self._end(item) >= day else None
+
+
+class Calendar:
+    """Неизменяемый снимок учебного календаря: годы, периоды, недели и время уроков"""
+
+    def __init__(
+        self,
+        version: int,
+        years: Sequence[CalendarYear],
+        periods: Sequence[CalendarPeriod],
+        weeks: Sequence[CalendarWeek],
+        lesson_times: Sequence[CalendarLessonTime]
+    ):
+        self.version = version
+        self.years: Dict[int, CalendarYear] = {year.id: year for year in years}
+        self.periods: Dict[int, CalendarPeriod] = {period.id: period for period in periods}
+        self.weeks: Dict[int, CalendarWeek] = {week.id: week for week in weeks}
+        self._years_by_name = {year.name: year for year in years}
+        self._year_ranges = _DateRanges(years, lambda year: year.start_date, lambda year: year.end_date)
+        self._period_ranges = _DateRanges(periods, lambda period: period.start_date, lambda period: period.end_date)
+        self._week_ranges = _DateRanges(weeks, lambda week: week.start_date, lambda week: week.end_date)
+        self._lesson_times: Dict[int, List[CalendarLessonTime]] = {}
+        for lesson_time in sorted(lesson_times, key=lambda item: item.lesson_num):
+            self._lesson_times.setdefault(lesson_time.period_id, []).append(lesson_time)
+        self.current_year: Optional[CalendarYear] = next((year for year in years if year.is_current), None)
+        # Флаг периода учитывается только внутри текущего года: при смене года
+        # is_current периодов прошлых лет не сбрасывается
+        self._flagged_period: Optional[CalendarPeriod] = None
+        if self.current_year is not None:
+            self._flagged_period = min(
+                (period for period in periods if period.is_current and period.year_id == self.current_year.id),
+                key=lambda period: period.order_num,
+                default=None
+            )
+
+    def year_by_name(self, name: str) -> Optional[CalendarYear]:
+        return self._years_by_name.get(name)
+
+    def year_for(self, day: date) -> Optional[CalendarYear]:
+        return self._year_ranges.find(day)
+
+    def period_for(self, day: date) -> Optional[CalendarPeriod]:
+        return self._period_ranges.find(day)
+
+    def week_for(self, day: date) -> Optional[CalendarWeek]:
+        return self._week_ranges.find(day)
+
+    def current_period(self, today: Optional[date] = None) -> Optional[CalendarPeriod]:
+        """
+        Период текущего года, в который попадает сегодняшняя дата; между периодами
+        (каникулы вне периодов) - период года с флагом is_current.
+        Без текущего года - период по дате.
+        """
+        period = self.period_for(today or date.today())
+        if self.current_year is None:
+            return period
+        if period is not None and period.year_id == self.current_year.id:
+            return period
+        return self._flagged_period
+
+    def lesson_times(self, period_id: int) -> List[CalendarLessonTime]:
+        return self._lesson_times.get(period_id, [])
+
+
+class CalendarCache:
+    """
+    Календарь в памяти воркера. Снимок сверяется с версией ресурса academic_cycles
+    (кэшируется на ETAG_VERSION_TTL секунд): запись учебных циклов в любом воркере
+    увеличивает версию, и календарь перечитывается целиком.
+    """
+
+    def __init__(self):
+        self._calendar: Optional[Calendar] = None
+
+    async def get(self, db: AsyncSession) -> Calendar:
+        version = (await get_resource_versions(db, [CALENDAR_VERSION_KEY]))[CALENDAR_VERSION_KEY]
+        calendar = self._calendar
+        if calendar is None or calendar.version != version:
+            async with primary_session(db) as primary:
+                calendar = await self._load(primary, version)
+            self._calendar = calendar
+        return calendar
+
+    def invalidate(self) -> None:
+        self._calendar = None
+
+    async def _load(self, db: AsyncSession, version: int) -> Calendar:
+        rows = await academic_years_repository.get_calendar_rows(db=db)
+        return Calendar(
+            version=version,
+            years=[
+                CalendarYear(**{**row._mapping, "is_current": bool(row.is_current)})
+                for row in rows["years"]
+            ],
+            periods=[
+                CalendarPeriod(**{**row._mapping, "is_current": bool(row.is_current)})
+                for row in rows["periods"]
+            ],
+            weeks=[
+                CalendarWeek(**{
+                    **row._mapping,
+                    "start_date": _as_date(row.start_date),
+                    "end_date": _as_date(row.end_date),
+                    "is_holiday": bool(row.is_holiday)
+                })
+                for row in rows["weeks"]
+            ],
+            lesson_times=[CalendarLessonTime(**row._mapping) for row in rows["lesson_times"]]
+        )
+
+
+calendar_cache = CalendarCache()
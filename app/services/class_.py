@@ -5,23 +5,32 @@ from app.db.repositories.class_.student_class_history import student_class_histo
 from app.schemas.user.student import UserWithStudentInfo, StudentUpdate
 from app.schemas.class_.class_ import ClassCreate
 from app.db.repositories.class_.class_ import class_repository
-from app.db.repositories.academic_cycles.academic_years import academic_years_repository
+from app.services.calendar import calendar_cache
 from app.schemas.class_.class_ import ClassConfig
 from app.db.models.class_ import StudentClassHistoryReason
+from app.db.after_commit import after_commit
+from app.services.diary import invalidate_diary
+from app.services.etag import bump_resource_versions, class_version_key
 
 async def add_students_to_class(db: AsyncSession, students: List[int], class_id: int) -> List[UserWithStudentInfo]:
     students_list = []
+    changed_classes = {class_version_key(class_id)}
     for student_id in students:
         student = await student_repository.get_user_student(db=db, user_id=student_id)
         if not student:
             continue
         else:
             if student.class_id != class_id:
+                if student.class_id is not None:
+                    changed_classes.add(class_version_key(student.class_id))
                 await student_repository.update(db=db, db_obj=student, obj_in=StudentUpdate(class_id=class_id))
                 await student_class_history_repository.write_assign(db=db, student_id=student_id, class_id=class_id, reason=StudentClassHistoryReason.ADMISSION, is_active=True)
+                after_commit(db, invalidate_diary, student_id=student_id)
 
                 students_list.append(UserWithStudentInfo.model_validate(student))
             
+    if students_list:
+        await bump_resource_versions(db, *changed_classes)
     return students_list
 
 async def remove_students_from_class(db: AsyncSession, students: List[int], class_id: int) -> List[UserWithStudentInfo]:
@@ -33,8 +42,11 @@ async def remove_students_from_class(db: AsyncSession, students: List[int], clas
         if student.class_id == class_id:
             await student_repository.update(db=db, db_obj=student, obj_in=StudentUpdate(class_id=None))
             await student_class_history_repository.write_assign(db=db, student_id=student_id, class_id=None, reason=StudentClassHistoryReason.TRANSFER, is_active=True)
+            after_commit(db, invalidate_diary, student_id=student_id)
             
             removed_students_list.append(UserWithStudentInfo.model_validate(student))
+    if removed_students_list:
+        await bump_resource_versions(db, class_version_key(class_id))
     return removed_students_list
 
 async def check_class_config(db: AsyncSession, class_create: ClassCreate, class_config: ClassConfig, class_id: int = None, class_year_id: int = None) -> bool:
@@ -45,7 +57,7 @@ async def check_class_config(db: AsyncSession, class_create: ClassCreate, class_
         if class_create.specialization not in class_config.specializations:
             raise ValueError("Invalid specialization")
         if not class_year_id:
-            year = await academic_years_repository.get_current_academic_year(db=db)
+            year = (await calendar_cache.get(db=db)).current_year
             if not year:
                 raise ValueError("Year not found")
             class_year_id = year.id
@@ -0,0 +1,99 @@
+from collections import defaultdict
+from datetime import timedelta
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.session import primary_session
+from app.db.repositories.schedule.schedule import schedule_repository
+from app.db.repositories.schedule.homework import homework_repository
+from app.db.repositories.schedule.grade import grade_repository
+from app.schemas.diary.diary import DiaryWeek, DiaryDay, DiaryLesson, DiaryHomework, DiaryGrade
+
+diary_cache = TTLCache(ttl=settings.DIARY_CACHE_TTL, maxsize=4096)
+
+
+async def get_student_diary_week(db: AsyncSession, student_id: int, week_id: int) -> DiaryWeek:
+    """
+    Дневник ученика за неделю: уроки, домашние задания и оценки.
+    Собирается тремя запросами (уроки, задания, оценки) к основной базе и кэшируется на ученика.
+    """
+    key = ("diary", student_id, week_id)
+    cached = diary_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async with primary_session(db) as primary:
+        lessons = await schedule_repository.get_student_week(db=primary, student_id=student_id, week_id=week_id)
+        statuses = await homework_repository.get_student_week_statuses(db=primary, student_id=student_id, week_id=week_id)
+        grades = await grade_repository.get_student_week_grades(db=primary, student_id=student_id, week_id=week_id)
+
+    homework_by_lesson = defaultdict(list)
+    for status in statuses:
+        homework = status.homework
+        homework_by_lesson[homework.schedule_id].append(DiaryHomework(
+            homework_id=homework.id,
+            description=homework.description,
+            due_date=status.due_date,
+            file_id=homework.file_id,
+            file_name=homework.file.original_filename if homework.file else None,
+            is_done=status.is_done,
+            done_at=status.done_at,
+        ))
+
+    grades_by_lesson = defaultdict(list)
+    for grade in grades:
+        grades_by_lesson[grade.schedule_id].append(DiaryGrade.model_validate(grade))
+
+    week = lessons[0].week if lessons else None
+    days = defaultdict(list)
+    for lesson in sorted(lessons, key=lambda item: (item.day_of_week, item.lesson_time.lesson_num)):
+        days[lesson.day_of_week].append(DiaryLesson(
+            schedule_id=lesson.id,
+            lesson_num=lesson.lesson_time.lesson_num,
+            start_time=lesson.lesson_time.start_time,
+            end_time=lesson.lesson_time.end_time,
+            subject_id=lesson.subject_id,
+            subject_name=lesson.subject.name,
+            teacher_id=lesson.teacher_id,
+            teacher_name=lesson.teacher.user.full_name,
+            location=lesson.location,
+            description=lesson.description,
+            is_replacement=bool(lesson.is_replacement),
+            is_cancelled=bool(lesson.is_cancelled),
+            homework=homework_by_lesson.get(lesson.id, []),
+            grades=grades_by_lesson.get(lesson.id, []),
+        ))
+
+    diary = DiaryWeek(
+        student_id=student_id,
+        week_id=week_id,
+        week_name=week.name if week else None,
+        start_date=week.start_date if week else None,
+        end_date=week.end_date if week else None,
+        days=[
+            DiaryDay(
+                day_of_week=day_of_week,
+                date=(week.start_date + timedelta(days=day_of_week - 1)).date() if week else None,
+                lessons=day_lessons,
+            )
+            for day_of_week, day_lessons in sorted(days.items())
+        ]
+    )
+
+    tags = [f"diary:student:{student_id}"]
+    tags.extend({f"diary:class:{lesson.class_id}" for lesson in lessons})
+    diary_cache.set(key, diary, tags=tags)
+    return diary
+
+
+def invalidate_diary(class_id: Optional[int] = None, student_id: Optional[int] = None) -> None:
+    """Сбрасывает дневники класса и/или ученика после записи расписания, заданий или оценок"""
+    tags = []
+    if class_id is not None:
+        tags.append(f"diary:class:{class_id}")
+    if student_id is not None:
+        tags.append(f"diary:student:{student_id}")
+    diary_cache.invalidate_tags(*tags)
@@ -0,0 +1,74 @@
+import hashlib
+from typing import Any, Dict, Sequence
+
+from fastapi import Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.db.after_commit import after_commit
+from app.db.repositories.resource_version.resource_version import resource_version_repository
+from app.db.session import primary_session
+
+# Версии из базы кэшируются в воркере на ETAG_VERSION_TTL секунд: это верхняя
+# граница устаревания после записи в другом воркере, свои записи сбрасывают кэш после commit.
+version_cache = TTLCache(ttl=settings.ETAG_VERSION_TTL, maxsize=4096)
+
+
+def class_version_key(class_id: int) -> str:
+    return f"class:{class_id}"
+
+
+async def get_resource_versions(db: AsyncSession, keys: Sequence[str]) -> Dict[str, int]:
+    """Версии ресурсов: один запрос по первичному ключу, в пределах TTL - ни одного"""
+    versions = {}
+    missing = []
+    for key in keys:
+        version = version_cache.get(key)
+        if version is None:
+            missing.append(key)
+        else:
+            versions[key] = version
+    if missing:
+        async with primary_session(db) as primary:
+            loaded = await resource_version_repository.get_versions(db=primary, keys=missing)
+        for key in missing:
+            versions[key] = loaded.get(key, 0)
+            version_cache.set(key, versions[key])
+    return versions
+
+
+async def get_resource_etag(db: AsyncSession, keys: Sequence[str], *params: Any) -> str:
+    """Слабый ETag по версиям ресурсов и параметрам запроса (пагинация, фильтры)"""
+    versions = await get_resource_versions(db, keys)
+    source = "|".join([*(f"{key}={versions[key]}" for key in keys), *map(str, params)])
+    return f'W/"{hashlib.blake2b(source.encode(), digest_size=10).hexdigest()}"'
+
+
+async def bump_resource_versions(db: AsyncSession, *keys: str) -> None:
+    """Вызывается после записи: меняет ETag ресурсов во всех воркерах"""
+    await resource_version_repository.bump(db=db, keys=keys)
+    for key in keys:
+        after_commit(db, version_cache.invalidate, key)
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Слабое сравнение If-None-Match с текущим ETag"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in header.split(","))
+
+
+def set_etag(response: Response, etag: str) -> None:
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "private, no-cache"
+
+
+def not_modified_response(etag: str) -> Response:
+    response = Response(status_code=304)
+    set_etag(response, etag)
+    return response
@@ -0,0 +1,192 @@
+import csv
+import io
+import re
+import zipfile
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Callable, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from app.core.config import settings
+from app.db.repositories.export.export import export_repository
+from app.db.session import read_session
+
+
+class ExportFormat(str, Enum):
+    CSV = "csv"
+    XLSX = "xlsx"
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+_XLSX_PARTS = {
+    "[Content_Types].xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="xl/workbook.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Export" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+        '</Relationships>'
+    ),
+}
+_SHEET_HEAD = (
+    b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = b'</sheetData></worksheet>'
+_XML_ILLEGAL = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _cell_value(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="seconds")
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+def _xlsx_row(number: int, row: Sequence[Any]) -> bytes:
+    cells = []
+    for value in row:
+        value = _cell_value(value)
+        if isinstance(value, bool):
+            cells.append(f'<c t="b"><v>{int(value)}</v></c>')
+        elif isinstance(value, (int, float)):
+            cells.append(f'<c><v>{value}</v></c>')
+        elif value != "":
+            text = escape(_XML_ILLEGAL.sub("", str(value)))
+            cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>')
+        else:
+            cells.append('<c/>')
+    return f'<row r="{number}">{"".join(cells)}</row>'.encode()
+
+
+class _ChunkBuffer(io.RawIOBase):
+    """Несмещаемый поток для zipfile: записанное забирается частями через drain()"""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self._position
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        self.size += len(data)
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        self.size = 0
+        return data
+
+
+async def csv_stream(header: Sequence[str], rows: AsyncIterator[Tuple[Any, ...]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    # BOM - чтобы Excel открыл UTF-8 с кириллицей без мастера импорта
+    buffer.write("\ufeff")
+    writer.writerow(header)
+    yield buffer.getvalue().encode()
+    buffer.seek(0)
+    buffer.truncate()
+    async for row in rows:
+        writer.writerow([_cell_value(value) for value in row])
+        if buffer.tell() >= settings.EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+async def xlsx_stream(header: Sequence[str], rows: AsyncIterator[Tuple[Any, ...]]) -> AsyncIterator[bytes]:
+    """
+    XLSX пишется потоково: лист - одна запись zip-архива, которая сжимается
+    по мере добавления строк (размеры записываются в data descriptor в конце).
+    """
+    buffer = _ChunkBuffer()
+    with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, content in _XLSX_PARTS.items():
+            archive.writestr(name, content)
+        with archive.open("xl/worksheets/sheet1.xml", "w", force_zip64=True) as sheet:
+            sheet.write(_SHEET_HEAD)
+            sheet.write(_xlsx_row(1, header))
+            yield buffer.drain()
+            number = 1
+            async for row in rows:
+                number += 1
+                sheet.write(_xlsx_row(number, row))
+                if buffer.size >= settings.EXPORT_CHUNK_SIZE:
+                    yield buffer.drain()
+            sheet.write(_SHEET_TAIL)
+    yield buffer.drain()
+
+
+def export_response(
+    query: Select,
+    header: Sequence[str],
+    filename: str,
+    file_format: ExportFormat,
+    user_key: Optional[str] = None
+) -> StreamingResponse:
+    """
+    Потоковый ответ с выгрузкой. Сессия открывается внутри генератора:
+    сессия зависимости get_db закрывается до отправки тела ответа.
+    """
+    async def rows() -> AsyncIterator[Tuple[Any, ...]]:
+        async with read_session(user_key) as db:
+            async for row in export_repository.stream_rows(db, query):
+                yield row
+
+    writer: Callable[..., AsyncIterator[bytes]] = xlsx_stream if file_format == ExportFormat.XLSX else csv_stream
+    return StreamingResponse(
+        writer(header, rows()),
+        media_type=MEDIA_TYPES[file_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{file_format.value}"'}
+    )
@@ -0,0 +1,78 @@
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.user import User, UserRole
+from app.db.repositories.schedule.schedule import schedule_repository
+from app.db.repositories.schedule.grade import grade_repository
+from app.db.repositories.schedule.grade_average import grade_average_repository
+from app.db.repositories.user.student import student_repository
+from app.schemas.schedule.grade import GradeEntry, GradeList, GradeAverageList
+from app.db.after_commit import after_commit
+from app.services.analytics import invalidate_class_analytics
+from app.services.calendar import calendar_cache
+from app.services.diary import invalidate_diary
+
+
+async def save_lesson_grades(db: AsyncSession, schedule_id: int, grades: List[GradeEntry], current_user: User) -> List[GradeList]:
+    """
+    Массовое выставление оценок за урок: проверка состава класса одним запросом
+    и запись всей колонки одним upsert.
+    """
+    if not grades:
+        raise ValueError("No grades to save")
+
+    student_ids = [grade.student_id for grade in grades]
+    if len(student_ids) != len(set(student_ids)):
+        raise ValueError("Duplicate students in grades")
+
+    schedule = await schedule_repository.get(db=db, id=schedule_id)
+    if not schedule:
+        raise ValueError("Lesson not found")
+    if current_user.role != UserRole.ADMIN and schedule.teacher_id != current_user.id:
+        raise PermissionError("You are not allowed to grade this lesson")
+
+    roster = await student_repository.get_class_student_ids(db=db, class_id=schedule.class_id, student_ids=student_ids)
+    foreign_students = [student_id for student_id in student_ids if student_id not in roster]
+    if foreign_students:
+        raise ValueError(f"Students are not in the lesson class: {foreign_students}")
+
+    rows = [
+        {
+            "student_id": grade.student_id,
+            "score": grade.score,
+            "weight": grade.weight,
+            "comment": grade.comment,
+            "subject_id": schedule.subject_id,
+            "teacher_id": schedule.teacher_id,
+        }
+        for grade in grades
+    ]
+    column = await grade_repository.upsert_lesson_grades(
+        db=db, schedule_id=schedule_id, year_id=schedule.year_id, rows=rows
+    )
+    after_commit(db, invalidate_class_analytics, schedule.class_id)
+    after_commit(db, invalidate_diary, class_id=schedule.class_id)
+    return [GradeList.model_validate(grade) for grade in column]
+
+
+async def get_student_averages(db: AsyncSession, student_id: int, period_id: Optional[int] = None) -> List[GradeAverageList]:
+    """Средние по предметам за период из таблицы grade_averages (по умолчанию текущий период)"""
+    if period_id is None:
+        period = (await calendar_cache.get(db=db)).current_period()
+        if not period:
+            raise ValueError("Current academic period not found")
+        period_id = period.id
+
+    averages = await grade_average_repository.get_student_averages(db=db, student_id=student_id, period_id=period_id)
+    return [
+        GradeAverageList(
+            subject_id=average.subject_id,
+            subject_name=average.subject.name,
+            period_id=average.period_id,
+            grades_count=average.grades_count,
+            average=average.average,
+            last_score=average.last_score,
+            last_graded_at=average.last_graded_at
+        )
+        for average in averages
+    ]
@@ -0,0 +1,84 @@
+from typing import List, Optional
+from datetime import date, datetime, time, timedelta
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.user import User, UserRole
+from app.db.repositories.schedule.schedule import schedule_repository
+from app.db.repositories.schedule.homework import homework_repository
+from app.db.after_commit import after_commit
+from app.services.diary import invalidate_diary
+from app.schemas.schedule.homework import (
+    HomeworkAssign, HomeworkCreate, HomeworkList, HomeworkStatusList, StudentHomework
+)
+
+
+async def assign_homework(db: AsyncSession, homework_in: HomeworkAssign, current_user: User) -> HomeworkList:
+    """Задание на урок выдаётся всему классу: одна строка задания и статусы учеников"""
+    schedule = await schedule_repository.get(db=db, id=homework_in.schedule_id)
+    if not schedule:
+        raise ValueError("Lesson not found")
+    if current_user.role != UserRole.ADMIN and schedule.teacher_id != current_user.id:
+        raise PermissionError("You are not allowed to assign homework for this lesson")
+
+    homework, students_count = await homework_repository.assign_to_class(
+        db=db,
+        homework_in=HomeworkCreate(
+            **homework_in.model_dump(),
+            class_id=schedule.class_id,
+            teacher_id=schedule.teacher_id,
+            subject_id=schedule.subject_id,
+            assignment_at=datetime.now()
+        )
+    )
+    after_commit(db, invalidate_diary, class_id=schedule.class_id)
+    result = HomeworkList.model_validate(homework)
+    result.students_count = students_count
+    return result
+
+
+def week_bounds(day: Optional[date] = None) -> tuple[datetime, datetime]:
+    """Границы календарной недели (пн 00:00 — следующий пн 00:00)"""
+    day = day or date.today()
+    monday = datetime.combine(day - timedelta(days=day.weekday()), time.min)
+    return monday, monday + timedelta(days=7)
+
+
+async def get_student_homework(
+    db: AsyncSession,
+    student_id: int,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None
+) -> List[StudentHomework]:
+    """Задания ученика по сроку сдачи, по умолчанию — на текущую неделю"""
+    start, end = week_bounds()
+    if date_from:
+        start = datetime.combine(date_from, time.min)
+    if date_to:
+        end = datetime.combine(date_to + timedelta(days=1), time.min)
+    if start >= end:
+        raise ValueError("date_from must be before date_to")
+
+    statuses = await homework_repository.get_student_homework(db=db, student_id=student_id, date_from=start, date_to=end)
+    return [
+        StudentHomework(
+            homework_id=status.homework_id,
+            schedule_id=status.homework.schedule_id,
+            subject_id=status.homework.subject_id,
+            subject_name=status.homework.subject.name,
+            description=status.homework.description,
+            assignment_at=status.homework.assignment_at,
+            due_date=status.due_date,
+            file_id=status.homework.file_id,
+            is_done=status.is_done,
+            done_at=status.done_at,
+        )
+        for status in statuses
+    ]
+
+
+async def set_homework_done(db: AsyncSession, homework_id: int, student_id: int, is_done: bool) -> HomeworkStatusList:
+    status = await homework_repository.set_status(db=db, homework_id=homework_id, student_id=student_id, is_done=is_done)
+    if not status:
+        raise ValueError("Homework not found")
+    after_commit(db, invalidate_diary, student_id=student_id)
+    return HomeworkStatusList.model_validate(status)
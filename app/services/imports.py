@@ -0,0 +1,206 @@
+import csv
+import io
+import secrets
+from datetime import date, datetime
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Set, Tuple
+
+import anyio.to_thread
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.security import get_password_hash
+from app.db.after_commit import after_commit
+from app.db.repositories.imports.imports import import_repository
+from app.db.repositories.schedule.grade_average import grade_average_repository
+from app.schemas.admin.admin import ImportRejectedRow, ImportReport
+from app.services.analytics import invalidate_class_analytics
+from app.services.diary import diary_cache
+from app.services.etag import bump_resource_versions
+from app.services.helpers import username_from_fio
+
+Record = Tuple[Any, ...]
+
+
+def _text(row: Dict[str, str], name: str, required: bool = False) -> Optional[str]:
+    value = (row.get(name) or "").strip()
+    if not value:
+        if required:
+            raise ValueError(f"'{name}' is required")
+        return None
+    return value
+
+
+def _int(row: Dict[str, str], name: str, required: bool = False, low: int = None, high: int = None) -> Optional[int]:
+    value = _text(row, name, required)
+    if value is None:
+        return None
+    try:
+        number = int(value)
+    except ValueError:
+        raise ValueError(f"'{name}' must be an integer")
+    if (low is not None and number < low) or (high is not None and number > high):
+        raise ValueError(f"'{name}' must be between {low} and {high}")
+    return number
+
+
+def _date(row: Dict[str, str], name: str, required: bool = False) -> Optional[date]:
+    value = _datetime(row, name, required)
+    return value.date() if value is not None else None
+
+
+def _datetime(row: Dict[str, str], name: str, required: bool = False) -> Optional[datetime]:
+    value = _text(row, name, required)
+    if value is None:
+        return None
+    for parse in (datetime.fromisoformat, lambda text: datetime.strptime(text, "%d.%m.%Y")):
+        try:
+            return parse(value)
+        except ValueError:
+            continue
+    raise ValueError(f"'{name}' must be a date (YYYY-MM-DD or DD.MM.YYYY)")
+
+
+class _StudentParser:
+    columns = ("email", "full_name")
+
+    def __init__(self):
+        self.emails: Set[str] = set()
+
+    def __call__(self, row: Dict[str, str]) -> Record:
+        email = _text(row, "email", required=True).lower()
+        if "@" not in email:
+            raise ValueError("'email' is not a valid email address")
+        if email in self.emails:
+            raise ValueError("Duplicate email in file")
+        full_name = _text(row, "full_name", required=True)
+        self.emails.add(email)
+        # Совпадения username разрешаются при переносе (_resolve_students)
+        return (
+            email, username_from_fio(full_name), full_name, _text(row, "class_name"), _int(row, "admission_year"),
+            _text(row, "parent_fio"), _text(row, "parent_phone"), _text(row, "parent_email")
+        )
+
+
+def _schedule_record(row: Dict[str, str]) -> Record:
+    return (
+        _text(row, "class_name", required=True), _date(row, "date", required=True),
+        _int(row, "lesson_num", required=True, low=1, high=20), _text(row, "subject", required=True),
+        _text(row, "teacher_email", required=True).lower(), _text(row, "location"), _text(row, "description")
+    )
+
+
+def _homework_record(row: Dict[str, str]) -> Record:
+    return (
+        _text(row, "class_name", required=True), _date(row, "date", required=True),
+        _int(row, "lesson_num", required=True, low=1, high=20), _text(row, "subject", required=True),
+        _text(row, "description", required=True), _datetime(row, "due_date")
+    )
+
+
+def _grade_record(row: Dict[str, str]) -> Record:
+    return (
+        _text(row, "student_email", required=True).lower(), _text(row, "class_name", required=True),
+        _date(row, "date", required=True), _int(row, "lesson_num", required=True, low=1, high=20),
+        _text(row, "subject", required=True), _int(row, "score", required=True, low=1, high=5),
+        _int(row, "weight", low=1, high=10), _text(row, "comment")
+    )
+
+
+# Обязательные колонки CSV и разбор строки в запись промежуточной таблицы
+IMPORT_KINDS: Dict[str, Tuple[Tuple[str, ...], Callable[[], Callable[[Dict[str, str]], Record]]]] = {
+    "students": (_StudentParser.columns, _StudentParser),
+    "schedule": (("class_name", "date", "lesson_num", "subject", "teacher_email"), lambda: _schedule_record),
+    "homework": (("class_name", "date", "lesson_num", "subject", "description"), lambda: _homework_record),
+    "grades": (("student_email", "class_name", "date", "lesson_num", "subject", "score"), lambda: _grade_record),
+}
+
+
+class _BatchReader:
+    """Читает CSV пачками; разбор выполняется в пуле потоков, не блокируя цикл событий"""
+
+    def __init__(self, stream: BinaryIO, kind: str):
+        required, parser = IMPORT_KINDS[kind]
+        self.parse = parser()
+        self.text = io.TextIOWrapper(stream, encoding="utf-8-sig", newline="")
+        self.reader = csv.DictReader(self.text)
+        header = [name.strip() for name in self.reader.fieldnames or []]
+        missing = [name for name in required if name not in header]
+        if missing:
+            raise ValueError(f"Missing columns: {', '.join(missing)}")
+        self.reader.fieldnames = header
+        self.total = 0
+        self.rejected_count = 0
+        self.rejected: List[Tuple[int, str]] = []
+
+    def next_batch(self) -> List[Record]:
+        records = []
+        for row in self.reader:
+            self.total += 1
+            line = self.reader.line_num
+            try:
+                records.append((line, *self.parse(row)))
+            except ValueError as e:
+                self.rejected_count += 1
+                if len(self.rejected) < settings.IMPORT_MAX_REPORTED_ERRORS:
+                    self.rejected.append((line, str(e)))
+            if len(records) >= settings.IMPORT_BATCH_SIZE:
+                break
+        return records
+
+    def detach(self) -> None:
+        # Файл закрывает владелец (UploadFile), обертка не должна его закрыть
+        self.text.detach()
+
+
+async def import_csv(db: AsyncSession, kind: str, stream: BinaryIO) -> ImportReport:
+    """
+    Импорт CSV из старой системы: проверка и преобразование строк пачками,
+    COPY во временную таблицу, перенос в основные таблицы одним запросом.
+    Отклоненные строки (ошибки формата и неразрешенные ссылки) попадают в отчет.
+    """
+    if kind not in IMPORT_KINDS:
+        raise ValueError(f"Unknown import kind: {kind}")
+    reader = await anyio.to_thread.run_sync(_BatchReader, stream, kind)
+    try:
+        await import_repository.create_staging(db=db, kind=kind)
+        while True:
+            records = await anyio.to_thread.run_sync(reader.next_batch)
+            if not records:
+                break
+            await import_repository.copy(db=db, kind=kind, records=records)
+    finally:
+        reader.detach()
+    await import_repository.analyze(db=db, kind=kind)
+
+    unresolved_count, unresolved = await import_repository.rejected(db=db, kind=kind)
+    params = {}
+    if kind == "students":
+        # Общий хэш случайного пароля: вход невозможен до сброса пароля,
+        # а bcrypt не вычисляется для каждой строки
+        params["hashed_password"] = get_password_hash(secrets.token_urlsafe(32))
+    if kind != "students":
+        # После переноса уже существующие уроки считаются отклоненными,
+        # поэтому затронутые периоды и классы определяются заранее
+        period_ids, class_ids = await import_repository.affected_lessons(db=db, kind=kind)
+    imported = await import_repository.merge(db=db, kind=kind, **params)
+
+    if kind == "students":
+        await bump_resource_versions(db, "users")
+    else:
+        if kind == "grades":
+            for period_id in period_ids:
+                await grade_average_repository.rebuild(db=db, period_id=period_id)
+        after_commit(db, diary_cache.clear)
+        if class_ids:
+            after_commit(db, invalidate_class_analytics, *class_ids)
+
+    rejected = sorted(reader.rejected + unresolved)[:settings.IMPORT_MAX_REPORTED_ERRORS]
+    rejected_count = reader.rejected_count + unresolved_count
+    return ImportReport(
+        kind=kind,
+        total_rows=reader.total,
+        imported=imported,
+        skipped=max(reader.total - rejected_count - imported, 0),
+        rejected_count=rejected_count,
+        rejected=[ImportRejectedRow(line=line, error=error) for line, error in rejected]
+    )
@@ -1,6 +1,7 @@
 from fastapi_mail import FastMail, MessageSchema, ConnectionConfig
 from pydantic import EmailStr
 from app.core.config import settings
+from app.core.metrics import MAIL_SENT
 
 
 class MailerService:
@@ -27,8 +28,10 @@ class MailerService:
             )
             fm = FastMail(self.conf)
             await fm.send_message(message)
+            MAIL_SENT.labels(outcome="sent").inc()
             return True
         except Exception as e:
+            MAIL_SENT.labels(outcome="failed").inc()
             return False
         
 
@@ -9,6 +9,7 @@ from minio import Minio
 from minio.error import S3Error
 
 from app.core.config import settings
+from app.core.metrics import observe_minio
 
 import re
 from transliterate import translit
@@ -32,6 +33,7 @@ class MinioService:
         self.external_endpoint = external_endpoint
         self.secure = settings.MINIO_REDIRECT_USE_HTTPS
     
+    @observe_minio("ensure_bucket_exists")
     async def ensure_bucket_exists(self, bucket_name: str, make_public: bool = False) -> None:
         """Проверяет существование бакета и создает его при необходимости"""
         try:
@@ -72,6 +74,7 @@ class MinioService:
         
         return filename
 
+    @observe_minio("upload_file")
     async def upload_file(
         self, 
         file: UploadFile, 
@@ -113,6 +116,7 @@ class MinioService:
                 detail=f"Ошибка при загрузке файла: {err}"
             )
     
+    @observe_minio("download_file")
     async def download_file(
         self, 
         bucket_name: str, 
@@ -137,6 +141,7 @@ class MinioService:
                 detail=f"Ошибка при скачивании файла: {err}"
             )
     
+    @observe_minio("delete_file")
     async def delete_file(self, bucket_name: str, object_name: str) -> bool:
         """Удаляет файл из MinIO"""
         try:
@@ -163,6 +168,7 @@ class MinioService:
                 detail=f"Ошибка при создании прямой ссылки: {str(err)}"
             )
     
+    @observe_minio("list_files")
     async def list_files(
         self, 
         bucket_name: str, 
@@ -194,6 +200,7 @@ class MinioService:
                 detail=f"Ошибка при получении списка файлов: {err}"
             )
     
+    @observe_minio("check_if_file_exists")
     async def check_if_file_exists(self, bucket_name: str, object_name: str) -> bool:
         """Проверяет существование файла в MinIO"""
         try:
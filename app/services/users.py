@@ -0,0 +1,33 @@
+from typing import Optional, Set, Tuple
+
+from app.db.models.user import Student
+from app.schemas.base import parse_fields
+from app.schemas.user.student import STUDENT_USER_FIELDS, STUDENT_INFO_FIELDS
+
+
+def parse_student_fields(fields: Optional[str]) -> Tuple[Optional[Set[str]], Optional[Set[str]]]:
+    """
+    fields=id,full_name,class_id -> (поля user_info, поля student_info).
+    id пользователя возвращается всегда; None - блок целиком.
+    """
+    requested = parse_fields(fields, STUDENT_USER_FIELDS + STUDENT_INFO_FIELDS)
+    if requested is None:
+        return None, None
+    return {"id"} | (requested & set(STUDENT_USER_FIELDS)), requested & set(STUDENT_INFO_FIELDS)
+
+
+def student_data(student: Student, user_fields: Optional[Set[str]] = None, student_fields: Optional[Set[str]] = None) -> dict:
+    """
+    Элемент списка учеников только с запрошенными полями. Связь user не
+    трогается, если кроме id из нее ничего не нужно (тогда она и не загружается).
+    """
+    user_fields = STUDENT_USER_FIELDS if user_fields is None else user_fields
+    student_fields = STUDENT_INFO_FIELDS if student_fields is None else student_fields
+    user_info = {"id": student.user_id}
+    for field in STUDENT_USER_FIELDS[1:]:
+        if field in user_fields:
+            user_info[field] = getattr(student.user, field)
+    return {
+        "user_info": user_info,
+        "student_info": {field: getattr(student, field) for field in STUDENT_INFO_FIELDS if field in student_fields}
+    }
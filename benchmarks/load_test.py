@@ -0,0 +1,192 @@
+"""
+Нагрузочный тест пользовательских сценариев по данным synthetic_school.
+
+Виртуальные пользователи входят в систему и по кругу выполняют сценарии
+учителя (классы, ученики, журнал урока) и ученика (дневник, задания),
+часть запросов - загрузка файла. Результат - пропускная способность и
+p50/p95/p99 по каждому эндпоинту.
+
+    python -m benchmarks.load_test --duration 30 --users 20            # приложение в процессе
+    python -m benchmarks.load_test --base-url http://localhost:8000    # по HTTP
+
+В режиме в процессе MinIO подменяется хранилищем в памяти.
+Параметр --output сохраняет результат в JSON для сравнения коммитов.
+"""
+import argparse
+import asyncio
+import io
+import json
+import random
+import time
+import uuid
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+import numpy as np
+
+from app.core.config import settings
+from benchmarks.synthetic_school import DEFAULT_MANIFEST
+
+API = settings.API_V1_STR
+
+
+class InMemoryMinioService:
+    """Замена MinioService для запуска в процессе: объекты хранятся в памяти"""
+
+    def __init__(self):
+        self.objects: Dict[str, bytes] = {}
+
+    @staticmethod
+    def _sanitize_filename(filename: str) -> str:
+        return filename.replace(" ", "_")
+
+    async def upload_file(self, file, bucket_name: str = settings.MINIO_PUBLIC_BUCKET, folder: str = "", metadata=None, make_public: bool = True) -> str:
+        file_name = f"{file.filename}-{uuid.uuid4()}"
+        object_name = f"{folder}/{file_name}" if folder else file_name
+        self.objects[object_name] = await file.read()
+        return object_name
+
+    async def get_direct_file_url(self, bucket_name: str, object_name: str) -> str:
+        return f"http://minio.local/{bucket_name}/{object_name}"
+
+    async def delete_file(self, bucket_name: str, object_name: str) -> bool:
+        self.objects.pop(object_name, None)
+        return True
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+
+    async def request(self, client: httpx.AsyncClient, name: str, method: str, url: str, **kwargs) -> Optional[dict]:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+            body = response.json()
+            ok = response.status_code < 400 and body.get("result", True) is not False
+        except Exception:
+            body, ok = None, False
+        self.latencies[name].append(time.perf_counter() - started)
+        if not ok:
+            self.errors[name] += 1
+        return body
+
+    def report(self, elapsed: float) -> Dict[str, dict]:
+        result = {}
+        for name, values in sorted(self.latencies.items()):
+            samples = np.array(values) * 1000
+            result[name] = {
+                "requests": len(values),
+                "errors": self.errors.get(name, 0),
+                "rps": round(len(values) / elapsed, 2),
+                "p50_ms": round(float(np.percentile(samples, 50)), 2),
+                "p95_ms": round(float(np.percentile(samples, 95)), 2),
+                "p99_ms": round(float(np.percentile(samples, 99)), 2),
+            }
+        return result
+
+
+async def login(client: httpx.AsyncClient, recorder: Recorder, username: str, password: str) -> Dict[str, str]:
+    body = await recorder.request(
+        client, "POST /auth/login", "POST", f"{API}/auth/login",
+        data={"username": username, "password": password}
+    )
+    if not body or "access_token" not in body:
+        raise RuntimeError(f"Login failed for {username}: {body}")
+    return {"Authorization": f"Bearer {body['access_token']}"}
+
+
+async def teacher_journey(client, recorder: Recorder, manifest: dict, teacher: dict, headers: dict) -> None:
+    rnd = random.Random()
+    class_id = rnd.choice(manifest["classes"])
+    await recorder.request(client, "GET /class/", "GET", f"{API}/class/", headers=headers)
+    await recorder.request(client, "GET /class/{class_id}/students", "GET", f"{API}/class/{class_id}/students", headers=headers)
+    await recorder.request(client, "GET /users/students", "GET", f"{API}/users/students", params={"limit": 100}, headers=headers)
+    if teacher["lessons"]:
+        lesson = rnd.choice(teacher["lessons"])
+        students = manifest["class_students"][lesson["class_id"]]
+        grades = [{"student_id": student_id, "score": rnd.randint(2, 5)} for student_id in rnd.sample(students, min(5, len(students)))]
+        await recorder.request(
+            client, "PUT /grades/schedule/{schedule_id}", "PUT", f"{API}/grades/schedule/{lesson['schedule_id']}",
+            json=grades, headers=headers
+        )
+    if rnd.random() < 0.1:
+        content = io.BytesIO(rnd.randbytes(64 * 1024))
+        await recorder.request(
+            client, "POST /files/", "POST", f"{API}/files/",
+            files={"file": ("lesson plan.pdf", content, "application/pdf")}, headers=headers
+        )
+
+
+async def student_journey(client, recorder: Recorder, manifest: dict, student: dict, headers: dict) -> None:
+    rnd = random.Random()
+    week_id = rnd.choice(manifest["weeks"])
+    await recorder.request(client, "GET /diary/{student_id}/week/{week_id}", "GET", f"{API}/diary/{student['user_id']}/week/{week_id}", headers=headers)
+    await recorder.request(client, "GET /homework/me", "GET", f"{API}/homework/me", headers=headers)
+    await recorder.request(client, "GET /grades/averages/{student_id}", "GET", f"{API}/grades/averages/{student['user_id']}", headers=headers)
+
+
+async def virtual_user(number: int, client, recorder: Recorder, manifest: dict, deadline: float) -> None:
+    is_teacher = number % 3 == 0
+    pool = manifest["teachers"] if is_teacher else manifest["students"]
+    user = pool[number % len(pool)]
+    headers = await login(client, recorder, user["username"], manifest["password"])
+    journey = teacher_journey if is_teacher else student_journey
+    while time.perf_counter() < deadline:
+        await journey(client, recorder, manifest, user, headers)
+
+
+def make_client(base_url: Optional[str]) -> httpx.AsyncClient:
+    if base_url:
+        return httpx.AsyncClient(base_url=base_url, timeout=60)
+
+    from app.main import app
+    from app.services.minio import get_minio_service
+
+    storage = InMemoryMinioService()
+    app.dependency_overrides[get_minio_service] = lambda: storage
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", timeout=60)
+
+
+async def run(args) -> Dict[str, dict]:
+    manifest = json.loads(args.manifest.read_text())
+    manifest["class_students"] = defaultdict(list)
+    for student in manifest["students"]:
+        manifest["class_students"][student["class_id"]].append(student["user_id"])
+    recorder = Recorder()
+    async with make_client(args.base_url) as client:
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(*(
+            virtual_user(number, client, recorder, manifest, deadline)
+            for number in range(args.users)
+        ))
+        elapsed = time.perf_counter() - started
+    return recorder.report(elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Нагрузочный тест пользовательских сценариев")
+    parser.add_argument("--base-url", default=None, help="адрес запущенного приложения; по умолчанию - в процессе")
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30)
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    parser.add_argument("--output", type=Path, default=None)
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(f"{'endpoint':<42}{'req':>7}{'err':>6}{'rps':>9}{'p50':>9}{'p95':>9}{'p99':>9}")
+    for name, stats in report.items():
+        print(
+            f"{name:<42}{stats['requests']:>7}{stats['errors']:>6}{stats['rps']:>9}"
+            f"{stats['p50_ms']:>9}{stats['p95_ms']:>9}{stats['p99_ms']:>9}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Микро-бенчмарки методов репозиториев на базе, заполненной synthetic_school.
+
+Каждый сценарий выполняется несколько раз в отдельной сессии: измеряется
+задержка (p50/p95) и число SQL-запросов. Пишущие сценарии работают внутри
+внешней транзакции, commit превращается в SAVEPOINT, а в конце все
+откатывается - база не меняется.
+
+    python -m benchmarks.repositories --update-baseline   # сохранить эталон
+    python -m benchmarks.repositories                     # сравнить с эталоном
+
+Эталон в репозитории (baseline_repositories.json) содержит только число
+запросов - оно не зависит от машины. --with-timings сохраняет и p50/p95,
+тогда сравниваются и задержки (для локального эталона на одной машине).
+
+Код возврата 1, если эталона нет, число запросов выросло или p50 превысил
+эталон больше чем на --tolerance (доля) и --slack-ms (абсолютный запас).
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.models.class_ import StudentClassHistoryReason
+from app.db.models.subject import Subject
+from app.db.nplusone import track_queries
+from app.db.repositories.class_.class_ import class_repository
+from app.db.repositories.class_.student_class_history import student_class_history_repository
+from app.db.repositories.schedule.grade_average import grade_average_repository
+from app.db.repositories.schedule.homework import homework_repository
+from app.db.repositories.schedule.schedule import schedule_repository
+from app.db.repositories.subject.teacher_subject import teacher_subject_repository
+from app.db.repositories.user.student import student_repository
+from app.db.repositories.user.teacher import teacher_repository
+from app.db.repositories.user.user import user_repository
+from app.db.session import engine
+from benchmarks.synthetic_school import DEFAULT_MANIFEST
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline_repositories.json")
+
+Scenario = Callable[[AsyncSession, Dict[str, Any]], Awaitable[Any]]
+
+
+@dataclass
+class Case:
+    name: str
+    run: Scenario
+
+
+def _student_order_cases() -> List[Case]:
+    cases = []
+    for order_by in ("created_at", "class_id", "id", "full_name"):
+        for direction in ("asc", "desc"):
+            cases.append(Case(
+                f"StudentRepository.get_students[order_by={order_by},{direction}]",
+                lambda db, ctx, order_by=order_by, direction=direction: student_repository.get_students(
+                    db=db, order_by=order_by, order_direction=direction
+                )
+            ))
+    return cases
+
+
+CASES: List[Case] = [
+    *_student_order_cases(),
+    Case("StudentRepository.get_students[teacher_id]", lambda db, ctx: student_repository.get_students(db=db, teacher_id=ctx["teacher_id"])),
+    Case("StudentRepository.get_students[class_id]", lambda db, ctx: student_repository.get_students(db=db, class_id=ctx["class_id"])),
+    Case("StudentRepository.get_students[search]", lambda db, ctx: student_repository.get_students(db=db, search="Иван")),
+    Case("StudentRepository.get_user_student", lambda db, ctx: student_repository.get_user_student(db=db, user_id=ctx["student_id"])),
+    Case("TeacherRepository.get_teachers", lambda db, ctx: teacher_repository.get_teachers(db=db)),
+    Case("TeacherRepository.get_teachers[full_name]", lambda db, ctx: teacher_repository.get_teachers(db=db, order_by="full_name")),
+    Case("UserRepository.get_users", lambda db, ctx: user_repository.get_users(db=db)),
+    Case("UserRepository.get_by_username", lambda db, ctx: user_repository.get_by_username(db=db, username=ctx["username"])),
+    Case("ClassRepository.get_classes", lambda db, ctx: class_repository.get_classes(db=db, year_id=None)),
+    Case("ClassRepository.get_classes[teacher]", lambda db, ctx: class_repository.get_classes(db=db, year_id=None, teacher=ctx["teacher"])),
+    Case("ClassRepository.get_with_relations", lambda db, ctx: class_repository.get_with_relations(db=db, id=ctx["class_id"])),
+    Case("TeacherSubjectRepository.get_teachers_by_subject", lambda db, ctx: teacher_subject_repository.get_teachers_by_subject(db=db, subject_id=ctx["subject_id"])),
+    Case("TeacherSubjectRepository.get_subjects_by_teacher", lambda db, ctx: teacher_subject_repository.get_subjects_by_teacher(db=db, teacher_id=ctx["teacher_id"])),
+    Case("ScheduleRepository.get_student_week", lambda db, ctx: schedule_repository.get_student_week(db=db, student_id=ctx["student_id"], week_id=ctx["week_id"])),
+    Case("HomeworkRepository.get_student_week_statuses", lambda db, ctx: homework_repository.get_student_week_statuses(db=db, student_id=ctx["student_id"], week_id=ctx["week_id"])),
+    Case("GradeAverageRepository.get_student_averages", lambda db, ctx: grade_average_repository.get_student_averages(db=db, student_id=ctx["student_id"], period_id=ctx["period_id"])),
+    Case(
+        "StudentClassHistoryRepository.write_assign",
+        lambda db, ctx: student_class_history_repository.write_assign(
+            db=db, student_id=ctx["student_id"], class_id=ctx["class_id"], reason=StudentClassHistoryReason.TRANSFER
+        )
+    ),
+]
+
+
+async def build_context(manifest: Dict[str, Any]) -> Dict[str, Any]:
+    teacher = next(item for item in manifest["teachers"] if item["lessons"])
+    student = manifest["students"][0]
+    context = {
+        "teacher_id": teacher["user_id"],
+        "student_id": student["user_id"],
+        "class_id": student["class_id"],
+        "week_id": manifest["weeks"][0],
+        "username": student["username"],
+    }
+    async with AsyncSession(engine) as db:
+        context["teacher"] = await teacher_repository.get_user_teacher(db=db, user_id=teacher["user_id"])
+        context["subject_id"] = await db.scalar(select(Subject.id).order_by(Subject.id.desc()).limit(1))
+        schedule = await schedule_repository.get(db=db, id=teacher["lessons"][0]["schedule_id"])
+        await db.refresh(schedule, ["week"])
+        context["period_id"] = schedule.week.period_id
+    return context
+
+
+async def measure(case: Case, context: Dict[str, Any], iterations: int, warmup: int) -> Dict[str, Any]:
+    durations, statements = [], []
+    for iteration in range(warmup + iterations):
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            db = AsyncSession(bind=conn, join_transaction_mode="create_savepoint", expire_on_commit=False)
+            with track_queries(case.name) as stats:
+                started = time.perf_counter()
+                await case.run(db, context)
+                elapsed = time.perf_counter() - started
+            await db.close()
+            await transaction.rollback()
+        if iteration >= warmup:
+            durations.append(elapsed * 1000)
+            statements.append(stats.db_count)
+    return {
+        "statements": max(statements),
+        "p50_ms": round(float(np.percentile(durations, 50)), 3),
+        "p95_ms": round(float(np.percentile(durations, 95)), 3),
+    }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float, slack_ms: float) -> List[str]:
+    regressions = []
+    for name, result in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        if result["statements"] > expected["statements"]:
+            regressions.append(f"{name}: statements {expected['statements']} -> {result['statements']}")
+        if "p50_ms" not in expected:
+            continue
+        limit = expected["p50_ms"] * (1 + tolerance) + slack_ms
+        if result["p50_ms"] > limit:
+            regressions.append(f"{name}: p50 {expected['p50_ms']}ms -> {result['p50_ms']}ms (limit {limit:.3f}ms)")
+    return regressions
+
+
+async def run(args) -> Dict[str, dict]:
+    manifest = json.loads(args.manifest.read_text())
+    context = await build_context(manifest)
+    results = {}
+    for case in CASES:
+        if args.filter and args.filter not in case.name:
+            continue
+        results[case.name] = await measure(case, context, args.iterations, args.warmup)
+        result = results[case.name]
+        print(f"{case.name:<72}{result['statements']:>4} stmt{result['p50_ms']:>10} ms{result['p95_ms']:>10} ms")
+    await engine.dispose()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Микро-бенчмарки репозиториев")
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--filter", default=None, help="подстрока имени сценария")
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--with-timings", action="store_true", help="сохранить в эталон и p50/p95")
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--slack-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+
+    if args.update_baseline:
+        baseline: Dict[str, dict] = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update({
+            name: result if args.with_timings else {"statements": result["statements"]}
+            for name, result in results.items()
+        })
+        args.baseline.write_text(json.dumps(baseline, ensure_ascii=False, indent=2, sort_keys=True))
+        print(f"Baseline saved to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print(f"Baseline {args.baseline} not found, run with --update-baseline first")
+        sys.exit(1)
+
+    regressions = compare(results, json.loads(args.baseline.read_text()), args.tolerance, args.slack_ms)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
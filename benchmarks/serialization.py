@@ -0,0 +1,102 @@
+"""
+Сравнение затрат CPU на сериализацию ответа списка учеников (100 записей,
+как GET /users/students) в стандартном маршруте FastAPI и в FastJSONRoute.
+
+    python -m benchmarks.serialization --requests 2000 --items 100
+
+Оба маршрута возвращают одинаковый success_response без обращения к базе,
+поэтому разница - это стоимость проверки response_model и сериализации.
+"""
+import argparse
+import asyncio
+import time
+from typing import Union
+
+import httpx
+from fastapi import APIRouter, FastAPI
+from fastapi.routing import APIRoute
+
+from app.api.routing import FastJSONRoute
+from app.schemas.base import BaseResponse, ErrorResponse, success_response
+from app.schemas.responses import StudentsListData
+from app.schemas.user.user import UserRole
+
+
+def students_payload(items: int) -> dict:
+    students = [
+        {
+            "user_info": {
+                "id": number,
+                "email": f"student{number}@example.com",
+                "username": f"student{number}",
+                "full_name": f"Иванов Иван Иванович {number}",
+                "is_active": True,
+                "role": UserRole.STUDENT
+            },
+            "student_info": {
+                "class_id": number % 30 + 1,
+                "parent_phone": "+79990000000",
+                "parent_email": f"parent{number}@example.com",
+                "parent_fio": "Иванова Мария Петровна"
+            }
+        }
+        for number in range(1, items + 1)
+    ]
+    return success_response(
+        data={"items": students, "pagination": {"skip": 0, "limit": items, "total": items}},
+        message="Students retrieved successfully"
+    )
+
+
+def build_app(items: int) -> FastAPI:
+    payload = students_payload(items)
+    app = FastAPI()
+    for prefix, route_class in (("/default", APIRoute), ("/fast", FastJSONRoute)):
+        router = APIRouter(route_class=route_class)
+
+        @router.get("/students", response_model=Union[BaseResponse[StudentsListData], ErrorResponse])
+        async def students():
+            return payload
+
+        app.include_router(router, prefix=prefix)
+    return app
+
+
+async def measure(client: httpx.AsyncClient, url: str, requests: int) -> dict:
+    for _ in range(min(requests, 50)):
+        await client.get(url)
+    cpu_started, wall_started = time.process_time(), time.perf_counter()
+    for _ in range(requests):
+        response = await client.get(url)
+    cpu = time.process_time() - cpu_started
+    wall = time.perf_counter() - wall_started
+    return {
+        "cpu_us": round(cpu / requests * 1e6, 1),
+        "wall_us": round(wall / requests * 1e6, 1),
+        "bytes": len(response.content)
+    }
+
+
+async def run(args) -> None:
+    app = build_app(args.items)
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+        default = await client.get("/default/students")
+        fast = await client.get("/fast/students")
+        assert default.json() == fast.json(), "Responses differ"
+        results = {name: await measure(client, f"/{name}/students", args.requests) for name in ("default", "fast")}
+    print(f"{'route':<10}{'cpu us/req':>12}{'wall us/req':>13}{'bytes':>9}")
+    for name, result in results.items():
+        print(f"{name:<10}{result['cpu_us']:>12}{result['wall_us']:>13}{result['bytes']:>9}")
+    print(f"CPU per request: {results['default']['cpu_us'] / results['fast']['cpu_us']:.2f}x less")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Затраты CPU на сериализацию ответа")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--items", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,368 @@
+"""
+Генератор синтетической школы для нагрузочных тестов и бенчмарков.
+
+Заполняет локальную базу реалистичными данными: учебный год с четвертями
+и неделями, предметы, учителя, классы с учениками, расписание на год,
+оценки и домашние задания. Строки пишутся через COPY (asyncpg), после
+загрузки пересобирается grade_averages и выставляются sequence.
+
+    python -m benchmarks.synthetic_school --classes 30 --students-per-class 25 --seed 42
+
+Учетные данные и идентификаторы для нагрузочного теста сохраняются
+в манифест (по умолчанию benchmarks/manifest.json).
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dt_time, timedelta
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy import text
+
+from app.core.security import get_password_hash
+from app.db.repositories.academic_cycles.partitions import year_partition_repository
+from app.db.repositories.schedule.grade_average import grade_average_repository
+from app.db.session import AsyncSessionLocal, engine
+
+PASSWORD = "bench-password"
+DEFAULT_MANIFEST = Path(__file__).with_name("manifest.json")
+
+SUBJECTS = [
+    ("Русский язык", 5), ("Литература", 3), ("Математика", 5), ("Информатика", 2),
+    ("История", 2), ("Обществознание", 1), ("География", 1), ("Биология", 2),
+    ("Физика", 2), ("Химия", 2), ("Английский язык", 3), ("Физкультура", 2),
+]
+LETTERS = "АБВГДЕ"
+LESSON_TIMES = [(8, 30), (9, 25), (10, 30), (11, 35), (12, 30), (13, 25), (14, 20)]
+FIRST_NAMES = ["Иван", "Мария", "Алексей", "Анна", "Дмитрий", "Елена", "Сергей", "Ольга", "Павел", "Дарья"]
+LAST_NAMES = ["Иванов", "Смирнов", "Кузнецов", "Попов", "Васильев", "Петров", "Соколов", "Михайлов", "Новиков", "Федоров"]
+
+# Таблицы в порядке загрузки (внешние ключи)
+TABLES = [
+    "academic_years", "academic_periods", "academic_weeks", "lesson_times", "subjects",
+    "users", "classes", "teachers", "teacher_subjects", "students", "student_class_history",
+    "schedule", "homework", "homework_statuses", "grades",
+]
+
+
+@dataclass
+class SchoolConfig:
+    classes: int = 30
+    students_per_class: int = 25
+    teachers: int = 60
+    lessons_per_day: int = 6
+    weeks_per_period: int = 8
+    periods: int = 4
+    grades_per_lesson: float = 0.2
+    homework_probability: float = 0.5
+    seed: int = 42
+    year_start: date = field(default_factory=lambda: date(date.today().year - (date.today().month < 9), 9, 1))
+
+
+class IdSequence:
+    def __init__(self, start: int):
+        self.value = start
+
+    def next(self) -> int:
+        self.value += 1
+        return self.value
+
+
+class SyntheticSchool:
+    """Детерминированно (по seed) строит строки всех таблиц школы"""
+
+    def __init__(self, config: SchoolConfig, start_ids: Dict[str, int]):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.ids = {table: IdSequence(start_ids.get(table, 0)) for table in TABLES}
+        self.rows: Dict[str, List[Tuple]] = {table: [] for table in TABLES}
+        self.manifest: Dict[str, Any] = {"password": PASSWORD, "teachers": [], "students": [], "classes": []}
+        self.password_hash = get_password_hash(PASSWORD)
+        self.now = datetime.now()
+        self.tag = f"s{config.seed}"
+
+    def build(self) -> Dict[str, List[Tuple]]:
+        self.year_id = self._calendar()
+        subject_ids = self._subjects()
+        teachers = self._teachers(subject_ids)
+        classes = self._classes(self.year_id, teachers)
+        self._schedule(classes, teachers, subject_ids)
+        return self.rows
+
+    def _add(self, table: str, row: Tuple) -> None:
+        self.rows[table].append(row)
+
+    def _full_name(self) -> str:
+        return f"{self.random.choice(LAST_NAMES)} {self.random.choice(FIRST_NAMES)}"
+
+    def _calendar(self) -> int:
+        config = self.config
+        year_id = self.ids["academic_years"].next()
+        total_weeks = config.periods * config.weeks_per_period
+        # Первая неделя начинается с понедельника не раньше 1 сентября
+        first_monday = config.year_start + timedelta(days=(7 - config.year_start.weekday()) % 7)
+        year_end = first_monday + timedelta(weeks=total_weeks + config.periods) - timedelta(days=1)
+        self._add("academic_years", (
+            year_id, f"{config.year_start.year}/{config.year_start.year + 1} ({self.tag})",
+            config.year_start, year_end, True, self.now
+        ))
+
+        self.weeks: List[Tuple[int, int, datetime]] = []
+        self.lesson_time_ids: Dict[Tuple[int, int], int] = {}
+        week_start = first_monday
+        today = date.today()
+        for order_num in range(1, config.periods + 1):
+            period_id = self.ids["academic_periods"].next()
+            period_start = week_start
+            period_end = period_start + timedelta(weeks=config.weeks_per_period) - timedelta(days=3)
+            self._add("academic_periods", (
+                period_id, year_id, f"{order_num} четверть", order_num, period_start, period_end,
+                period_start <= today <= period_end, self.now
+            ))
+            for lesson_num in range(1, config.lessons_per_day + 1):
+                hour, minute = LESSON_TIMES[lesson_num - 1]
+                lesson_time_id = self.ids["lesson_times"].next()
+                self.lesson_time_ids[(period_id, lesson_num)] = lesson_time_id
+                self._add("lesson_times", (
+                    lesson_time_id, period_id, lesson_num, dt_time(hour, minute),
+                    (datetime.combine(today, dt_time(hour, minute)) + timedelta(minutes=45)).time(), self.now
+                ))
+            for week_num in range(1, config.weeks_per_period + 1):
+                week_id = self.ids["academic_weeks"].next()
+                start = datetime.combine(week_start, dt_time.min)
+                self._add("academic_weeks", (
+                    week_id, period_id, week_num, f"Неделя {week_num}", start,
+                    start + timedelta(days=6, hours=23, minutes=59), self.now, False
+                ))
+                self.weeks.append((week_id, period_id, start))
+                week_start += timedelta(weeks=1)
+            # каникулы между четвертями
+            week_start += timedelta(weeks=1)
+        self.manifest["weeks"] = [week_id for week_id, _, _ in self.weeks]
+        return year_id
+
+    def _subjects(self) -> List[int]:
+        subject_ids = []
+        for name, _ in SUBJECTS:
+            subject_id = self.ids["subjects"].next()
+            subject_ids.append(subject_id)
+            self._add("subjects", (subject_id, name, None, self.now, True))
+        return subject_ids
+
+    def _user(self, role: str, prefix: str) -> int:
+        user_id = self.ids["users"].next()
+        username = f"bench_{self.tag}_{prefix}{user_id}"
+        self._add("users", (
+            user_id, f"{username}@bench.local", username, self.password_hash, role,
+            self._full_name(), True, self.now, self.now
+        ))
+        return user_id
+
+    def _teachers(self, subject_ids: List[int]) -> Dict[int, List[int]]:
+        """Учителя и их предметы: subject_id -> [teacher_id]"""
+        by_subject: Dict[int, List[int]] = {subject_id: [] for subject_id in subject_ids}
+        self.teacher_rows = []
+        for number in range(self.config.teachers):
+            teacher_id = self._user("TEACHER", "teacher")
+            subjects = [subject_ids[number % len(subject_ids)]]
+            if self.random.random() < 0.3:
+                subjects.append(self.random.choice(subject_ids))
+            for subject_id in set(subjects):
+                by_subject[subject_id].append(teacher_id)
+                self._add("teacher_subjects", (self.ids["teacher_subjects"].next(), teacher_id, subject_id))
+            self.teacher_rows.append(teacher_id)
+            self.manifest["teachers"].append({"user_id": teacher_id, "username": f"bench_{self.tag}_teacher{teacher_id}", "lessons": []})
+        return by_subject
+
+    def _classes(self, year_id: int, teachers: Dict[int, List[int]]) -> List[Dict[str, Any]]:
+        classes = []
+        head_teachers = {}
+        for number in range(self.config.classes):
+            class_id = self.ids["classes"].next()
+            grade_level = 1 + number // len(LETTERS) % 11
+            letter = LETTERS[number % len(LETTERS)]
+            self._add("classes", (class_id, f"{grade_level}{letter}", grade_level, letter, None, year_id, self.now))
+            if number < len(self.teacher_rows):
+                head_teachers[self.teacher_rows[number]] = class_id
+
+            students = []
+            for _ in range(self.config.students_per_class):
+                student_id = self._user("STUDENT", "student")
+                students.append(student_id)
+                self._add("students", (student_id, class_id, self.config.year_start.year, None, None, None))
+                self._add("student_class_history", (
+                    self.ids["student_class_history"].next(), student_id, class_id,
+                    datetime.combine(self.config.year_start, dt_time.min), None, "ADMISSION", True, self.now
+                ))
+                self.manifest["students"].append({"user_id": student_id, "username": f"bench_{self.tag}_student{student_id}", "class_id": class_id})
+
+            classes.append({"id": class_id, "students": students})
+            self.manifest["classes"].append(class_id)
+
+        for teacher_id in self.teacher_rows:
+            self._add("teachers", (teacher_id, head_teachers.get(teacher_id), None, self.random.randint(1, 30), None))
+        return classes
+
+    def _curriculum(self) -> List[int]:
+        """Недельная сетка предметов (индексы SUBJECTS) под число уроков в неделю"""
+        slots = 5 * self.config.lessons_per_day
+        grid = [index for index, (_, hours) in enumerate(SUBJECTS) for _ in range(hours)]
+        while len(grid) < slots:
+            grid.append(self.random.randrange(len(SUBJECTS)))
+        self.random.shuffle(grid)
+        return grid[:slots]
+
+    def _schedule(self, classes: List[Dict[str, Any]], teachers: Dict[int, List[int]], subject_ids: List[int]) -> None:
+        config = self.config
+        teacher_lessons = {item["user_id"]: item["lessons"] for item in self.manifest["teachers"]}
+        scores, score_weights = (2, 3, 4, 5), (5, 25, 40, 30)
+
+        for class_ in classes:
+            grid = self._curriculum()
+            class_teachers = {
+                subject_id: self.random.choice(teachers[subject_id] or self.teacher_rows)
+                for subject_id in subject_ids
+            }
+            for week_id, period_id, week_start in self.weeks:
+                for slot, subject_index in enumerate(grid):
+                    day_of_week = slot // config.lessons_per_day + 1
+                    lesson_num = slot % config.lessons_per_day + 1
+                    subject_id = subject_ids[subject_index]
+                    teacher_id = class_teachers[subject_id]
+                    schedule_id = self.ids["schedule"].next()
+                    lesson_at = week_start + timedelta(days=day_of_week - 1, hours=LESSON_TIMES[lesson_num - 1][0])
+                    self._add("schedule", (
+                        schedule_id, self.year_id, week_id, self.lesson_time_ids[(period_id, lesson_num)],
+                        class_["id"], teacher_id, subject_id, self.now, day_of_week, f"Каб. {100 + subject_index}",
+                        None, False, False, None
+                    ))
+                    if len(teacher_lessons[teacher_id]) < 20:
+                        teacher_lessons[teacher_id].append({"schedule_id": schedule_id, "class_id": class_["id"]})
+
+                    if lesson_at > self.now:
+                        continue
+
+                    for student_id in class_["students"]:
+                        if self.random.random() < config.grades_per_lesson:
+                            self._add("grades", (
+                                self.ids["grades"].next(), self.year_id, schedule_id, student_id, subject_id,
+                                teacher_id, None, None, self.random.choices(scores, score_weights)[0], 1, lesson_at, lesson_at
+                            ))
+
+                    if self.random.random() < config.homework_probability:
+                        homework_id = self.ids["homework"].next()
+                        due_date = lesson_at + timedelta(days=7)
+                        self._add("homework", (
+                            homework_id, schedule_id, class_["id"], teacher_id, subject_id,
+                            f"Задание по теме урока {lesson_num}", lesson_at, due_date, lesson_at, None
+                        ))
+                        for student_id in class_["students"]:
+                            is_done = due_date < self.now and self.random.random() < 0.8
+                            self._add("homework_statuses", (
+                                homework_id, student_id, due_date, is_done, due_date if is_done else None
+                            ))
+
+
+COLUMNS: Dict[str, Sequence[str]] = {
+    "academic_years": ("id", "name", "start_date", "end_date", "is_current", "created_at"),
+    "academic_periods": ("id", "year_id", "name", "order_num", "start_date", "end_date", "is_current", "created_at"),
+    "academic_weeks": ("id", "period_id", "week_num", "name", "start_date", "end_date", "created_at", "is_holiday"),
+    "lesson_times": ("id", "period_id", "lesson_num", "start_time", "end_time", "created_at"),
+    "subjects": ("id", "name", "description", "created_at", "is_active"),
+    "users": ("id", "email", "username", "hashed_password", "role", "full_name", "is_active", "created_at", "updated_at"),
+    "classes": ("id", "name", "grade_level", "letter", "specialization", "year_id", "created_at"),
+    "teachers": ("user_id", "class_id", "degree", "experience", "bio"),
+    "teacher_subjects": ("id", "teacher_id", "subject_id"),
+    "students": ("user_id", "class_id", "admission_year", "parent_phone", "parent_email", "parent_fio"),
+    "student_class_history": ("id", "student_id", "class_id", "start_date", "end_date", "reason", "is_active", "created_at"),
+    "schedule": ("id", "year_id", "week_id", "lesson_time_id", "class_id", "teacher_id", "subject_id",
+                 "created_at", "day_of_week", "location", "description", "is_replacement", "is_cancelled", "original_teacher_id"),
+    "homework": ("id", "schedule_id", "class_id", "teacher_id", "subject_id", "description",
+                 "assignment_at", "due_date", "created_at", "file_id"),
+    "homework_statuses": ("homework_id", "student_id", "due_date", "is_done", "done_at"),
+    "grades": ("id", "year_id", "schedule_id", "student_id", "subject_id", "teacher_id", "homework_id",
+               "comment", "score", "weight", "created_at", "updated_at"),
+}
+# Таблицы без собственного serial id
+NO_SEQUENCE = {"teachers", "students", "homework_statuses"}
+
+
+async def _start_ids(conn) -> Dict[str, int]:
+    ids = {}
+    for table in TABLES:
+        if table in NO_SEQUENCE:
+            continue
+        ids[table] = (await conn.execute(text(f"SELECT coalesce(max(id), 0) FROM {table}"))).scalar()
+    return ids
+
+
+async def _copy(conn, rows: Dict[str, List[Tuple]]) -> Dict[str, int]:
+    raw = await conn.get_raw_connection()
+    driver = raw.driver_connection
+    counts = {}
+    for table in TABLES:
+        if rows[table]:
+            await driver.copy_records_to_table(table, records=rows[table], columns=list(COLUMNS[table]))
+        counts[table] = len(rows[table])
+    return counts
+
+
+async def generate(config: SchoolConfig, manifest_path: Path) -> Dict[str, int]:
+    started = time.perf_counter()
+    async with engine.begin() as conn:
+        start_ids = await _start_ids(conn)
+        school = SyntheticSchool(config, start_ids)
+        rows = school.build()
+
+        await conn.execute(text("UPDATE academic_years SET is_current = false"))
+        await year_partition_repository.create(db=conn, year_id=school.year_id)
+        await conn.execute(text("ALTER TABLE grades DISABLE TRIGGER USER"))
+        counts = await _copy(conn, rows)
+        await conn.execute(text("ALTER TABLE grades ENABLE TRIGGER USER"))
+
+        for table in TABLES:
+            if table not in NO_SEQUENCE:
+                await conn.execute(text(
+                    f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT coalesce(max(id), 1) FROM {table}))"
+                ))
+
+    async with AsyncSessionLocal() as db:
+        await grade_average_repository.rebuild(db)
+        await db.commit()
+    async with engine.begin() as conn:
+        for table in TABLES + ["grade_averages"]:
+            await conn.execute(text(f"ANALYZE {table}"))
+
+    manifest_path.write_text(json.dumps(school.manifest, ensure_ascii=False, indent=2))
+    counts["seconds"] = round(time.perf_counter() - started, 2)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Заполнение базы синтетической школой")
+    parser.add_argument("--classes", type=int, default=30)
+    parser.add_argument("--students-per-class", type=int, default=25)
+    parser.add_argument("--teachers", type=int, default=60)
+    parser.add_argument("--weeks-per-period", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--manifest", type=Path, default=DEFAULT_MANIFEST)
+    args = parser.parse_args()
+
+    config = SchoolConfig(
+        classes=args.classes,
+        students_per_class=args.students_per_class,
+        teachers=args.teachers,
+        weeks_per_period=args.weeks_per_period,
+        seed=args.seed,
+    )
+    counts = asyncio.run(generate(config, args.manifest))
+    for table, count in counts.items():
+        print(f"{table:>24}: {count}")
+
+
+if __name__ == "__main__":
+    main()
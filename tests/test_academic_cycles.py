@@ -0,0 +1,83 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.services.academic_cycles import build_periods_and_weeks, parse_holidays
+
+HOLIDAYS = "10-27:11-04,12-29:01-11,03-23:03-31"
+
+
+def holiday_weeks(plan):
+    return [week["start_date"].date() for _, weeks in plan for week in weeks if week["is_holiday"]]
+
+
+def test_parse_holidays():
+    assert parse_holidays(" 10-27:11-04, 12-29:01-11 ,") == [((10, 27), (11, 4)), ((12, 29), (1, 11))]
+    assert parse_holidays("") == []
+
+
+@pytest.mark.parametrize("value", ["10-27-11-04", "10-27:11", "a-b:c-d", "10-27:11-04:12-01", "13-01:01-05", "02-30:03-01"])
+def test_parse_holidays_rejects_invalid_ranges(value):
+    with pytest.raises(ValueError):
+        parse_holidays(value)
+
+
+def test_quarters_split_by_holidays():
+    plan = build_periods_and_weeks(date(2025, 9, 1), date(2026, 5, 31), parse_holidays(HOLIDAYS))
+    periods = [period for period, _ in plan]
+    assert [period["name"] for period in periods] == ["1 четверть", "2 четверть", "3 четверть", "4 четверть"]
+    assert [(period["start_date"], period["end_date"]) for period in periods] == [
+        (date(2025, 9, 1), date(2025, 11, 2)),
+        (date(2025, 11, 3), date(2026, 1, 11)),
+        (date(2026, 1, 12), date(2026, 3, 29)),
+        (date(2026, 3, 30), date(2026, 5, 31)),
+    ]
+    # Новогодние каникулы переходят через 31 декабря
+    assert date(2026, 1, 5) in holiday_weeks(plan)
+
+
+def test_weeks_are_continuous_and_numbered_per_period():
+    plan = build_periods_and_weeks(date(2025, 9, 1), date(2026, 5, 31), parse_holidays(HOLIDAYS))
+    weeks = [week for _, period_weeks in plan for week in period_weeks]
+    for previous, week in zip(weeks, weeks[1:]):
+        assert week["start_date"] - previous["start_date"] == timedelta(weeks=1)
+    for _, period_weeks in plan:
+        assert [week["week_num"] for week in period_weeks] == list(range(1, len(period_weeks) + 1))
+        assert all(week["name"] == f"Неделя {week['week_num']}" for week in period_weeks)
+    assert weeks[0]["end_date"] == datetime(2025, 9, 7, 23, 59)
+
+
+def test_weeks_straddling_year_bounds():
+    # 1 сентября - вторник, 31 мая - понедельник
+    plan = build_periods_and_weeks(date(2026, 9, 1), date(2027, 5, 31), parse_holidays(HOLIDAYS))
+    first_period, first_weeks = plan[0]
+    last_weeks = plan[-1][1]
+    assert first_weeks[0]["start_date"] == datetime(2026, 8, 31)
+    assert first_period["start_date"] == date(2026, 9, 1)
+    assert last_weeks[-1]["start_date"] == datetime(2027, 5, 31)
+    assert plan[-1][0]["end_date"] == date(2027, 5, 31)
+
+
+def test_leading_week_without_workdays_is_holiday_of_first_period():
+    # 1 сентября 2024 - воскресенье: будних дней года в первой неделе нет
+    plan = build_periods_and_weeks(date(2024, 9, 1), date(2025, 5, 31), [])
+    assert len(plan) == 1
+    period, weeks = plan[0]
+    assert period["name"] == "1 период"
+    assert weeks[0]["is_holiday"] and not weeks[1]["is_holiday"]
+
+
+def test_week_is_holiday_when_most_workdays_are_holidays():
+    # 27 октября 2026 - вторник: каникулы занимают 4 из 5 будних дней недели
+    plan = build_periods_and_weeks(date(2026, 9, 1), date(2027, 5, 31), parse_holidays("10-27:11-01"))
+    assert holiday_weeks(plan) == [date(2026, 10, 26)]
+    assert [period["name"] for period, _ in plan] == ["1 полугодие", "2 полугодие"]
+
+
+def test_february_29_holiday():
+    holidays = parse_holidays("02-29:03-06")
+    leap = build_periods_and_weeks(date(2027, 9, 1), date(2028, 5, 31), holidays)
+    assert holiday_weeks(leap) == [date(2028, 2, 28)]
+    # В невисокосный год начало каникул - 28 февраля
+    regular = build_periods_and_weeks(date(2026, 9, 1), date(2027, 5, 31), holidays)
+    assert holiday_weeks(regular) == [date(2027, 3, 1)]
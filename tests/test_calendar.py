@@ -0,0 +1,45 @@
+from datetime import date
+
+from app.services.calendar import Calendar, CalendarPeriod, CalendarYear
+
+
+def make_calendar(flagged_period_ids=()):
+    years = [
+        CalendarYear(id=1, name="2024", start_date=date(2024, 9, 1), end_date=date(2025, 5, 31), is_current=False),
+        CalendarYear(id=2, name="2025", start_date=date(2025, 9, 1), end_date=date(2026, 5, 31), is_current=True),
+    ]
+    bounds = {
+        1: (1, 1, date(2024, 9, 1), date(2024, 12, 31)),
+        2: (1, 2, date(2025, 1, 1), date(2025, 5, 31)),
+        3: (2, 1, date(2025, 9, 1), date(2025, 12, 28)),
+        4: (2, 2, date(2026, 1, 12), date(2026, 5, 31)),
+    }
+    periods = [
+        CalendarPeriod(
+            id=period_id, year_id=year_id, name=f"{order_num} полугодие", order_num=order_num,
+            start_date=start, end_date=end, is_current=period_id in flagged_period_ids
+        )
+        for period_id, (year_id, order_num, start, end) in bounds.items()
+    ]
+    return Calendar(version=1, years=years, periods=periods, weeks=[], lesson_times=[])
+
+
+def test_current_period_by_date_wins_over_flag():
+    calendar = make_calendar(flagged_period_ids={3})
+    assert calendar.current_period(date(2026, 2, 1)).id == 4
+
+
+def test_flag_of_previous_year_is_ignored():
+    calendar = make_calendar(flagged_period_ids={1})
+    assert calendar.current_period(date(2025, 10, 1)).id == 3
+    assert calendar.current_period(date(2026, 1, 5)) is None
+
+
+def test_flag_inside_current_year_covers_gaps():
+    calendar = make_calendar(flagged_period_ids={1, 4})
+    assert calendar.current_period(date(2026, 1, 5)).id == 4
+
+
+def test_period_outside_current_year_is_not_current():
+    calendar = make_calendar()
+    assert calendar.current_period(date(2025, 3, 1)) is None
@@ -0,0 +1,47 @@
+import pytest
+from sqlalchemy import select
+
+from app.core.config import settings
+from app.db.models.class_ import Class
+from app.db.models.subject import TeacherSubject
+from tests.conftest import unavailable
+
+pytestmark = pytest.mark.anyio
+
+API = settings.API_V1_STR
+
+
+def assert_no_nplusone(response):
+    assert response.status_code != 500, response.text
+
+
+@pytest.fixture
+async def class_(db):
+    class_ = await db.scalar(select(Class).order_by(Class.id).limit(1))
+    if class_ is None:
+        unavailable("No classes in the database")
+    return class_
+
+
+async def test_get_classes(client, nplusone_raise, class_):
+    assert_no_nplusone(await client.get(f"{API}/class/", params={"year": 0}))
+
+
+async def test_get_class_with_students(client, nplusone_raise, class_):
+    assert_no_nplusone(await client.get(f"{API}/class/{class_.id}"))
+
+
+async def test_update_class(client, nplusone_raise, class_):
+    response = await client.put(f"{API}/class/{class_.id}", json={
+        "grade_level": class_.grade_level,
+        "specialization": class_.specialization or "",
+        "letter": class_.letter
+    })
+    assert_no_nplusone(response)
+
+
+async def test_get_subject_teachers(client, nplusone_raise, db):
+    subject_id = await db.scalar(select(TeacherSubject.subject_id).limit(1))
+    if subject_id is None:
+        unavailable("No subject teachers in the database")
+    assert_no_nplusone(await client.get(f"{API}/subjects/{subject_id}/teachers"))